@@ -4,9 +4,13 @@ Abstract base class for all research agents
 """
 
 import asyncio
+import heapq
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Optional, Dict, Any, Iterable, List
 from datetime import datetime
+import httpx
 from loguru import logger
 
 from core.models import (
@@ -20,6 +24,24 @@ from core.gemini_engine import get_gemini_engine
 from config import AGENT_CONFIG
 
 
+@lru_cache(maxsize=None)
+def get_http_client() -> httpx.AsyncClient:
+    """Shared keep-alive HTTP/2 client for agents' outbound API calls"""
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        timeout=30.0,
+    )
+
+
+def top_k_by_relevance(items: Iterable[Any], k: int, key: str = "relevance_score") -> List[Any]:
+    """Pick the k most relevant items (dicts or models) with a partial sort"""
+    def score(item: Any) -> float:
+        value = item.get(key) if isinstance(item, Mapping) else getattr(item, key, None)
+        return value or 0.0
+    return heapq.nlargest(k, items, key=score)
+
+
 class BaseAgent(ABC):
     """
     Abstract base class for all NEXUS-R&D research agents
@@ -43,6 +65,7 @@ class BaseAgent(ABC):
         self.state_manager = get_state_manager()
         self.memory = get_recursive_memory()
         self.gemini = get_gemini_engine()
+        self.http = get_http_client()
         
         # Agent state
         self.current_session_id: Optional[str] = None
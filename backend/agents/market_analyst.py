@@ -4,9 +4,10 @@ Market intelligence and commercial viability assessment
 """
 
 import asyncio
+import json
 from typing import Dict, Any, List, Optional
 from datetime import datetime
-import httpx
+from dateutil import parser as date_parser
 from loguru import logger
 
 from agents.base_agent import BaseAgent
@@ -99,33 +100,32 @@ class MarketAnalystAgent(BaseAgent):
         """Search NewsAPI for market news"""
         articles = []
         
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    "https://newsapi.org/v2/everything",
-                    params={
-                        "q": f"{query.query} market funding investment",
-                        "language": "en",
-                        "sortBy": "relevancy",
-                        "pageSize": 20,
-                        "apiKey": self.settings.news_api_key,
-                    },
-                    timeout=30.0,
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    for article in data.get("articles", []):
-                        articles.append({
-                            "title": article.get("title"),
-                            "description": article.get("description"),
-                            "source": article.get("source", {}).get("name"),
-                            "url": article.get("url"),
-                            "published_at": article.get("publishedAt"),
-                        })
-                        
-            except Exception as e:
-                self.log(f"NewsAPI error: {e}", "warning")
+        try:
+            response = await self.http.get(
+                "https://newsapi.org/v2/everything",
+                params={
+                    "q": f"{query.query} market funding investment",
+                    "language": "en",
+                    "sortBy": "relevancy",
+                    "pageSize": 20,
+                    "apiKey": self.settings.news_api_key,
+                },
+                timeout=30.0,
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                for article in data.get("articles", []):
+                    articles.append({
+                        "title": article.get("title"),
+                        "description": article.get("description"),
+                        "source": article.get("source", {}).get("name"),
+                        "url": article.get("url"),
+                        "published_at": article.get("publishedAt"),
+                    })
+                    
+        except Exception as e:
+            self.log(f"NewsAPI error: {e}", "warning")
         
         return articles
     
@@ -133,31 +133,30 @@ class MarketAnalystAgent(BaseAgent):
         """Search Google News via Serper"""
         articles = []
         
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    "https://google.serper.dev/news",
-                    json={
-                        "q": f"{query.query} market investment startup",
-                        "num": 15,
-                    },
-                    headers={"X-API-KEY": self.settings.serper_api_key},
-                    timeout=30.0,
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    for news in data.get("news", []):
-                        articles.append({
-                            "title": news.get("title"),
-                            "description": news.get("snippet"),
-                            "source": news.get("source"),
-                            "url": news.get("link"),
-                            "published_at": news.get("date"),
-                        })
-                        
-            except Exception as e:
-                self.log(f"Serper news error: {e}", "warning")
+        try:
+            response = await self.http.post(
+                "https://google.serper.dev/news",
+                json={
+                    "q": f"{query.query} market investment startup",
+                    "num": 15,
+                },
+                headers={"X-API-KEY": self.settings.serper_api_key},
+                timeout=30.0,
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                for news in data.get("news", []):
+                    articles.append({
+                        "title": news.get("title"),
+                        "description": news.get("snippet"),
+                        "source": news.get("source"),
+                        "url": news.get("link"),
+                        "published_at": news.get("date"),
+                    })
+                    
+        except Exception as e:
+            self.log(f"Serper news error: {e}", "warning")
         
         return articles
     
@@ -183,7 +182,6 @@ Return as JSON array."""
         response = await self.gemini.generate(prompt, task_type="market_analysis", temperature=0.7)
         
         try:
-            import json
             if "```json" in response:
                 start = response.find("```json") + 7
                 end = response.find("```", start)
@@ -220,7 +218,6 @@ Return as JSON array."""
         
         startups = []
         try:
-            import json
             if "```json" in response:
                 start = response.find("```json") + 7
                 end = response.find("```", start)
@@ -316,7 +313,6 @@ Return as JSON array."""
         
         ma_list = []
         try:
-            import json
             if "```json" in response:
                 start = response.find("```json") + 7
                 end = response.find("```", start)
@@ -351,8 +347,7 @@ Return as JSON array."""
         if not date_str:
             return None
         try:
-            from dateutil import parser
-            return parser.parse(date_str)
+            return date_parser.parse(date_str)
         except:
             return None
     
@@ -372,7 +367,6 @@ Return as a JSON array of strings, each describing a regulatory factor."""
         response = await self.gemini.generate(prompt, task_type="market_analysis", temperature=0.4)
         
         try:
-            import json
             if "```json" in response:
                 start = response.find("```json") + 7
                 end = response.find("```", start)
@@ -466,7 +460,6 @@ Return as JSON array."""
         
         segments = []
         try:
-            import json
             if "```json" in response:
                 start = response.find("```json") + 7
                 end = response.find("```", start)
@@ -4,12 +4,14 @@ Deep patent landscape analysis across global databases
 """
 
 import asyncio
+import json
+import re
 from typing import Dict, Any, List, Optional
 from datetime import datetime
-import httpx
+from dateutil import parser as date_parser
 from loguru import logger
 
-from agents.base_agent import BaseAgent
+from agents.base_agent import BaseAgent, top_k_by_relevance
 from core.models import (
     ResearchQuery,
     Patent,
@@ -106,81 +108,75 @@ class PatentScoutAgent(BaseAgent):
         """
         patents = []
         
-        async with httpx.AsyncClient() as client:
-            try:
-                # Build query for PatentsView API
-                search_terms = query.query.replace('"', '').strip()
-                
-                # PatentsView query format
-                api_query = {
-                    "_or": [
-                        {"_text_any": {"patent_title": search_terms}},
-                        {"_text_any": {"patent_abstract": search_terms}}
-                    ]
-                }
-                
-                # Fields to retrieve
-                fields = [
-                    "patent_number",
-                    "patent_title", 
-                    "patent_abstract",
-                    "patent_date",
-                    "patent_type",
-                    "patent_num_claims"
+        try:
+            # Build query for PatentsView API
+            search_terms = query.query.replace('"', '').strip()
+            
+            # PatentsView query format
+            api_query = {
+                "_or": [
+                    {"_text_any": {"patent_title": search_terms}},
+                    {"_text_any": {"patent_abstract": search_terms}}
                 ]
+            }
+            
+            # Fields to retrieve
+            fields = [
+                "patent_number",
+                "patent_title", 
+                "patent_abstract",
+                "patent_date",
+                "patent_type",
+                "patent_num_claims"
+            ]
+            
+            response = await self.http.get(
+                "https://api.patentsview.org/patents/query",
+                params={
+                    "q": json.dumps(api_query),
+                    "f": json.dumps(fields),
+                    "o": json.dumps({"page": 1, "per_page": 50})
+                },
+                timeout=30.0,
+                headers={"Accept": "application/json"}
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                patent_list = data.get("patents", [])
                 
-                import json
+                for p in patent_list:
+                    if p:
+                        patents.append({
+                            "patent_id": f"US{p.get('patent_number', '')}",
+                            "title": p.get("patent_title", ""),
+                            "abstract": p.get("patent_abstract", ""),
+                            "filing_date": p.get("patent_date"),
+                            "source": "uspto_patentsview",
+                            "url": f"https://patents.google.com/patent/US{p.get('patent_number', '')}",
+                            "classification_codes": [],
+                            "citation_count": p.get("patent_num_claims", 0),
+                        })
                 
-                response = await client.get(
-                    "https://api.patentsview.org/patents/query",
-                    params={
-                        "q": json.dumps(api_query),
-                        "f": json.dumps(fields),
-                        "o": json.dumps({"page": 1, "per_page": 50})
-                    },
-                    timeout=30.0,
-                    headers={"Accept": "application/json"}
-                )
+                self.log(f"USPTO API returned {len(patents)} patents")
+            else:
+                self.log(f"USPTO API error: {response.status_code}", "warning")
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    patent_list = data.get("patents", [])
-                    
-                    for p in patent_list:
-                        if p:
-                            patents.append({
-                                "patent_id": f"US{p.get('patent_number', '')}",
-                                "title": p.get("patent_title", ""),
-                                "abstract": p.get("patent_abstract", ""),
-                                "filing_date": p.get("patent_date"),
-                                "source": "uspto_patentsview",
-                                "url": f"https://patents.google.com/patent/US{p.get('patent_number', '')}",
-                                "classification_codes": [],
-                                "citation_count": p.get("patent_num_claims", 0),
-                            })
-                    
-                    self.log(f"USPTO API returned {len(patents)} patents")
-                else:
-                    self.log(f"USPTO API error: {response.status_code}", "warning")
-                    
-                # Also get assignee data if we have patents
-                if patents:
-                    await self._enrich_with_assignees(client, patents[:20])
-                    
-            except Exception as e:
-                self.log(f"USPTO PatentsView error: {e}", "error")
+            # Also get assignee data if we have patents
+            if patents:
+                await self._enrich_with_assignees(patents[:20])
+                
+        except Exception as e:
+            self.log(f"USPTO PatentsView error: {e}", "error")
         
         return patents
     
     async def _enrich_with_assignees(
         self, 
-        client: httpx.AsyncClient, 
         patents: List[Dict[str, Any]]
     ) -> None:
         """Enrich patents with assignee data from USPTO"""
         try:
-            import json
-            
             patent_numbers = [p["patent_id"].replace("US", "") for p in patents[:10]]
             
             if not patent_numbers:
@@ -195,7 +191,7 @@ class PatentScoutAgent(BaseAgent):
                 "inventors.inventor_last_name"
             ]
             
-            response = await client.get(
+            response = await self.http.get(
                 "https://api.patentsview.org/patents/query",
                 params={
                     "q": json.dumps(query),
@@ -258,48 +254,47 @@ class PatentScoutAgent(BaseAgent):
         """Search patents via Serper API (Google Search)"""
         patents = []
         
-        async with httpx.AsyncClient() as client:
-            try:
-                # Search Google Patents
-                response = await client.post(
-                    "https://google.serper.dev/search",
-                    json={
-                        "q": f"site:patents.google.com {search_query}",
-                        "num": 30,
-                    },
-                    headers={"X-API-KEY": self.settings.serper_api_key},
-                    timeout=30.0,
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    organic = data.get("organic", [])
-                    
-                    for result in organic:
-                        patent = self._parse_serper_result(result)
-                        if patent:
-                            patents.append(patent)
-                
-                # Also search for research papers mentioning patents
-                response2 = await client.post(
-                    "https://google.serper.dev/search",
-                    json={
-                        "q": f"{search_query} patent filing innovation",
-                        "num": 20,
-                    },
-                    headers={"X-API-KEY": self.settings.serper_api_key},
-                    timeout=30.0,
-                )
+        try:
+            # Search Google Patents
+            response = await self.http.post(
+                "https://google.serper.dev/search",
+                json={
+                    "q": f"site:patents.google.com {search_query}",
+                    "num": 30,
+                },
+                headers={"X-API-KEY": self.settings.serper_api_key},
+                timeout=30.0,
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                organic = data.get("organic", [])
                 
-                if response2.status_code == 200:
-                    data2 = response2.json()
-                    for result in data2.get("organic", []):
-                        patent = self._parse_serper_result(result)
-                        if patent:
-                            patents.append(patent)
-                            
-            except Exception as e:
-                self.log(f"Serper API error: {e}", "error")
+                for result in organic:
+                    patent = self._parse_serper_result(result)
+                    if patent:
+                        patents.append(patent)
+            
+            # Also search for research papers mentioning patents
+            response2 = await self.http.post(
+                "https://google.serper.dev/search",
+                json={
+                    "q": f"{search_query} patent filing innovation",
+                    "num": 20,
+                },
+                headers={"X-API-KEY": self.settings.serper_api_key},
+                timeout=30.0,
+            )
+            
+            if response2.status_code == 200:
+                data2 = response2.json()
+                for result in data2.get("organic", []):
+                    patent = self._parse_serper_result(result)
+                    if patent:
+                        patents.append(patent)
+                        
+        except Exception as e:
+            self.log(f"Serper API error: {e}", "error")
         
         return patents
     
@@ -322,8 +317,6 @@ class PatentScoutAgent(BaseAgent):
     
     def _extract_patent_number(self, url: str, title: str) -> Optional[str]:
         """Extract patent number from URL or title"""
-        import re
-        
         # Try to find US patent number
         patterns = [
             r'US\d{7,}[A-Z]\d*',  # US patent format
@@ -360,7 +353,6 @@ Return as a JSON array."""
         response = await self.gemini.generate(prompt, task_type="patent_analysis", temperature=0.7)
         
         try:
-            import json
             if "```json" in response:
                 start = response.find("```json") + 7
                 end = response.find("```", start)
@@ -443,8 +435,7 @@ Return as a JSON array."""
         if not date_str:
             return None
         try:
-            from dateutil import parser
-            return parser.parse(date_str)
+            return date_parser.parse(date_str)
         except:
             return None
     
@@ -536,7 +527,6 @@ Return as JSON array of clusters."""
         response = await self.gemini.generate(prompt, task_type="patent_analysis", temperature=0.3)
         
         try:
-            import json
             if "```json" in response:
                 start = response.find("```json") + 7
                 end = response.find("```", start)
@@ -634,13 +624,13 @@ Return as JSON array of clusters."""
         """Enhance landscape analysis with AI insights"""
         # Use Gemini to identify whitespace opportunities
         analysis = await self.gemini.analyze_patents(
-            patents_data=[p for p in landscape.get("patents", [])[:20]],
+            patents_data=top_k_by_relevance(landscape.get("patents", []), 20),
             query=query.query,
         )
         
         # Extract whitespace indicators
         whitespace_indicators = analysis.get("whitespace_areas", [])
-        if isinstance(whitespace_indicators, list):
+        if isinstance(whitespace_indicators, (list, tuple)):
             landscape["whitespace_indicators"] = whitespace_indicators
             
             # Store as hints for later synthesis
@@ -4,7 +4,7 @@ Final intelligence synthesis and report generation
 """
 
 import asyncio
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Mapping, Optional
 from datetime import datetime
 from loguru import logger
 
@@ -132,21 +132,21 @@ class SynthesizerAgent(BaseAgent):
         whitespace_opportunities = []
         
         for ws in whitespace_data:
-            if not isinstance(ws, dict):
+            if not isinstance(ws, Mapping):
                 continue
             
             # Ensure supporting_evidence is a list
             evidence = ws.get("supporting_evidence", [])
             if isinstance(evidence, str):
                 evidence = [evidence] if evidence else []
-            elif not isinstance(evidence, list):
+            elif not isinstance(evidence, (list, tuple)):
                 evidence = []
             
             # Ensure recommended_actions is a list
             actions = ws.get("recommended_actions", [])
             if isinstance(actions, str):
                 actions = [actions] if actions else []
-            elif not isinstance(actions, list):
+            elif not isinstance(actions, (list, tuple)):
                 actions = []
             
             # Normalize confidence score
@@ -532,39 +532,36 @@ class SynthesizerAgent(BaseAgent):
             script = script.replace("[PAUSE]", "...")
             
             # Call ElevenLabs API
-            import httpx
-            
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"https://api.elevenlabs.io/v1/text-to-speech/{self.settings.elevenlabs_voice_id}",
-                    json={
-                        "text": script[:5000],  # Limit length
-                        "model_id": "eleven_multilingual_v2",
-                        "voice_settings": {
-                            "stability": 0.5,
-                            "similarity_boost": 0.75,
-                        },
-                    },
-                    headers={
-                        "xi-api-key": self.settings.elevenlabs_api_key,
-                        "Content-Type": "application/json",
+            response = await self.http.post(
+                f"https://api.elevenlabs.io/v1/text-to-speech/{self.settings.elevenlabs_voice_id}",
+                json={
+                    "text": script[:5000],  # Limit length
+                    "model_id": "eleven_multilingual_v2",
+                    "voice_settings": {
+                        "stability": 0.5,
+                        "similarity_boost": 0.75,
                     },
-                    timeout=60.0,
-                )
-                
-                if response.status_code == 200:
-                    # Save to static file
-                    filename = f"static/{self.current_session_id}.mp3"
-                    with open(filename, "wb") as f:
-                        f.write(response.content)
-                        
-                    audio_url = f"http://localhost:8000/{filename}"
-                    self.log(f"Audio brief saved to {filename}")
-                    return audio_url, script
-                else:
-                    self.log(f"ElevenLabs error: {response.status_code} - {response.text}", "warning")
-                    return None, script
+                },
+                headers={
+                    "xi-api-key": self.settings.elevenlabs_api_key,
+                    "Content-Type": "application/json",
+                },
+                timeout=60.0,
+            )
+            
+            if response.status_code == 200:
+                # Save to static file
+                filename = f"static/{self.current_session_id}.mp3"
+                with open(filename, "wb") as f:
+                    f.write(response.content)
                     
+                audio_url = f"http://localhost:8000/{filename}"
+                self.log(f"Audio brief saved to {filename}")
+                return audio_url, script
+            else:
+                self.log(f"ElevenLabs error: {response.status_code} - {response.text}", "warning")
+                return None, script
+                
         except Exception as e:
             self.log(f"Audio generation error: {e}", "error")
             return None, None
@@ -4,12 +4,13 @@ Research paper analysis and technology evolution tracking
 """
 
 import asyncio
+import json
+import xml.etree.ElementTree as ET
 from typing import Dict, Any, List, Optional
 from datetime import datetime
-import httpx
 from loguru import logger
 
-from agents.base_agent import BaseAgent
+from agents.base_agent import BaseAgent, top_k_by_relevance
 from core.models import (
     ResearchQuery,
     ResearchPaper,
@@ -104,60 +105,59 @@ class TechTrendAgent(BaseAgent):
         """Search PubMed for biomedical papers - FREE API"""
         papers = []
         
-        async with httpx.AsyncClient() as client:
-            try:
-                # Step 1: Search for paper IDs
-                search_response = await client.get(
-                    "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi",
-                    params={
-                        "db": "pubmed",
-                        "term": query.query,
-                        "retmax": 15,
-                        "retmode": "json",
-                        "sort": "relevance",
-                    },
-                    timeout=30.0,
-                )
+        try:
+            # Step 1: Search for paper IDs
+            search_response = await self.http.get(
+                "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi",
+                params={
+                    "db": "pubmed",
+                    "term": query.query,
+                    "retmax": 15,
+                    "retmode": "json",
+                    "sort": "relevance",
+                },
+                timeout=30.0,
+            )
+            
+            if search_response.status_code == 200:
+                search_data = search_response.json()
+                ids = search_data.get("esearchresult", {}).get("idlist", [])
                 
-                if search_response.status_code == 200:
-                    search_data = search_response.json()
-                    ids = search_data.get("esearchresult", {}).get("idlist", [])
+                if ids:
+                    # Step 2: Fetch paper details
+                    details_response = await self.http.get(
+                        "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi",
+                        params={
+                            "db": "pubmed",
+                            "id": ",".join(ids),
+                            "retmode": "json",
+                        },
+                        timeout=30.0,
+                    )
                     
-                    if ids:
-                        # Step 2: Fetch paper details
-                        details_response = await client.get(
-                            "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi",
-                            params={
-                                "db": "pubmed",
-                                "id": ",".join(ids),
-                                "retmode": "json",
-                            },
-                            timeout=30.0,
-                        )
-                        
-                        if details_response.status_code == 200:
-                            details = details_response.json()
-                            for pmid in ids:
-                                paper_info = details.get("result", {}).get(pmid, {})
-                                if paper_info and isinstance(paper_info, dict):
-                                    authors = paper_info.get("authors", [])
-                                    author_names = [a.get("name", "") for a in authors if isinstance(a, dict)]
-                                    
-                                    papers.append({
-                                        "paper_id": f"PMID:{pmid}",
-                                        "title": paper_info.get("title", ""),
-                                        "abstract": paper_info.get("sorttitle", ""),
-                                        "authors": author_names[:5],
-                                        "published_at": paper_info.get("pubdate", ""),
-                                        "venue": paper_info.get("source", ""),
-                                        "url": f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/",
-                                        "source": "pubmed",
-                                    })
-                                    
-                self.log(f"Found {len(papers)} papers from PubMed")
-                
-            except Exception as e:
-                self.log(f"PubMed search error: {e}", "warning")
+                    if details_response.status_code == 200:
+                        details = details_response.json()
+                        for pmid in ids:
+                            paper_info = details.get("result", {}).get(pmid, {})
+                            if paper_info and isinstance(paper_info, dict):
+                                authors = paper_info.get("authors", [])
+                                author_names = [a.get("name", "") for a in authors if isinstance(a, dict)]
+                                
+                                papers.append({
+                                    "paper_id": f"PMID:{pmid}",
+                                    "title": paper_info.get("title", ""),
+                                    "abstract": paper_info.get("sorttitle", ""),
+                                    "authors": author_names[:5],
+                                    "published_at": paper_info.get("pubdate", ""),
+                                    "venue": paper_info.get("source", ""),
+                                    "url": f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/",
+                                    "source": "pubmed",
+                                })
+                                
+            self.log(f"Found {len(papers)} papers from PubMed")
+            
+        except Exception as e:
+            self.log(f"PubMed search error: {e}", "warning")
         
         return papers
     
@@ -165,57 +165,56 @@ class TechTrendAgent(BaseAgent):
         """Search CrossRef for academic papers - FREE API"""
         papers = []
         
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    "https://api.crossref.org/works",
-                    params={
-                        "query": query.query,
-                        "rows": 15,
-                        "sort": "relevance",
-                        "select": "DOI,title,author,published,container-title,abstract,is-referenced-by-count",
-                    },
-                    headers={
-                        "User-Agent": "NEXUS-RD/1.0 (https://nexus-rd.com; mailto:research@nexus-rd.com)",
-                    },
-                    timeout=30.0,
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    for item in data.get("message", {}).get("items", []):
-                        title_list = item.get("title", [])
-                        title = title_list[0] if title_list else ""
-                        
-                        authors = []
-                        for author in item.get("author", [])[:5]:
-                            name = f"{author.get('given', '')} {author.get('family', '')}".strip()
-                            if name:
-                                authors.append(name)
-                        
-                        published = item.get("published", {})
-                        date_parts = published.get("date-parts", [[]])
-                        year = str(date_parts[0][0]) if date_parts and date_parts[0] else ""
-                        
-                        venue_list = item.get("container-title", [])
-                        venue = venue_list[0] if venue_list else ""
-                        
-                        papers.append({
-                            "paper_id": item.get("DOI", ""),
-                            "title": title,
-                            "abstract": item.get("abstract", "")[:500] if item.get("abstract") else "",
-                            "authors": authors,
-                            "published_at": year,
-                            "venue": venue,
-                            "citation_count": item.get("is-referenced-by-count", 0),
-                            "url": f"https://doi.org/{item.get('DOI', '')}",
-                            "source": "crossref",
-                        })
-                        
-                self.log(f"Found {len(papers)} papers from CrossRef")
-                
-            except Exception as e:
-                self.log(f"CrossRef search error: {e}", "warning")
+        try:
+            response = await self.http.get(
+                "https://api.crossref.org/works",
+                params={
+                    "query": query.query,
+                    "rows": 15,
+                    "sort": "relevance",
+                    "select": "DOI,title,author,published,container-title,abstract,is-referenced-by-count",
+                },
+                headers={
+                    "User-Agent": "NEXUS-RD/1.0 (https://nexus-rd.com; mailto:research@nexus-rd.com)",
+                },
+                timeout=30.0,
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                for item in data.get("message", {}).get("items", []):
+                    title_list = item.get("title", [])
+                    title = title_list[0] if title_list else ""
+                    
+                    authors = []
+                    for author in item.get("author", [])[:5]:
+                        name = f"{author.get('given', '')} {author.get('family', '')}".strip()
+                        if name:
+                            authors.append(name)
+                    
+                    published = item.get("published", {})
+                    date_parts = published.get("date-parts", [[]])
+                    year = str(date_parts[0][0]) if date_parts and date_parts[0] else ""
+                    
+                    venue_list = item.get("container-title", [])
+                    venue = venue_list[0] if venue_list else ""
+                    
+                    papers.append({
+                        "paper_id": item.get("DOI", ""),
+                        "title": title,
+                        "abstract": item.get("abstract", "")[:500] if item.get("abstract") else "",
+                        "authors": authors,
+                        "published_at": year,
+                        "venue": venue,
+                        "citation_count": item.get("is-referenced-by-count", 0),
+                        "url": f"https://doi.org/{item.get('DOI', '')}",
+                        "source": "crossref",
+                    })
+                    
+            self.log(f"Found {len(papers)} papers from CrossRef")
+            
+        except Exception as e:
+            self.log(f"CrossRef search error: {e}", "warning")
         
         return papers
     
@@ -223,27 +222,26 @@ class TechTrendAgent(BaseAgent):
         """Search arXiv for papers"""
         papers = []
         
-        async with httpx.AsyncClient() as client:
-            try:
-                # arXiv API search
-                search_query = query.query.replace(" ", "+")
-                response = await client.get(
-                    "http://export.arxiv.org/api/query",
-                    params={
-                        "search_query": f"all:{search_query}",
-                        "start": 0,
-                        "max_results": 20,
-                        "sortBy": "relevance",
-                        "sortOrder": "descending",
-                    },
-                    timeout=30.0,
-                )
+        try:
+            # arXiv API search
+            search_query = query.query.replace(" ", "+")
+            response = await self.http.get(
+                "http://export.arxiv.org/api/query",
+                params={
+                    "search_query": f"all:{search_query}",
+                    "start": 0,
+                    "max_results": 20,
+                    "sortBy": "relevance",
+                    "sortOrder": "descending",
+                },
+                timeout=30.0,
+            )
+            
+            if response.status_code == 200:
+                papers = self._parse_arxiv_response(response.text)
                 
-                if response.status_code == 200:
-                    papers = self._parse_arxiv_response(response.text)
-                    
-            except Exception as e:
-                self.log(f"arXiv search error: {e}", "warning")
+        except Exception as e:
+            self.log(f"arXiv search error: {e}", "warning")
         
         return papers
     
@@ -252,8 +250,6 @@ class TechTrendAgent(BaseAgent):
         papers = []
         
         try:
-            import xml.etree.ElementTree as ET
-            
             # Parse the XML
             root = ET.fromstring(xml_text)
             
@@ -301,34 +297,33 @@ class TechTrendAgent(BaseAgent):
         """Search Semantic Scholar for papers"""
         papers = []
         
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    "https://api.semanticscholar.org/graph/v1/paper/search",
-                    params={
-                        "query": query.query,
-                        "limit": 20,
-                        "fields": "paperId,title,abstract,authors,year,citationCount,url",
-                    },
-                    timeout=30.0,
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    for paper in data.get("data", []):
-                        papers.append({
-                            "paper_id": paper.get("paperId", ""),
-                            "title": paper.get("title", ""),
-                            "abstract": paper.get("abstract", ""),
-                            "authors": [a.get("name", "") for a in paper.get("authors", [])],
-                            "published_at": str(paper.get("year", "")),
-                            "citation_count": paper.get("citationCount", 0),
-                            "url": paper.get("url", ""),
-                            "source": "semantic_scholar",
-                        })
-                        
-            except Exception as e:
-                self.log(f"Semantic Scholar error: {e}", "warning")
+        try:
+            response = await self.http.get(
+                "https://api.semanticscholar.org/graph/v1/paper/search",
+                params={
+                    "query": query.query,
+                    "limit": 20,
+                    "fields": "paperId,title,abstract,authors,year,citationCount,url",
+                },
+                timeout=30.0,
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                for paper in data.get("data", []):
+                    papers.append({
+                        "paper_id": paper.get("paperId", ""),
+                        "title": paper.get("title", ""),
+                        "abstract": paper.get("abstract", ""),
+                        "authors": [a.get("name", "") for a in paper.get("authors", [])],
+                        "published_at": str(paper.get("year", "")),
+                        "citation_count": paper.get("citationCount", 0),
+                        "url": paper.get("url", ""),
+                        "source": "semantic_scholar",
+                    })
+                    
+        except Exception as e:
+            self.log(f"Semantic Scholar error: {e}", "warning")
         
         return papers
     
@@ -351,7 +346,6 @@ Return as JSON array."""
         response = await self.gemini.generate(prompt, task_type="tech_trend", temperature=0.7)
         
         try:
-            import json
             if "```json" in response:
                 start = response.find("```json") + 7
                 end = response.find("```", start)
@@ -446,7 +440,7 @@ Return as JSON array."""
         """Identify technology trends from papers"""
         # Use AI to identify trends
         paper_summaries = [
-            f"- {p.title}: {p.abstract[:150]}..." for p in papers[:15]
+            f"- {p.title}: {p.abstract[:150]}..." for p in top_k_by_relevance(papers, 15)
         ]
         
         prompt = f"""Analyze these research papers about "{query.query}" and identify 4-5 technology trends:
@@ -469,7 +463,6 @@ Return as JSON array."""
         
         trends = []
         try:
-            import json
             if "```json" in response:
                 start = response.find("```json") + 7
                 end = response.find("```", start)
@@ -598,7 +591,7 @@ Return as JSON array."""
                 "title": p.title,
                 "abstract": p.abstract[:200],
                 "citations": p.citation_count,
-            } for p in papers[:10]],
+            } for p in top_k_by_relevance(papers, 10)],
             query=query.query,
         )
         
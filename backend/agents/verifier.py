@@ -4,10 +4,14 @@ Adversarial verification and cross-reference validation using Epistemic Verifica
 """
 
 import asyncio
-from typing import Dict, Any, List, Optional
+import json
+import re
+from collections import Counter
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
-import httpx
+import numpy as np
 from loguru import logger
+from pydantic import TypeAdapter
 
 from agents.base_agent import BaseAgent
 from core.models import (
@@ -16,10 +20,20 @@ from core.models import (
     VerifiedClaim,
     VerificationReport,
     ConfidenceLevel,
+    CONFIDENCE_LEVEL_CODES,
+    claims_as_soa,
 )
 from config import get_settings
 
 
+# Cheap filters for claims not worth spending search/LLM calls on
+_URL_RE = re.compile(r"^https?://\S+$")
+_WORD_RE = re.compile(r"[A-Za-z]{3,}")
+
+# Serializes source lists in one call instead of per-instance model_dump()
+_SOURCE_LIST_ADAPTER = TypeAdapter(List[VerificationSource])
+
+
 class VerifierAgent(BaseAgent):
     """
     Verifier Agent - Epistemic Verification Protocol (EVP)
@@ -37,6 +51,9 @@ class VerifierAgent(BaseAgent):
     def __init__(self):
         super().__init__("verifier")
         self.settings = get_settings()
+        # Hot settings read once here rather than on every search call
+        self._serper_key = self.settings.serper_api_key
+        self._serper_headers = {"X-API-KEY": self._serper_key}
         self.min_sources = self.config.get("min_sources", 5)
         self.confidence_methods = self.config.get(
             "confidence_methods",
@@ -55,21 +72,26 @@ class VerifierAgent(BaseAgent):
             self.log("No claims to verify", "warning")
             return self._create_empty_report()
         
+        # Claim prefixes are used for queries, matching and logging in several phases
+        claim_prefixes = [claim[:50] for claim in claims]
+        
         # Phase 2: Search for supporting evidence
         await self._update_status(f"Gathering evidence for {len(claims)} claims...", progress=25.0)
-        evidence = await self._gather_evidence(claims, query)
+        evidence, source_distribution = await self._gather_evidence(claims, query)
         
         # Phase 3: Search for CONTRADICTING evidence (adversarial)
         await self._update_status("Searching for contradictions...", progress=45.0)
-        contradictions = await self._search_contradictions(claims, query)
+        contradictions = await self._search_contradictions(claims, claim_prefixes, query)
         
         # Phase 4: Verify each claim using EVP
         await self._update_status("Applying Epistemic Verification Protocol...", progress=65.0)
-        verified_claims = await self._verify_claims(claims, evidence, contradictions, query)
+        verified_claims = await self._verify_claims(
+            claims, claim_prefixes, evidence, contradictions, query
+        )
         
         # Phase 5: Calculate overall confidence
         await self._update_status("Calculating confidence scores...", progress=85.0)
-        report = await self._generate_report(verified_claims, evidence, claims)
+        report = await self._generate_report(verified_claims, source_distribution, claims)
         
         # Phase 6: Store verified facts in memory
         await self._update_status("Storing verified facts...", progress=95.0)
@@ -123,48 +145,77 @@ class VerifierAgent(BaseAgent):
         for hint in hints:
             claims.append(hint.get("hint", ""))
         
-        # Deduplicate
-        unique_claims = list(set(c for c in claims if c and len(c) > 10))
+        # Deduplicate and drop low-signal claims before any API call
+        unique_claims = []
+        seen_heads: set = set()
+        for c in dict.fromkeys(claims):
+            if c and len(c) > 10 and self._is_worth_verifying(c, seen_heads):
+                unique_claims.append(c)
         
         self.log(f"Collected {len(unique_claims)} claims for verification")
         return unique_claims[:30]  # Limit to avoid API limits
     
+    def _is_worth_verifying(self, claim: str, seen_heads: set) -> bool:
+        """Check a claim carries enough signal to verify, recording its head for fuzzy dedup"""
+        head = claim[:20].lower()
+        if head in seen_heads:
+            return False
+        
+        stripped = claim.strip()
+        if _URL_RE.match(stripped):
+            return False
+        
+        non_ascii = sum(1 for ch in stripped if ord(ch) > 127)
+        if non_ascii > 0.6 * len(stripped):
+            return False
+        
+        if len(_WORD_RE.findall(stripped)) < 3:
+            return False
+        
+        seen_heads.add(head)
+        return True
+    
     async def _gather_evidence(
         self,
         claims: List[str],
         query: ResearchQuery
-    ) -> Dict[str, List[VerificationSource]]:
-        """Gather evidence for each claim"""
+    ) -> Tuple[Dict[str, List[VerificationSource]], Counter]:
+        """Gather evidence for each claim, counting sources by type as they arrive"""
         evidence: Dict[str, List[VerificationSource]] = {}
+        source_distribution: Counter = Counter()
+        
+        async def gather_one(claim: str) -> Tuple[str, List[VerificationSource]]:
+            # Search using Serper if available, then top up with simulated sources
+            serper_sources = []
+            if self._serper_key:
+                serper_sources = await self._search_serper(
+                    f"{query.query} {self._extract_key_terms(claim)}"
+                )
+            return claim, await self._search_evidence_for_claim(claim, query, serper_sources)
         
-        for i, claim in enumerate(claims):
-            await self._update_status(
-                f"Gathering evidence ({i+1}/{len(claims)})...",
-                progress=25 + (20 * i / len(claims)),
-            )
-            
-            sources = await self._search_evidence_for_claim(claim, query)
+        # All claims are searched concurrently; progress follows completions
+        total = len(claims)
+        for done, next_result in enumerate(asyncio.as_completed([gather_one(c) for c in claims]), 1):
+            claim, sources = await next_result
             evidence[claim] = sources
+            source_distribution.update(s.source_type for s in sources)
             await self._increment_sources(len(sources))
+            await self._update_status(
+                f"Gathering evidence ({done}/{total})...",
+                progress=25 + (20 * done / total),
+            )
         
-        return evidence
+        # Keep claim order for downstream iteration
+        return {claim: evidence[claim] for claim in claims}, source_distribution
     
     async def _search_evidence_for_claim(
         self,
         claim: str,
-        query: ResearchQuery
+        query: ResearchQuery,
+        serper_sources: List[VerificationSource],
     ) -> List[VerificationSource]:
-        """Search for evidence supporting a specific claim"""
-        sources = []
-        
-        # Build search query from claim
-        search_terms = self._extract_key_terms(claim)
-        search_query = f"{query.query} {search_terms}"
-        
-        # Search using Serper if available
-        if self.settings.serper_api_key:
-            serper_sources = await self._search_serper(search_query, claim)
-            sources.extend(serper_sources)
+        """Complete the Serper evidence for a specific claim"""
+        sources = list(serper_sources)
         
         # Generate simulated sources if needed
         if len(sources) < self.min_sources:
@@ -187,41 +238,49 @@ class VerifierAgent(BaseAgent):
         
         return " ".join(key_terms[:8])
     
+    async def _search_serper_batch(
+        self,
+        search_queries: List[str],
+    ) -> List[List[VerificationSource]]:
+        """Search Google via Serper for several queries concurrently over one connection pool"""
+        return await asyncio.gather(*(
+            self._search_serper(search_query)
+            for search_query in search_queries
+        ))
+    
     async def _search_serper(
         self,
         search_query: str,
-        claim: str
     ) -> List[VerificationSource]:
         """Search Google via Serper for evidence"""
         sources = []
         
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    "https://google.serper.dev/search",
-                    json={
-                        "q": search_query,
-                        "num": 10,
-                    },
-                    headers={"X-API-KEY": self.settings.serper_api_key},
-                    timeout=30.0,
-                )
+        try:
+            response = await self.http.post(
+                "https://google.serper.dev/search",
+                json={
+                    "q": search_query,
+                    "num": 10,
+                },
+                headers=self._serper_headers,
+                timeout=30.0,
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
                 
-                if response.status_code == 200:
-                    data = response.json()
+                for result in data.get("organic", []):
+                    source = VerificationSource(
+                        source_type="web",
+                        source_name=result.get("title", "Unknown"),
+                        url=result.get("link"),
+                        authority_score=self._calculate_authority(result.get("link", "")),
+                        relevant_excerpt=result.get("snippet"),
+                    )
+                    sources.append(source)
                     
-                    for result in data.get("organic", []):
-                        source = VerificationSource(
-                            source_type="web",
-                            source_name=result.get("title", "Unknown"),
-                            url=result.get("link"),
-                            authority_score=self._calculate_authority(result.get("link", "")),
-                            relevant_excerpt=result.get("snippet"),
-                        )
-                        sources.append(source)
-                        
-            except Exception as e:
-                self.log(f"Serper search error: {e}", "warning")
+        except Exception as e:
+            self.log(f"Serper search error: {e}", "warning")
         
         return sources
     
@@ -278,7 +337,6 @@ Return as JSON array."""
         
         sources = []
         try:
-            import json
             if "```json" in response:
                 start = response.find("```json") + 7
                 end = response.find("```", start)
@@ -304,33 +362,25 @@ Return as JSON array."""
     async def _search_contradictions(
         self,
         claims: List[str],
+        claim_prefixes: List[str],
         query: ResearchQuery
     ) -> Dict[str, List[VerificationSource]]:
         """Actively search for contradicting evidence - THE ADVERSARIAL STEP"""
-        contradictions: Dict[str, List[VerificationSource]] = {}
-        
-        for claim in claims:
-            # Build negation queries
-            negation_queries = [
-                f'NOT "{claim[:50]}" {query.query}',
-                f'"{query.query}" problems challenges failure',
-                f'"{query.query}" criticism concerns issues',
-            ]
-            
-            contra_sources = []
-            
-            if self.settings.serper_api_key:
-                for neg_query in negation_queries[:1]:  # Limit API calls
-                    sources = await self._search_serper(neg_query, claim)
-                    contra_sources.extend(sources[:3])
-            
-            contradictions[claim] = contra_sources
+        if not self._serper_key:
+            return {claim: [] for claim in claims}
+        
+        # One claim-specific negation query per claim; only each claim's own
+        # top results count against it
+        results = await self._search_serper_batch([
+            f'NOT "{prefix}" {query.query}' for prefix in claim_prefixes
+        ])
         
-        return contradictions
+        return {claim: sources[:3] for claim, sources in zip(claims, results)}
     
     async def _verify_claims(
         self,
         claims: List[str],
+        claim_prefixes: List[str],
         evidence: Dict[str, List[VerificationSource]],
         contradictions: Dict[str, List[VerificationSource]],
         query: ResearchQuery,
@@ -343,7 +393,7 @@ Return as JSON array."""
             claims=claims[:15],  # Limit for API
             supporting_data={
                 "evidence_summary": {
-                    claim: [s.model_dump() for s in sources[:3]]
+                    claim: _SOURCE_LIST_ADAPTER.dump_python(sources[:3])
                     for claim, sources in evidence.items()
                 },
                 "contradictions_found": {
@@ -357,24 +407,24 @@ Return as JSON array."""
         # Parse verification results
         ai_verified = verification_result.get("verified_claims", [])
         
-        for claim in claims:
+        # Find AI verification result for each claim, stringifying each result once
+        ai_verified_text = [(str(v), v) for v in ai_verified]
+        ai_results = [
+            next((v for text, v in ai_verified_text if prefix in text), None)
+            for prefix in claim_prefixes
+        ]
+        
+        # Calculate confidence scores for all claims at once
+        confidences = self._calculate_confidence_bulk(
+            claims, evidence, contradictions, ai_results
+        )
+        
+        for claim, prefix, ai_result, confidence in zip(
+            claims, claim_prefixes, ai_results, confidences.tolist()
+        ):
             claim_evidence = evidence.get(claim, [])
             claim_contradictions = contradictions.get(claim, [])
             
-            # Find AI verification result for this claim
-            ai_result = next(
-                (v for v in ai_verified if claim[:50] in str(v)),
-                None
-            )
-            
-            # Calculate confidence score
-            confidence = await self._calculate_confidence(
-                claim,
-                claim_evidence,
-                claim_contradictions,
-                ai_result,
-            )
-            
             # Determine confidence level
             level = self._get_confidence_level(confidence)
             
@@ -388,52 +438,66 @@ Return as JSON array."""
             )
             verified_claims.append(verified_claim)
             
-            self.log(f"Verified: '{claim[:50]}...' - Confidence: {confidence:.0%}")
+            self.log(f"Verified: '{prefix}...' - Confidence: {confidence:.0%}")
         
         return verified_claims
     
-    async def _calculate_confidence(
+    def _calculate_confidence_bulk(
         self,
-        claim: str,
-        evidence: List[VerificationSource],
-        contradictions: List[VerificationSource],
-        ai_result: Optional[Dict[str, Any]],
-    ) -> float:
-        """Calculate Bayesian confidence score for a claim"""
+        claims: List[str],
+        evidence: Dict[str, List[VerificationSource]],
+        contradictions: Dict[str, List[VerificationSource]],
+        ai_results: List[Optional[Dict[str, Any]]],
+    ) -> np.ndarray:
+        """Calculate Bayesian confidence scores for all claims in one vectorized pass"""
+        n = len(claims)
+        
         # Start with prior
         prior = 0.5
         
-        # Evidence boost
-        evidence_boost = 0
-        for source in evidence:
-            evidence_boost += source.authority_score * 0.1
-        evidence_boost = min(evidence_boost, 0.35)
+        # Evidence boost - sum authority scores per claim from a flat array
+        source_counts = np.fromiter(
+            (len(evidence.get(c, [])) for c in claims), dtype=np.int64, count=n
+        )
+        authority = np.fromiter(
+            (s.authority_score for c in claims for s in evidence.get(c, [])),
+            dtype=np.float64,
+            count=int(source_counts.sum()),
+        )
+        authority_sums = np.bincount(
+            np.repeat(np.arange(n), source_counts), weights=authority, minlength=n
+        )
+        evidence_boost = np.minimum(authority_sums * 0.1, 0.35)
         
         # Contradiction penalty
-        contradiction_penalty = len(contradictions) * 0.08
-        contradiction_penalty = min(contradiction_penalty, 0.25)
+        contra_counts = np.fromiter(
+            (len(contradictions.get(c, [])) for c in claims), dtype=np.int64, count=n
+        )
+        contradiction_penalty = np.minimum(contra_counts * 0.08, 0.25)
         
         # Number of sources factor
-        source_count = len(evidence)
-        if source_count >= self.min_sources:
-            source_factor = 0.1
-        elif source_count >= 3:
-            source_factor = 0.05
-        else:
-            source_factor = -0.1
+        source_factor = np.where(
+            source_counts >= self.min_sources,
+            0.1,
+            np.where(source_counts >= 3, 0.05, -0.1),
+        )
         
         # AI verification factor
-        ai_factor = 0
-        if ai_result:
-            ai_confidence = ai_result.get("confidence_score", 0.5)
-            if isinstance(ai_confidence, (int, float)):
-                ai_factor = (ai_confidence - 0.5) * 0.2
+        ai_confidence = np.fromiter(
+            (
+                r.get("confidence_score", 0.5)
+                if r and isinstance(r.get("confidence_score", 0.5), (int, float))
+                else 0.5
+                for r in ai_results
+            ),
+            dtype=np.float64,
+            count=n,
+        )
+        ai_factor = (ai_confidence - 0.5) * 0.2
         
-        # Calculate final score
+        # Calculate final scores, clamped to [0, 1]
         confidence = prior + evidence_boost - contradiction_penalty + source_factor + ai_factor
-        
-        # Clamp to [0, 1]
-        return max(0.0, min(1.0, confidence))
+        return np.clip(confidence, 0.0, 1.0)
     
     def _get_confidence_level(self, score: float) -> ConfidenceLevel:
         """Convert numeric score to confidence level"""
@@ -451,41 +515,33 @@ Return as JSON array."""
     async def _generate_report(
         self,
         verified_claims: List[VerifiedClaim],
-        evidence: Dict[str, List[VerificationSource]],
+        source_distribution: Counter,
         original_claims: List[str],
     ) -> Dict[str, Any]:
         """Generate verification report"""
-        # Count sources by type
-        source_distribution: Dict[str, int] = {}
-        total_sources = 0
-        
-        for sources in evidence.values():
-            for source in sources:
-                source_distribution[source.source_type] = source_distribution.get(source.source_type, 0) + 1
-                total_sources += 1
-        
-        # Calculate statistics
-        verified_count = sum(
-            1 for vc in verified_claims
-            if vc.confidence_level in [ConfidenceLevel.HIGH, ConfidenceLevel.VERY_HIGH]
-        )
-        
-        average_confidence = sum(vc.confidence_score for vc in verified_claims) / len(verified_claims) if verified_claims else 0
+        total_sources = sum(source_distribution.values())
         
-        coverage = verified_count / len(original_claims) if original_claims else 0
-        
-        # Identify unverified claims
+        # Calculate statistics over columnar score/level arrays
+        scores, levels = claims_as_soa(verified_claims)
+        counts = np.bincount(levels, minlength=len(CONFIDENCE_LEVEL_CODES))
+        level_counts = {level: int(counts[code]) for level, code in CONFIDENCE_LEVEL_CODES.items()}
+        unverified_code = CONFIDENCE_LEVEL_CODES[ConfidenceLevel.UNVERIFIED]
         unverified = [
-            vc.claim_text for vc in verified_claims
-            if vc.confidence_level == ConfidenceLevel.UNVERIFIED
+            verified_claims[i].claim_text for i in np.flatnonzero(levels == unverified_code)
         ]
         
+        verified_count = level_counts[ConfidenceLevel.HIGH] + level_counts[ConfidenceLevel.VERY_HIGH]
+        
+        average_confidence = float(scores.mean()) if verified_claims else 0
+        
+        coverage = verified_count / len(original_claims) if original_claims else 0
+        
         report = VerificationReport(
             total_claims_analyzed=len(original_claims),
             verified_claims=verified_claims,
             unverified_claims=unverified,
             total_sources_used=total_sources,
-            source_distribution=source_distribution,
+            source_distribution=dict(source_distribution),
             average_confidence=average_confidence,
             verification_coverage=coverage,
         )
@@ -495,14 +551,8 @@ Return as JSON array."""
         # Add summary stats
         result["summary"] = {
             "high_confidence_claims": verified_count,
-            "medium_confidence_claims": sum(
-                1 for vc in verified_claims
-                if vc.confidence_level == ConfidenceLevel.MEDIUM
-            ),
-            "low_confidence_claims": sum(
-                1 for vc in verified_claims
-                if vc.confidence_level in [ConfidenceLevel.LOW, ConfidenceLevel.UNVERIFIED]
-            ),
+            "medium_confidence_claims": level_counts[ConfidenceLevel.MEDIUM],
+            "low_confidence_claims": level_counts[ConfidenceLevel.LOW] + level_counts[ConfidenceLevel.UNVERIFIED],
             "average_confidence_percent": f"{average_confidence * 100:.1f}%",
         }
         
@@ -25,6 +25,7 @@ class Settings(BaseSettings):
     
     # Redis
     redis_url: str = Field("redis://localhost:6379", env="REDIS_URL")
+    enable_redis: bool = Field(False, env="ENABLE_REDIS")
     
     # Application Settings
     debug: bool = Field(True, env="DEBUG")
@@ -36,15 +37,22 @@ class Settings(BaseSettings):
     confidence_threshold: float = Field(0.85, env="CONFIDENCE_THRESHOLD")
     max_patents_per_search: int = Field(100, env="MAX_PATENTS_PER_SEARCH")
     max_papers_per_search: int = Field(50, env="MAX_PAPERS_PER_SEARCH")
+    max_memory_items: int = Field(5000, env="MAX_MEMORY_ITEMS")
     
     # Gemini Settings
     gemini_model: str = Field("gemini-2.0-flash", env="GEMINI_MODEL")
     gemini_thinking_model: str = Field("gemini-2.0-flash", env="GEMINI_THINKING_MODEL")
+    gemini_structured_model: str = Field("gemini-2.5-flash-lite", env="GEMINI_STRUCTURED_MODEL")
+    gemini_max_concurrency: int = Field(3, env="GEMINI_MAX_CONCURRENCY")
+    gemini_rpm: int = Field(15, env="GEMINI_RPM")
+    gemini_tpm: int = Field(1000000, env="GEMINI_TPM")
+    enable_response_cache: bool = Field(True, env="ENABLE_RESPONSE_CACHE")
     
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
         case_sensitive = False
+        frozen = True  # shared via get_settings(), so never mutated in place
 
 
 @lru_cache()
@@ -3,279 +3,332 @@ NEXUS-R&D Demo Fallback Data Provider
 Provides realistic demo data when Gemini API is unavailable
 """
 
-from typing import Dict, Any, List
-from datetime import datetime
-import random
+import os
+from dataclasses import dataclass, fields
+import string
+import sys
+from functools import lru_cache, wraps
+from types import MappingProxyType
+from typing import Dict, Any, Callable, List, Mapping, Optional, Sequence, Tuple
+import zlib
+import numpy as np
+import orjson
+from loguru import logger
 
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
 
-class DemoDataProvider:
-    """
-    Provides realistic demo data for all NEXUS-R&D analysis types.
-    Used when Gemini API quota is exceeded or unavailable.
-    """
-    
-    @staticmethod
-    def get_patent_analysis(query: str) -> Dict[str, Any]:
-        """Generate demo patent analysis data"""
-        return {
-            "key_technology_themes": [
-                f"Advanced {query} system architecture",
-                f"Machine learning applications in {query}",
-                f"Distributed {query} protocols",
-                f"Security mechanisms for {query}",
-            ],
-            "dominant_assignees": [
-                {"name": "TechCorp Industries", "patent_count": 145, "strategy": "Broad portfolio coverage"},
-                {"name": "Innovation Labs Inc", "patent_count": 89, "strategy": "Deep specialization"},
-                {"name": "Global Research AG", "patent_count": 67, "strategy": "Defensive positioning"},
-            ],
-            "filing_trends": {
-                "trend": "increasing",
-                "growth_rate": "23% YoY",
-                "peak_year": 2025,
-            },
-            "citation_insights": {
-                "foundational_patents": ["US10234567", "US10345678", "EP3456789"],
-                "emerging_patents": ["US11234567", "US11345678"],
-            },
-            "whitespace_areas": [
-                f"Integration of {query} with edge computing",
-                f"Privacy-preserving {query} implementations",
-                f"Cross-platform {query} interoperability",
-            ],
-            "competitive_landscape": {
-                "concentration": "moderate",
-                "top_3_share": "42%",
-                "barriers_to_entry": "medium",
-            },
-        }
-    
-    @staticmethod
-    def get_market_analysis(query: str) -> Dict[str, Any]:
-        """Generate demo market analysis data"""
-        base_size = random.randint(50, 200) * 1000000000  # $50B-$200B
-        return {
-            "market_size_assessment": {
-                "current_size_usd": base_size,
-                "projected_2028_usd": base_size * 2.5,
-                "cagr": "18.5%",
-            },
-            "key_players": [
-                {"name": "MarketLeader Corp", "market_share": "28%", "position": "Leader"},
-                {"name": "Innovate Partners", "market_share": "19%", "position": "Challenger"},
-                {"name": "Emerging Tech Inc", "market_share": "12%", "position": "Fast Follower"},
-            ],
-            "funding_trends": {
-                "total_2024_funding_usd": 4500000000,
-                "deal_count": 156,
-                "average_deal_size_usd": 28800000,
-                "trend": "accelerating",
-            },
-            "regulatory_considerations": [
-                "Increasing regulatory scrutiny expected",
-                "New compliance frameworks emerging",
-                "International standardization efforts underway",
-            ],
-            "commercial_viability": {
-                "score": 8.2,
-                "reasoning": f"Strong market fundamentals for {query} with proven business models",
-            },
-            "market_timing": {
-                "recommendation": "favorable",
-                "window": "18-24 months",
-                "rationale": "Technology maturity aligning with market demand",
-            },
-        }
-    
-    @staticmethod
-    def get_tech_trend_analysis(query: str) -> Dict[str, Any]:
-        """Generate demo technology trend analysis data"""
-        return {
-            "emerging_themes": [
-                f"Neural architectures for {query}",
-                f"Federated approaches to {query}",
-                f"Quantum-resistant {query} methods",
-                f"Sustainable {query} implementations",
-            ],
-            "trl_assessment": {
-                "current_trl": 6,
-                "expected_trl_2026": 8,
-                "gap_areas": ["Scale validation", "Production hardening"],
-            },
-            "key_research_groups": [
-                {"name": "MIT AI Lab", "focus": "Foundational algorithms", "citations": 12500},
-                {"name": "Stanford NLP Group", "focus": "Applied systems", "citations": 9800},
-                {"name": "DeepMind Research", "focus": "Advanced architectures", "citations": 8900},
-            ],
-            "maturation_timeline": {
-                "lab_prototype": "2023",
-                "pilot_deployment": "2025",
-                "commercial_scale": "2027",
-                "market_saturation": "2030",
-            },
-            "breakthrough_indicators": [
-                "Recent papers show 40% efficiency improvements",
-                "Major tech companies increasing R&D investment",
-                "Open source ecosystem maturing rapidly",
-            ],
-            "research_momentum": {
-                "score": 0.85,
-                "trend": "accelerating",
-                "publication_growth": "35% YoY",
-            },
-            "key_insights": [
-                f"Research in {query} is accelerating with 35% YoY publication growth",
-                f"Major breakthrough expected in hybrid {query} architectures",
-                "Industry-academia collaboration strengthening",
-            ],
-        }
+
+class _DemoRow(Mapping):
+    """Read-only mapping interface over a slotted demo record"""
     
-    @staticmethod
-    def get_verification_result(claims: List[str]) -> Dict[str, Any]:
-        """Generate demo verification results"""
-        verified_claims = []
-        for i, claim in enumerate(claims[:10]):
-            confidence = random.uniform(0.65, 0.95)
-            status = "verified" if confidence > 0.8 else "partially_verified"
-            verified_claims.append({
-                "claim_id": i + 1,
-                "original_claim": claim[:200],
-                "verification_status": status,
-                "confidence_score": round(confidence, 2),
-                "supporting_sources": random.randint(2, 5),
-                "contradicting_evidence": "none" if confidence > 0.85 else "minor discrepancies",
-            })
-        
-        avg_confidence = sum(c["confidence_score"] for c in verified_claims) / len(verified_claims) if verified_claims else 0.75
-        
-        return {
-            "verified_claims": verified_claims,
-            "summary": {
-                "total_claims_checked": len(verified_claims),
-                "verified_count": sum(1 for c in verified_claims if c["verification_status"] == "verified"),
-                "partially_verified_count": sum(1 for c in verified_claims if c["verification_status"] == "partially_verified"),
-                "average_confidence": round(avg_confidence, 2),
-            },
-            "methodology": "Epistemic Verification Protocol (EVP) with multi-source validation",
-        }
+    __slots__ = ()
     
-    @staticmethod
-    def get_whitespace_opportunities(query: str) -> List[Dict[str, Any]]:
-        """Generate demo whitespace opportunities"""
-        opportunities = [
-            {
-                "title": f"AI-Enhanced {query} Automation Platform",
-                "description": f"Gap identified between current {query} capabilities and market demand for intelligent automation. No dominant player has captured this intersection.",
-                "opportunity_type": "technology_gap",
-                "confidence_score": 0.87,
-                "supporting_evidence": [
-                    "Patent landscape shows limited coverage",
-                    "Market research indicates high demand",
-                    "Technical feasibility validated by recent papers",
-                ],
-                "potential_impact": "high",
-                "time_sensitivity": "urgent",
-                "competitive_landscape": "3-5 startups attempting, no clear leader",
-                "recommended_actions": [
-                    "File provisional patents in key areas",
-                    "Build proof of concept within 6 months",
-                    "Establish partnerships with key players",
-                ],
-                "estimated_market_size_usd": 2500000000,
-            },
-            {
-                "title": f"Enterprise-Grade {query} Security Suite",
-                "description": f"Security requirements for {query} implementations significantly outpace current solutions. Regulatory pressure creating urgency.",
-                "opportunity_type": "market_gap",
-                "confidence_score": 0.82,
-                "supporting_evidence": [
-                    "Regulatory mandates pending",
-                    "Enterprise survey data shows pain point",
-                    "Limited IP coverage in security layer",
-                ],
-                "potential_impact": "high",
-                "time_sensitivity": "moderate",
-                "competitive_landscape": "Legacy players slow to adapt",
-                "recommended_actions": [
-                    "Develop compliance-first architecture",
-                    "Target financial services vertical first",
-                    "Build certification partnerships",
-                ],
-                "estimated_market_size_usd": 1800000000,
-            },
-            {
-                "title": f"Open-Source {query} Development Framework",
-                "description": f"Developer ecosystem lacks comprehensive tooling for {query} applications. Community appetite for standardized frameworks.",
-                "opportunity_type": "ecosystem_gap",
-                "confidence_score": 0.78,
-                "supporting_evidence": [
-                    "GitHub activity analysis shows fragmentation",
-                    "Developer surveys indicate tooling pain",
-                    "No dominant open-source standard emerged",
-                ],
-                "potential_impact": "medium",
-                "time_sensitivity": "moderate",
-                "competitive_landscape": "Multiple fragmented projects",
-                "recommended_actions": [
-                    "Launch open-source initiative",
-                    "Build enterprise support model",
-                    "Establish developer community",
-                ],
-                "estimated_market_size_usd": 500000000,
-            },
-            {
-                "title": f"Cross-Platform {query} Interoperability Layer",
-                "description": f"Lack of standardized protocols preventing {query} adoption in heterogeneous environments.",
-                "opportunity_type": "standards_gap",
-                "confidence_score": 0.75,
-                "supporting_evidence": [
-                    "Industry consortia forming",
-                    "Patent filings show interest",
-                    "Technical specifications lacking",
-                ],
-                "potential_impact": "high",
-                "time_sensitivity": "low",
-                "competitive_landscape": "Early stage opportunity",
-                "recommended_actions": [
-                    "Join standards bodies",
-                    "Publish reference implementations",
-                    "Build industry alliance",
-                ],
-                "estimated_market_size_usd": 1200000000,
-            },
-        ]
-        return opportunities
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        return getattr(self, key)
     
-    @staticmethod
-    def get_synthesis_report(query: str) -> Dict[str, Any]:
-        """Generate demo synthesis report data"""
-        return {
-            "headline": f"Significant Innovation Opportunities Identified in {query} Landscape",
-            "key_finding": f"Analysis reveals 4 major whitespace opportunities in the {query} sector with combined addressable market exceeding $6 billion. Immediate action recommended on AI automation and security verticals.",
-            "executive_summary": f"Our multi-agent analysis of the {query} landscape has uncovered significant innovation opportunities that align strong technical feasibility with proven market demand. The convergence of maturing technology (TRL 6-7), favorable regulatory environment, and fragmented competitive landscape creates an optimal entry window for strategic investments.",
-            "recommended_next_steps": [
-                "Commission detailed technical feasibility study for top 2 opportunities",
-                "Engage IP counsel for provisional patent strategy",
-                "Initiate partnership discussions with identified potential collaborators",
-                "Develop 90-day proof of concept roadmap",
-            ],
-            "confidence_score": 0.84,
-            "risk_factors": [
-                "Regulatory uncertainty in key jurisdictions",
-                "Talent acquisition challenges in specialized areas",
-                "Potential incumbent response acceleration",
-            ],
-            "success_factors": [
-                "First-mover advantage in whitespace areas",
-                "Strong technical foundations available",
-                "Market timing favorable",
-            ],
-        }
+    def __iter__(self):
+        return (f.name for f in fields(self))
     
-    @staticmethod
-    def get_audio_script(query: str, report: Dict[str, Any]) -> str:
-        """Generate demo audio brief script"""
-        return f"""Welcome to your NEXUS-R&D Innovation Opportunity Brief for {query}.
+    def __len__(self) -> int:
+        return len(self.__dataclass_fields__)
+
+
+@dataclass(frozen=True, slots=True)
+class Assignee(_DemoRow):
+    """Dominant patent assignee row"""
+    name: str
+    patent_count: int
+    strategy: str
+
+
+@dataclass(frozen=True, slots=True)
+class KeyPlayer(_DemoRow):
+    """Market key player row"""
+    name: str
+    market_share: str
+    position: str
+
+
+@dataclass(frozen=True, slots=True)
+class ResearchGroup(_DemoRow):
+    """Key research group row"""
+    name: str
+    focus: str
+    citations: int
+
+
+# Skeleton fields holding slotted rows, rebuilt when a payload is loaded from disk
+_ROW_TYPES: Dict[str, type] = {
+    "dominant_assignees": Assignee,
+    "key_players": KeyPlayer,
+    "key_research_groups": ResearchGroup,
+}
+
+
+def _restore_rows(payload: Any) -> Any:
+    """Turn decoded row dicts back into their dataclasses, matching a fresh build"""
+    if isinstance(payload, dict):
+        for key, row_type in _ROW_TYPES.items():
+            rows = payload.get(key)
+            if isinstance(rows, list):
+                payload[key] = [row_type(**row) for row in rows]
+    return payload
+
+
+# Query-independent scaffolding, built once at import.
+# None marks the slots each builder fills in for the query. Builders
+# merge over these without copying: _freeze() never mutates its input.
+_PATENT_SKELETON: Dict[str, Any] = {
+    "key_technology_themes": None,
+    "dominant_assignees": [
+        Assignee("TechCorp Industries", 145, "Broad portfolio coverage"),
+        Assignee("Innovation Labs Inc", 89, "Deep specialization"),
+        Assignee("Global Research AG", 67, "Defensive positioning"),
+    ],
+    "filing_trends": {
+        "trend": "increasing",
+        "growth_rate": "23% YoY",
+        "peak_year": 2025,
+    },
+    "citation_insights": {
+        "foundational_patents": ["US10234567", "US10345678", "EP3456789"],
+        "emerging_patents": ["US11234567", "US11345678"],
+    },
+    "whitespace_areas": None,
+    "competitive_landscape": {
+        "concentration": "moderate",
+        "top_3_share": "42%",
+        "barriers_to_entry": "medium",
+    },
+}
+
+_MARKET_SKELETON: Dict[str, Any] = {
+    "market_size_assessment": {
+        "current_size_usd": None,
+        "projected_2028_usd": None,
+        "cagr": "18.5%",
+    },
+    "key_players": [
+        KeyPlayer("MarketLeader Corp", "28%", "Leader"),
+        KeyPlayer("Innovate Partners", "19%", "Challenger"),
+        KeyPlayer("Emerging Tech Inc", "12%", "Fast Follower"),
+    ],
+    "funding_trends": {
+        "total_2024_funding_usd": 4500000000,
+        "deal_count": 156,
+        "average_deal_size_usd": 28800000,
+        "trend": "accelerating",
+    },
+    "regulatory_considerations": [
+        "Increasing regulatory scrutiny expected",
+        "New compliance frameworks emerging",
+        "International standardization efforts underway",
+    ],
+    "commercial_viability": {
+        "score": 8.2,
+        "reasoning": None,
+    },
+    "market_timing": {
+        "recommendation": "favorable",
+        "window": "18-24 months",
+        "rationale": "Technology maturity aligning with market demand",
+    },
+}
+
+_TECH_TREND_SKELETON: Dict[str, Any] = {
+    "emerging_themes": None,
+    "trl_assessment": {
+        "current_trl": 6,
+        "expected_trl_2026": 8,
+        "gap_areas": ["Scale validation", "Production hardening"],
+    },
+    "key_research_groups": [
+        ResearchGroup("MIT AI Lab", "Foundational algorithms", 12500),
+        ResearchGroup("Stanford NLP Group", "Applied systems", 9800),
+        ResearchGroup("DeepMind Research", "Advanced architectures", 8900),
+    ],
+    "maturation_timeline": {
+        "lab_prototype": "2023",
+        "pilot_deployment": "2025",
+        "commercial_scale": "2027",
+        "market_saturation": "2030",
+    },
+    "breakthrough_indicators": [
+        "Recent papers show 40% efficiency improvements",
+        "Major tech companies increasing R&D investment",
+        "Open source ecosystem maturing rapidly",
+    ],
+    "research_momentum": {
+        "score": 0.85,
+        "trend": "accelerating",
+        "publication_growth": "35% YoY",
+    },
+    "key_insights": None,
+}
+
+_VERIFICATION_METHODOLOGY = "Epistemic Verification Protocol (EVP) with multi-source validation"
+
+_WHITESPACE_SKELETON: List[Dict[str, Any]] = [
+    {
+        "title": None,
+        "description": None,
+        "opportunity_type": "technology_gap",
+        "confidence_score": 0.87,
+        "supporting_evidence": [
+            "Patent landscape shows limited coverage",
+            "Market research indicates high demand",
+            "Technical feasibility validated by recent papers",
+        ],
+        "potential_impact": "high",
+        "time_sensitivity": "urgent",
+        "competitive_landscape": "3-5 startups attempting, no clear leader",
+        "recommended_actions": [
+            "File provisional patents in key areas",
+            "Build proof of concept within 6 months",
+            "Establish partnerships with key players",
+        ],
+        "estimated_market_size_usd": 2500000000,
+    },
+    {
+        "title": None,
+        "description": None,
+        "opportunity_type": "market_gap",
+        "confidence_score": 0.82,
+        "supporting_evidence": [
+            "Regulatory mandates pending",
+            "Enterprise survey data shows pain point",
+            "Limited IP coverage in security layer",
+        ],
+        "potential_impact": "high",
+        "time_sensitivity": "moderate",
+        "competitive_landscape": "Legacy players slow to adapt",
+        "recommended_actions": [
+            "Develop compliance-first architecture",
+            "Target financial services vertical first",
+            "Build certification partnerships",
+        ],
+        "estimated_market_size_usd": 1800000000,
+    },
+    {
+        "title": None,
+        "description": None,
+        "opportunity_type": "ecosystem_gap",
+        "confidence_score": 0.78,
+        "supporting_evidence": [
+            "GitHub activity analysis shows fragmentation",
+            "Developer surveys indicate tooling pain",
+            "No dominant open-source standard emerged",
+        ],
+        "potential_impact": "medium",
+        "time_sensitivity": "moderate",
+        "competitive_landscape": "Multiple fragmented projects",
+        "recommended_actions": [
+            "Launch open-source initiative",
+            "Build enterprise support model",
+            "Establish developer community",
+        ],
+        "estimated_market_size_usd": 500000000,
+    },
+    {
+        "title": None,
+        "description": None,
+        "opportunity_type": "standards_gap",
+        "confidence_score": 0.75,
+        "supporting_evidence": [
+            "Industry consortia forming",
+            "Patent filings show interest",
+            "Technical specifications lacking",
+        ],
+        "potential_impact": "high",
+        "time_sensitivity": "low",
+        "competitive_landscape": "Early stage opportunity",
+        "recommended_actions": [
+            "Join standards bodies",
+            "Publish reference implementations",
+            "Build industry alliance",
+        ],
+        "estimated_market_size_usd": 1200000000,
+    },
+]
+
+_SYNTHESIS_SKELETON: Dict[str, Any] = {
+    "headline": None,
+    "key_finding": None,
+    "executive_summary": None,
+    "recommended_next_steps": [
+        "Commission detailed technical feasibility study for top 2 opportunities",
+        "Engage IP counsel for provisional patent strategy",
+        "Initiate partnership discussions with identified potential collaborators",
+        "Develop 90-day proof of concept roadmap",
+    ],
+    "confidence_score": 0.84,
+    "risk_factors": [
+        "Regulatory uncertainty in key jurisdictions",
+        "Talent acquisition challenges in specialized areas",
+        "Potential incumbent response acceleration",
+    ],
+    "success_factors": [
+        "First-mover advantage in whitespace areas",
+        "Strong technical foundations available",
+        "Market timing favorable",
+    ],
+}
+
+# Query-dependent strings, formatted with {q} bound to the query
+_PATENT_THEME_TEMPLATES = (
+    "Advanced {q} system architecture",
+    "Machine learning applications in {q}",
+    "Distributed {q} protocols",
+    "Security mechanisms for {q}",
+)
+_PATENT_WHITESPACE_TEMPLATES = (
+    "Integration of {q} with edge computing",
+    "Privacy-preserving {q} implementations",
+    "Cross-platform {q} interoperability",
+)
+_MARKET_REASONING_TEMPLATE = "Strong market fundamentals for {q} with proven business models"
+_TECH_THEME_TEMPLATES = (
+    "Neural architectures for {q}",
+    "Federated approaches to {q}",
+    "Quantum-resistant {q} methods",
+    "Sustainable {q} implementations",
+)
+_TECH_INSIGHT_TEMPLATES = (
+    "Research in {q} is accelerating with 35% YoY publication growth",
+    "Major breakthrough expected in hybrid {q} architectures",
+    "Industry-academia collaboration strengthening",
+)
+_WHITESPACE_TEMPLATES = (
+    (
+        "AI-Enhanced {q} Automation Platform",
+        "Gap identified between current {q} capabilities and market demand for intelligent automation. No dominant player has captured this intersection.",
+    ),
+    (
+        "Enterprise-Grade {q} Security Suite",
+        "Security requirements for {q} implementations significantly outpace current solutions. Regulatory pressure creating urgency.",
+    ),
+    (
+        "Open-Source {q} Development Framework",
+        "Developer ecosystem lacks comprehensive tooling for {q} applications. Community appetite for standardized frameworks.",
+    ),
+    (
+        "Cross-Platform {q} Interoperability Layer",
+        "Lack of standardized protocols preventing {q} adoption in heterogeneous environments.",
+    ),
+)
+_SYNTHESIS_HEADLINE_TEMPLATE = "Significant Innovation Opportunities Identified in {q} Landscape"
+_SYNTHESIS_KEY_FINDING_TEMPLATE = "Analysis reveals 4 major whitespace opportunities in the {q} sector with combined addressable market exceeding $6 billion. Immediate action recommended on AI automation and security verticals."
+_SYNTHESIS_SUMMARY_TEMPLATE = "Our multi-agent analysis of the {q} landscape has uncovered significant innovation opportunities that align strong technical feasibility with proven market demand. The convergence of maturing technology (TRL 6-7), favorable regulatory environment, and fragmented competitive landscape creates an optimal entry window for strategic investments."
+
+
+# Audio brief script; the whole body is scanned once here rather than on every call
+_AUDIO_TEMPLATE = string.Template("""Welcome to your NEXUS-R&D Innovation Opportunity Brief for ${q}.
 
 [PAUSE]
 
@@ -310,4 +363,233 @@ The overall confidence score for this analysis is 84 percent, based on verificat
 Time is critical. The optimal patent filing window is within the next six to twelve months. I strongly recommend scheduling a strategy session within the next two weeks to capitalize on these opportunities.
 
 This concludes your NEXUS-R&D Innovation Opportunity Brief. Full report details are available in your dashboard.
-"""
+""")
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples"""
+    if isinstance(value, dict):
+        # Interned keys let payloads loaded from the disk cache share key
+        # objects with the literals, so lookups hit the identity fast path
+        return MappingProxyType({sys.intern(k): _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _seed(*parts: str) -> int:
+    """Stable per-input seed; unlike hash(), identical across processes"""
+    return zlib.crc32("\x1f".join(parts).encode("utf-8"))
+
+
+def json_default(value: Any) -> Any:
+    """orjson default that encodes frozen demo mappings; anything else becomes str"""
+    if isinstance(value, Mapping):
+        return dict(value)
+    return str(value)
+
+
+# Persistent cache beneath the in-process LRU, so demo payloads survive worker restarts
+_DEMO_CACHE_DIR = os.getenv("NEXUS_DEMO_CACHE_DIR", ".nexus_demo_cache")
+_DEMO_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# Part of every entry's key; bump it whenever the skeletons, templates or
+# seeding change so payloads cached by an earlier deploy are not served
+_DEMO_CACHE_VERSION = 2
+_disk_cache: Optional["diskcache.Cache"] = None
+
+
+def _get_disk_cache() -> Optional["diskcache.Cache"]:
+    """Get the demo data disk cache, if diskcache is installed"""
+    global _disk_cache
+    if _disk_cache is None and DISKCACHE_AVAILABLE:
+        _disk_cache = diskcache.Cache(_DEMO_CACHE_DIR)
+    return _disk_cache
+
+
+def _demo_cached(builder: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Memoize a demo builder in memory and on disk, freezing the result"""
+    @lru_cache(maxsize=256)
+    @wraps(builder)
+    def cached(key: Any) -> Any:
+        cache = _get_disk_cache()
+        if cache is None:
+            return _freeze(builder(key))
+        
+        cache_key = (_DEMO_CACHE_VERSION, builder.__name__, key)
+        try:
+            blob = cache.get(cache_key)
+            if blob is not None:
+                return _freeze(_restore_rows(orjson.loads(blob)))
+        except Exception as e:
+            logger.warning(f"Demo cache read failed: {e}")
+        
+        result = builder(key)
+        try:
+            cache.set(cache_key, orjson.dumps(result), expire=_DEMO_CACHE_TTL_SECONDS)
+        except Exception as e:
+            logger.warning(f"Demo cache write failed: {e}")
+        return _freeze(result)
+    
+    return cached
+
+
+@_demo_cached
+def _patent_analysis(query: str) -> Mapping[str, Any]:
+    """Generate demo patent analysis data"""
+    subs = {"q": query}
+    return {
+        **_PATENT_SKELETON,
+        "key_technology_themes": [t.format_map(subs) for t in _PATENT_THEME_TEMPLATES],
+        "whitespace_areas": [t.format_map(subs) for t in _PATENT_WHITESPACE_TEMPLATES],
+    }
+
+
+@_demo_cached
+def _market_analysis(query: str) -> Mapping[str, Any]:
+    """Generate demo market analysis data"""
+    base_size = (_seed(query) % 151 + 50) * 1000000000  # $50B-$200B, fixed per query
+    return {
+        **_MARKET_SKELETON,
+        "market_size_assessment": {
+            **_MARKET_SKELETON["market_size_assessment"],
+            "current_size_usd": base_size,
+            "projected_2028_usd": base_size * 2.5,
+        },
+        "commercial_viability": {
+            **_MARKET_SKELETON["commercial_viability"],
+            "reasoning": _MARKET_REASONING_TEMPLATE.format_map({"q": query}),
+        },
+    }
+
+
+@_demo_cached
+def _tech_trend_analysis(query: str) -> Mapping[str, Any]:
+    """Generate demo technology trend analysis data"""
+    subs = {"q": query}
+    return {
+        **_TECH_TREND_SKELETON,
+        "emerging_themes": [t.format_map(subs) for t in _TECH_THEME_TEMPLATES],
+        "key_insights": [t.format_map(subs) for t in _TECH_INSIGHT_TEMPLATES],
+    }
+
+
+@_demo_cached
+def _verification_result(claims: Tuple[str, ...]) -> Mapping[str, Any]:
+    """Generate demo verification results"""
+    claims = claims[:10]
+    n = len(claims)
+    
+    # Draw every claim's confidence and source count in one vectorized call each
+    rng = np.random.default_rng(_seed(*claims))
+    confidences = rng.uniform(0.65, 0.95, size=n)
+    rounded = confidences.round(2)
+    source_counts = rng.integers(2, 6, size=n)
+    verified = confidences > 0.8
+    
+    verified_claims = [
+        {
+            "claim_id": i + 1,
+            "original_claim": claim[:200],
+            "verification_status": "verified" if is_verified else "partially_verified",
+            "confidence_score": score,
+            "supporting_sources": sources,
+            "contradicting_evidence": "none" if confidence > 0.85 else "minor discrepancies",
+        }
+        for i, (claim, confidence, score, sources, is_verified) in enumerate(zip(
+            claims, confidences.tolist(), rounded.tolist(), source_counts.tolist(), verified.tolist()
+        ))
+    ]
+    
+    avg_confidence = float(rounded.mean()) if n else 0.75
+    verified_count = int(verified.sum())
+    
+    return {
+        "verified_claims": verified_claims,
+        "summary": {
+            "total_claims_checked": n,
+            "verified_count": verified_count,
+            "partially_verified_count": n - verified_count,
+            "average_confidence": round(avg_confidence, 2),
+        },
+        "methodology": _VERIFICATION_METHODOLOGY,
+    }
+
+
+@_demo_cached
+def _whitespace_opportunities(query: str) -> Sequence[Mapping[str, Any]]:
+    """Generate demo whitespace opportunities"""
+    subs = {"q": query}
+    return [
+        {
+            **skeleton,
+            "title": title.format_map(subs),
+            "description": description.format_map(subs),
+        }
+        for skeleton, (title, description) in zip(_WHITESPACE_SKELETON, _WHITESPACE_TEMPLATES)
+    ]
+
+
+@_demo_cached
+def _synthesis_report(query: str) -> Mapping[str, Any]:
+    """Generate demo synthesis report data"""
+    subs = {"q": query}
+    return {
+        **_SYNTHESIS_SKELETON,
+        "headline": _SYNTHESIS_HEADLINE_TEMPLATE.format_map(subs),
+        "key_finding": _SYNTHESIS_KEY_FINDING_TEMPLATE.format_map(subs),
+        "executive_summary": _SYNTHESIS_SUMMARY_TEMPLATE.format_map(subs),
+    }
+
+
+@_demo_cached
+def _audio_script(query: str) -> str:
+    """Generate demo audio brief script"""
+    return _AUDIO_TEMPLATE.substitute(q=query)
+
+
+class DemoDataProvider:
+    """
+    Provides realistic demo data for all NEXUS-R&D analysis types.
+    Used when Gemini API quota is exceeded or unavailable.
+    
+    Results are memoized per input and shared between callers as
+    read-only views (mappings and tuples); encode them with
+    default=json_default. Randomized values are seeded from the
+    input, so the same query always produces the same output.
+    """
+    
+    @staticmethod
+    def get_patent_analysis(query: str) -> Mapping[str, Any]:
+        """Generate demo patent analysis data"""
+        return _patent_analysis(query)
+    
+    @staticmethod
+    def get_market_analysis(query: str) -> Mapping[str, Any]:
+        """Generate demo market analysis data"""
+        return _market_analysis(query)
+    
+    @staticmethod
+    def get_tech_trend_analysis(query: str) -> Mapping[str, Any]:
+        """Generate demo technology trend analysis data"""
+        return _tech_trend_analysis(query)
+    
+    @staticmethod
+    def get_verification_result(claims: List[str]) -> Mapping[str, Any]:
+        """Generate demo verification results"""
+        return _verification_result(tuple(claims))
+    
+    @staticmethod
+    def get_whitespace_opportunities(query: str) -> Sequence[Mapping[str, Any]]:
+        """Generate demo whitespace opportunities"""
+        return _whitespace_opportunities(query)
+    
+    @staticmethod
+    def get_synthesis_report(query: str) -> Mapping[str, Any]:
+        """Generate demo synthesis report data"""
+        return _synthesis_report(query)
+    
+    @staticmethod
+    def get_audio_script(query: str, report: Dict[str, Any]) -> str:
+        """Generate demo audio brief script"""
+        return _audio_script(query)
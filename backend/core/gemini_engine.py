@@ -4,42 +4,304 @@ Integration with Google Gemini 3 for AI-powered research synthesis
 """
 
 import asyncio
-from typing import Optional, List, Dict, Any
+import hashlib
+import httpx
+import orjson
+import re
+import sys
+from contextlib import aclosing, asynccontextmanager
+from typing import Optional, AsyncIterator, Callable, List, Dict, Any, Mapping, Sequence
 from google import genai
 from google.genai import types
+from cachetools import TTLCache
+from pydantic import BaseModel
 from loguru import logger
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_random_exponential
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+try:
+    from aiolimiter import AsyncLimiter
+    AIOLIMITER_AVAILABLE = True
+except ImportError:
+    AIOLIMITER_AVAILABLE = False
 
 from config import get_settings
-from core.demo_data import DemoDataProvider
+from core.demo_data import DemoDataProvider, json_default
 
 
-class GeminiEngine:
-    """
-    Gemini 3 AI Engine for NEXUS-R&D
-    Handles all AI-powered analysis and synthesis tasks
-    """
+# Token budget for each data block embedded in a prompt
+_FORMAT_TOKEN_BUDGET = 2000
+_CHARS_PER_TOKEN = 4
+_tokenizer = None
+
+
+def _get_tokenizer():
+    """Get the tiktoken encoding used to size prompt data, if available"""
+    global _tokenizer
+    if _tokenizer is None and TIKTOKEN_AVAILABLE:
+        try:
+            _tokenizer = tiktoken.get_encoding("cl100k_base")
+        except Exception as e:
+            logger.warning(f"tiktoken encoding unavailable, sizing by characters: {e}")
+    return _tokenizer
+
+
+def count_tokens(text: str) -> int:
+    """Count the tokens in text, estimating from its length without tiktoken"""
+    tokenizer = _get_tokenizer()
+    if tokenizer is None:
+        return len(text) // _CHARS_PER_TOKEN
+    return len(tokenizer.encode_ordinary(text))
+
+
+def _max_items_for_budget(items: Any, budget_tokens: int) -> int:
+    """Count how many leading items fit in the token budget (estimated from compact JSON)"""
+    budget_chars = budget_tokens * _CHARS_PER_TOKEN
+    used = 0
+    for count, item in enumerate(items):
+        if isinstance(item, BaseModel):
+            used += len(item.model_dump_json())
+        else:
+            used += len(orjson.dumps(item, option=orjson.OPT_NON_STR_KEYS, default=json_default))
+        if used > budget_chars:
+            return max(count, 1)
+    return len(items)
+
+
+def _truncate_to_tokens(text: str, budget_tokens: int) -> str:
+    """Cut text to at most budget_tokens tokens, on a token boundary"""
+    if len(text) <= budget_tokens:
+        return text
+    tokenizer = _get_tokenizer()
+    if tokenizer is None:
+        return text[:budget_tokens * _CHARS_PER_TOKEN]
+    tokens = tokenizer.encode_ordinary(text)
+    if len(tokens) <= budget_tokens:
+        return text
+    return tokenizer.decode(tokens[:budget_tokens])
+
+
+# First fenced code block (```json or bare ```), tolerating a missing closing fence
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)(?:```|$)", re.DOTALL)
+
+# Responses above this temperature vary too much between calls to reuse
+_MAX_CACHEABLE_TEMPERATURE = 0.5
+
+
+def _response_cache_key(
+    task_type: str,
+    prompt: str,
+    use_thinking: bool,
+    temperature: float,
+    max_tokens: int,
+    model_override: Optional[str] = None,
+) -> str:
+    """Hash the parameters that determine a generated response"""
+    payload = orjson.dumps([task_type, prompt, use_thinking, round(temperature, 2), max_tokens, model_override])
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _is_json_document(text: str) -> bool:
+    """Check whether text parses to an object or a non-empty array of objects"""
+    try:
+        value = orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return False
+    if isinstance(value, list):
+        # A bare "[1]" in prose is a citation, not the response
+        return bool(value) and all(isinstance(item, dict) for item in value)
+    return isinstance(value, dict)
+
+
+class _JsonObjectScanner:
+    """Incrementally finds the first complete top-level JSON value ({...} or [...]) in streamed text"""
     
     def __init__(self):
-        self.settings = get_settings()
-        self.client = genai.Client(api_key=self.settings.gemini_api_key)
-        self.model = self.settings.gemini_model
-        self.thinking_model = self.settings.gemini_thinking_model
-        
-        # System prompts for different tasks
-        self.system_prompts = {
-            "patent_analysis": self._get_patent_analysis_prompt(),
-            "market_analysis": self._get_market_analysis_prompt(),
-            "tech_trend": self._get_tech_trend_prompt(),
-            "verification": self._get_verification_prompt(),
-            "synthesis": self._get_synthesis_prompt(),
-            "whitespace": self._get_whitespace_prompt(),
-        }
-        
-        logger.info(f"GeminiEngine initialized with model: {self.model}")
+        self.start = -1
+        self.end = -1
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
     
-    def _get_patent_analysis_prompt(self) -> str:
-        return """You are an expert patent analyst working for NEXUS-R&D, a cutting-edge innovation intelligence system.
+    def feed(self, buffer: str) -> bool:
+        """Scan the newly appended part of buffer; True once a value has closed and parses"""
+        i = self._pos
+        while i < len(buffer):
+            ch = buffer[i]
+            i += 1
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch in "{[":
+                if self._depth == 0:
+                    self.start = i - 1
+                self._depth += 1
+            elif self._depth == 0:
+                # Prose or a code fence before the value
+                continue
+            elif ch == '"':
+                self._in_string = True
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    if not _is_json_document(buffer[self.start:i]):
+                        # Brackets in prose; rescan from just after the false start
+                        i = self.start + 1
+                        self.start = -1
+                        self._in_string = False
+                        self._escaped = False
+                        continue
+                    self.end = i
+                    return True
+        self._pos = len(buffer)
+        return False
+
+
+def _response_text(response: Any) -> str:
+    """Join the text parts of the first candidate once, skipping thought parts"""
+    candidates = getattr(response, "candidates", None)
+    if not candidates or candidates[0].content is None:
+        return ""
+    return "".join(
+        part.text for part in (candidates[0].content.parts or [])
+        if part.text and not getattr(part, "thought", False)
+    )
+
+
+def _is_unavailable(error: Exception) -> bool:
+    """Check for a 503 / overloaded error, where the next model should be tried"""
+    error_str = str(error)
+    return "503" in error_str or "UNAVAILABLE" in error_str or "overloaded" in error_str.lower()
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """Check for a 429 / quota error"""
+    error_str = str(error)
+    return "429" in error_str or "RESOURCE_EXHAUSTED" in error_str
+
+
+# Fixed instruction blocks for each analysis. They lead every prompt, with the
+# query-specific data appended after them, so consecutive calls share an
+# identical token prefix that Gemini's implicit caching can reuse.
+_PATENT_ANALYSIS_INSTRUCTIONS = """Analyze the patent data below for the research query.
+
+Provide a structured analysis including:
+1. Key technology themes identified
+2. Dominant assignees and their apparent strategies
+3. Patent filing trends (increasing/decreasing/stable)
+4. Citation network insights (foundational vs emerging patents)
+5. Potential whitespace areas (gaps in patent coverage)
+6. Competitive landscape assessment
+
+Format your response as structured JSON."""
+
+_MARKET_ANALYSIS_INSTRUCTIONS = """Analyze the market data below for the research query.
+
+Provide a structured analysis including:
+1. Market size and growth assessment
+2. Key players and competitive positioning
+3. Funding trends and investment signals
+4. Regulatory considerations
+5. Commercial viability score (1-10) with reasoning
+6. Market timing recommendations
+
+Format your response as structured JSON."""
+
+_TECH_TREND_INSTRUCTIONS = """Analyze the research paper data below for the query.
+
+Provide a structured analysis including:
+1. Emerging research themes
+2. Technology Readiness Level (TRL) assessment
+3. Key research groups and collaboration networks
+4. Predicted technology maturation timeline
+5. Breakthrough indicators
+6. Research momentum assessment
+
+Format your response as structured JSON."""
+
+_VERIFICATION_INSTRUCTIONS = """VERIFICATION CHALLENGE: Critically evaluate the claims below.
+
+For EACH claim:
+1. Search for supporting evidence in the data
+2. Identify any contradicting evidence
+3. Assess source credibility
+4. Calculate a confidence score (0-100%)
+5. Provide verification status (verified/partially_verified/unverified/contradicted)
+
+Apply Bayesian reasoning. Be SKEPTICAL. Cross-reference at least 3 sources.
+Format your response as structured JSON with a 'verified_claims' array."""
+
+_WHITESPACE_INSTRUCTIONS = """INNOVATION WHITESPACE DETECTION
+
+Using the patent, market and technology analyses below, identify innovation whitespace opportunities by looking for:
+1. Technology areas with mature research but sparse patent coverage
+2. Market segments with high demand but low R&D investment
+3. Convergence points where multiple patent families could integrate
+4. Timing windows for first-mover advantage
+5. Adjacent applications of existing technologies
+
+For each opportunity, provide:
+- Title and description
+- Opportunity type (technology_gap/market_gap/integration/timing)
+- Confidence score (0-100%)
+- Supporting evidence
+- Potential impact (high/medium/low)
+- Time sensitivity (urgent/moderate/flexible)
+- Recommended actions
+
+Return as JSON array of opportunities, ranked by potential impact."""
+
+_SYNTHESIS_INSTRUCTIONS = """FINAL SYNTHESIS: Create an Innovation Opportunity Report from the analyses below.
+
+Create a comprehensive synthesis including:
+
+1. EXECUTIVE SUMMARY (2-3 paragraphs)
+   - Key finding headline
+   - Top 3 opportunities
+   - Recommended next steps
+
+2. STRATEGIC RECOMMENDATIONS (5-7 specific actions)
+   - Each with rationale and priority level
+
+3. TEMPORAL FORECAST
+   - Optimal timing for action
+   - Competitive threat timeline
+   - Technology maturation predictions
+
+4. OVERALL ASSESSMENT
+   - Confidence score (0-100%)
+   - Risk factors
+   - Success factors
+
+Format as structured JSON suitable for report generation."""
+
+_AUDIO_SCRIPT_INSTRUCTIONS = """Create a 5-minute executive audio brief script from the Innovation Opportunity Report below.
+
+The script should:
+1. Be conversational and engaging
+2. Start with a compelling hook
+3. Highlight the top 3 opportunities
+4. Include key statistics and findings
+5. End with clear call-to-action
+6. Be approximately 750 words (5 min at 150 wpm)
+
+Write the script in a natural, professional speaking style.
+Include [PAUSE] markers for natural breaks.
+Do not include any stage directions, just the spoken text."""
+
+
+def _patent_analysis_prompt() -> str:
+    return """You are an expert patent analyst working for NEXUS-R&D, a cutting-edge innovation intelligence system.
 
 Your role is to analyze patent data and extract actionable insights. You should:
 1. Identify key technology trends from patent filings
@@ -51,8 +313,9 @@ Your role is to analyze patent data and extract actionable insights. You should:
 Always structure your analysis clearly and provide confidence scores for your findings.
 Be specific and cite patent numbers when relevant."""
 
-    def _get_market_analysis_prompt(self) -> str:
-        return """You are an expert market analyst working for NEXUS-R&D, a cutting-edge innovation intelligence system.
+
+def _market_analysis_prompt() -> str:
+    return """You are an expert market analyst working for NEXUS-R&D, a cutting-edge innovation intelligence system.
 
 Your role is to analyze market data and assess commercial viability. You should:
 1. Evaluate market size and growth potential
@@ -63,8 +326,9 @@ Your role is to analyze market data and assess commercial viability. You should:
 
 Provide specific numbers and data points when available. Always indicate the confidence level of market projections."""
 
-    def _get_tech_trend_prompt(self) -> str:
-        return """You are an expert technology analyst working for NEXUS-R&D, a cutting-edge innovation intelligence system.
+
+def _tech_trend_prompt() -> str:
+    return """You are an expert technology analyst working for NEXUS-R&D, a cutting-edge innovation intelligence system.
 
 Your role is to analyze research papers and track technology evolution. You should:
 1. Identify emerging research themes and paradigms
@@ -75,8 +339,9 @@ Your role is to analyze research papers and track technology evolution. You shou
 
 Use academic rigor in your analysis. Cite papers and research groups when relevant."""
 
-    def _get_verification_prompt(self) -> str:
-        return """You are a skeptical verification agent working for NEXUS-R&D. Your role is CRITICAL.
+
+def _verification_prompt() -> str:
+    return """You are a skeptical verification agent working for NEXUS-R&D. Your role is CRITICAL.
 
 You must CHALLENGE and VERIFY every claim presented to you. You should:
 1. Actively search for CONTRADICTING evidence
@@ -88,8 +353,9 @@ You must CHALLENGE and VERIFY every claim presented to you. You should:
 Never accept claims at face value. Be adversarial in your verification approach.
 A claim with less than 5 supporting sources should have LOW confidence."""
 
-    def _get_synthesis_prompt(self) -> str:
-        return """You are the master synthesis agent for NEXUS-R&D, responsible for creating the final Innovation Opportunity Report.
+
+def _synthesis_prompt() -> str:
+    return """You are the master synthesis agent for NEXUS-R&D, responsible for creating the final Innovation Opportunity Report.
 
 Your role is to:
 1. Merge insights from patent, market, and technology analyses
@@ -101,8 +367,9 @@ Your role is to:
 Your synthesis should be actionable, specific, and forward-looking.
 Always include confidence scores and verification status for key claims."""
 
-    def _get_whitespace_prompt(self) -> str:
-        return """You are an innovation whitespace detector for NEXUS-R&D.
+
+def _whitespace_prompt() -> str:
+    return """You are an innovation whitespace detector for NEXUS-R&D.
 
 Your specialized role is to identify GAPS and OPPORTUNITIES by:
 1. Finding technology areas with mature science but no patents
@@ -114,6 +381,81 @@ Your specialized role is to identify GAPS and OPPORTUNITIES by:
 Think creatively but ground your findings in the data provided.
 Rank opportunities by potential impact and time sensitivity."""
 
+
+# Builds each task's system prompt on first use; GeminiEngine interns and keeps them
+_PROMPT_FACTORIES: Dict[str, Callable[[], str]] = {
+    "patent_analysis": _patent_analysis_prompt,
+    "market_analysis": _market_analysis_prompt,
+    "tech_trend": _tech_trend_prompt,
+    "verification": _verification_prompt,
+    "synthesis": _synthesis_prompt,
+    "whitespace": _whitespace_prompt,
+}
+
+
+class GeminiEngine:
+    """
+    Gemini 3 AI Engine for NEXUS-R&D
+    Handles all AI-powered analysis and synthesis tasks
+    """
+    
+    def __init__(self):
+        self.settings = get_settings()
+        
+        # One keep-alive HTTP/2 pool reused by every request, instead of
+        # paying a TCP+TLS handshake per generate_content call
+        pool_limits = httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=300)
+        self.client = genai.Client(
+            api_key=self.settings.gemini_api_key,
+            http_options=types.HttpOptions(
+                async_client_args={"http2": True, "limits": pool_limits},
+            ),
+        )
+        self.model = self.settings.gemini_model
+        self.thinking_model = self.settings.gemini_thinking_model
+        self.structured_model = self.settings.gemini_structured_model
+        
+        # Bounds concurrent Gemini calls when analyses run in parallel
+        self._sem = asyncio.Semaphore(self.settings.gemini_max_concurrency)
+        self._inflight_gauge = 0
+        
+        # Per-model (requests/min, tokens/min) limiters, created on first use
+        self._rate_limiters: Dict[str, tuple] = {}
+        
+        # Shared calls for identical requests currently in flight
+        self._inflight: Dict[str, asyncio.Task] = {}
+        
+        # Bounded TTL cache of generated responses
+        self._response_cache: Optional[TTLCache] = (
+            TTLCache(maxsize=1024, ttl=3600) if self.settings.enable_response_cache else None
+        )
+        
+        # System prompts for different tasks, built lazily by _prompt_for()
+        self._prompts: Dict[str, str] = {}
+        self._prompt_tokens: Dict[str, int] = {}
+        
+        logger.info(f"GeminiEngine initialized with model: {self.model}")
+    
+    def _prompt_for(self, task_type: str) -> str:
+        """Get the system prompt for a task type, falling back to synthesis"""
+        if task_type not in _PROMPT_FACTORIES:
+            task_type = "synthesis"
+        prompt = self._prompts.get(task_type)
+        if prompt is None:
+            prompt = sys.intern(_PROMPT_FACTORIES[task_type]())
+            self._prompts[task_type] = prompt
+            # Counted once, so rate-limit estimates only size the dynamic prompt
+            self._prompt_tokens[task_type] = count_tokens(prompt)
+        return prompt
+    
+    async def warm_up(self) -> None:
+        """Open a pooled connection so the first real request skips the handshake"""
+        try:
+            await self.client.aio.models.get(model=self.model)
+            logger.info("Gemini connection pool warmed up")
+        except Exception as e:
+            logger.warning(f"Gemini warm-up failed: {e}")
+    
     async def generate(
         self,
         prompt: str,
@@ -122,6 +464,8 @@ Rank opportunities by potential impact and time sensitivity."""
         temperature: float = 0.7,
         max_tokens: int = 8192,
         max_retries: int = 2,
+        stream_json: bool = False,
+        model_override: Optional[str] = None,
     ) -> str:
         """
         Generate AI response using Gemini (with automatic model fallback)
@@ -132,12 +476,108 @@ Rank opportunities by potential impact and time sensitivity."""
             use_thinking: Whether to use Deep Think mode
             temperature: Creativity level (0-1)
             max_tokens: Maximum response length
+            stream_json: Stream the response and stop once its JSON value is complete
+            model_override: Model to try first, ahead of the standard fallbacks
             
         Returns:
             Generated text response
         """
+        request_key = _response_cache_key(
+            task_type, prompt, use_thinking, temperature, max_tokens, model_override
+        )
+        
+        # Low-temperature outputs are close to deterministic, so identical
+        # requests (re-runs, demo flows) can reuse an earlier response
+        cacheable = self._response_cache is not None and temperature <= _MAX_CACHEABLE_TEMPERATURE
+        if cacheable:
+            cached = self._response_cache.get(request_key)
+            if cached is not None:
+                logger.debug(f"Response cache hit for {task_type}")
+                return cached
+        
+        # Coalesce identical in-flight requests onto a single Gemini call
+        task = self._inflight.get(request_key)
+        if task is None:
+            task = asyncio.ensure_future(self._generate_uncached(
+                prompt, task_type, use_thinking, temperature, max_tokens, max_retries,
+                stream_json, model_override,
+            ))
+            self._inflight[request_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(request_key, None))
+        else:
+            logger.debug(f"Joining in-flight request for {task_type}")
+        
+        # Shielded so one caller's cancellation doesn't cancel the shared call
+        response = await asyncio.shield(task)
+        # A stream that never produced a parseable value is not worth reusing
+        if cacheable and response and (not stream_json or _is_json_document(response)):
+            self._response_cache[request_key] = response
+        return response
+    
+    async def _generate_uncached(
+        self,
+        prompt: str,
+        task_type: str,
+        use_thinking: bool,
+        temperature: float,
+        max_tokens: int,
+        max_retries: int,
+        stream_json: bool = False,
+        model_override: Optional[str] = None,
+    ) -> str:
+        """Run the model fallback chain with retries"""
         last_error = None
         
+        models_to_try = self._model_chain(task_type, use_thinking, model_override)
+        
+        # Sent as system_instruction rather than prepended to the prompt, so
+        # the instruction stays a stable, separately cacheable prefix
+        system_prompt = self._prompt_for(task_type)
+        
+        for model_config in models_to_try:
+            config_name = model_config["name"]
+            
+            try:
+                # Jittered exponential backoff desynchronizes concurrent callers;
+                # an unavailable model is not retried but skipped straight away
+                async for attempt in AsyncRetrying(
+                    wait=wait_random_exponential(multiplier=1, max=30),
+                    stop=stop_after_attempt(max_retries),
+                    retry=retry_if_exception(lambda e: not _is_unavailable(e)),
+                    before_sleep=lambda state: logger.warning(
+                        f"{config_name} failed for {task_type} "
+                        f"(attempt {state.attempt_number}/{max_retries}): "
+                        f"{state.outcome.exception()}, retrying..."
+                    ),
+                    reraise=True,
+                ):
+                    with attempt:
+                        if stream_json:
+                            return await self._stream_json_once(
+                                model_config, prompt, system_prompt, task_type, temperature, max_tokens
+                            )
+                        return await self._call_once(
+                            model_config, prompt, system_prompt, task_type, temperature, max_tokens
+                        )
+            except Exception as e:
+                last_error = e
+                if _is_unavailable(e):
+                    logger.warning(f"{config_name} unavailable: {e}")
+                elif _is_rate_limited(e):
+                    logger.info(f"Moving to next fallback after rate limit on {config_name}")
+                else:
+                    logger.error(f"Gemini generation error on {config_name}: {e}")
+        
+        # If all retries failed, raise to trigger fallback
+        raise last_error if last_error else Exception("Gemini generation failed")
+    
+    def _model_chain(
+        self,
+        task_type: str,
+        use_thinking: bool,
+        model_override: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Models to try in order for a task"""
         # 3-tier fallback chain:
         # 1. deep-research-pro-preview-12-2025 (primary - autonomous research agent)
         # 2. gemini-3-pro-preview (first fallback - deep thinking)
@@ -157,102 +597,171 @@ Rank opportunities by potential impact and time sensitivity."""
                 {"model": first_fallback, "agent": None, "name": "Gemini 3 Pro"},
                 {"model": second_fallback, "agent": None, "name": "Gemini 2.0 Flash"},
             ]
+        elif model_override:
+            # Template-filling tasks go to the requested (smaller) model,
+            # keeping the fast model as the fallback
+            models_to_try = [{"model": model_override, "agent": None, "name": model_override}]
+            if model_override != second_fallback:
+                models_to_try.append({"model": second_fallback, "agent": None, "name": "Gemini 2.0 Flash"})
         else:
             # For simpler tasks, skip the deep research agent
             models_to_try = [
                 {"model": first_fallback, "agent": None, "name": "Gemini 3 Pro"},
                 {"model": second_fallback, "agent": None, "name": "Gemini 2.0 Flash"},
             ]
+        return models_to_try
+    
+    async def _acquire_rate_limit(
+        self,
+        model_name: str,
+        prompt: str,
+        task_type: str,
+        max_tokens: int,
+    ) -> None:
+        """Wait for RPM/TPM capacity on a model before calling it, instead of hitting 429s"""
+        if not AIOLIMITER_AVAILABLE:
+            return
         
-        for model_config in models_to_try:
-            model_name = model_config["model"]
-            agent_name = model_config.get("agent")
-            config_name = model_config["name"]
-            
-            for attempt in range(max_retries):
-                try:
-                    # Add delay between requests to avoid rate limiting
-                    if attempt > 0:
-                        wait_time = 5 * (2 ** attempt)  # 5, 10, 20 seconds
-                        logger.info(f"Rate limit wait: {wait_time}s before retry {attempt + 1}")
-                        await asyncio.sleep(wait_time)
-                    
-                    system_prompt = self.system_prompts.get(task_type, self.system_prompts["synthesis"])
-                    
-                    # Build config based on whether we're using the deep research agent
-                    if agent_name:
-                        # Deep research agent - use Google Search tool
-                        logger.info(f"Using {config_name} for {task_type}")
-                        config = types.GenerateContentConfig(
-                            temperature=temperature,
-                            max_output_tokens=max_tokens,
-                            tools=[types.Tool(google_search=types.GoogleSearch())],
-                        )
-                        # Note: The agent parameter may require different API structure
-                        # For now, we use the standard approach with grounding
-                        response = await asyncio.to_thread(
-                            self.client.models.generate_content,
-                            model=model_name,
-                            contents=[
-                                types.Content(
-                                    role="user",
-                                    parts=[types.Part(text=f"{system_prompt}\n\n---\n\n{prompt}")]
-                                )
-                            ],
-                            config=config
-                        )
-                    else:
-                        # Standard model - no agent
-                        logger.info(f"Using {config_name} for {task_type}")
-                        response = await asyncio.to_thread(
-                            self.client.models.generate_content,
-                            model=model_name,
-                            contents=[
-                                types.Content(
-                                    role="user",
-                                    parts=[types.Part(text=f"{system_prompt}\n\n---\n\n{prompt}")]
-                                )
-                            ],
-                            config=types.GenerateContentConfig(
-                                temperature=temperature,
-                                max_output_tokens=max_tokens,
-                            )
-                        )
-                    
-                    if response.text:
-                        logger.debug(f"Generated response for {task_type} using {config_name}: {len(response.text)} chars")
-                        # Small delay after successful request to avoid hitting rate limits
-                        await asyncio.sleep(0.5)
-                        return response.text
-                    else:
-                        logger.warning(f"Empty response for {task_type}")
-                        return ""
-                        
-                except Exception as e:
-                    last_error = e
-                    error_str = str(e)
-                    
-                    # Check if it's a 503 overload or other error - switch to fallback model
-                    if "503" in error_str or "UNAVAILABLE" in error_str or "overloaded" in error_str.lower():
-                        logger.warning(f"{config_name} unavailable (attempt {attempt + 1}/{max_retries}): {e}")
-                        # Break inner loop to try next model in fallback chain
-                        break
-                    # Check if it's a rate limit error
-                    elif "429" in error_str or "RESOURCE_EXHAUSTED" in error_str:
-                        logger.warning(f"Rate limited on {config_name} (attempt {attempt + 1}/{max_retries}), will retry...")
-                        if attempt < max_retries - 1:
-                            continue  # Retry with backoff
-                        else:
-                            # Max retries hit, try next model
-                            logger.info(f"Moving to next fallback after rate limit on {config_name}")
-                            break
-                    else:
-                        logger.error(f"Gemini generation error on {config_name} (attempt {attempt + 1}/{max_retries}): {e}")
-                        if attempt < max_retries - 1:
-                            await asyncio.sleep(2)
+        limiters = self._rate_limiters.get(model_name)
+        if limiters is None:
+            limiters = (
+                AsyncLimiter(self.settings.gemini_rpm, 60),
+                AsyncLimiter(self.settings.gemini_tpm, 60),
+            )
+            self._rate_limiters[model_name] = limiters
+        rpm_limiter, tpm_limiter = limiters
         
-        # If all retries failed, raise to trigger fallback
-        raise last_error if last_error else Exception("Gemini generation failed")
+        # Known system prompt size, ~4 chars per prompt token, plus the full output allowance
+        estimated_tokens = min(
+            self._prompt_tokens.get(task_type, 0) + len(prompt) // _CHARS_PER_TOKEN + max_tokens,
+            self.settings.gemini_tpm,
+        )
+        await rpm_limiter.acquire()
+        await tpm_limiter.acquire(estimated_tokens)
+    
+    @asynccontextmanager
+    async def _gemini_slot(self, task_type: str):
+        """Hold one of the GEMINI_MAX_CONCURRENCY call slots, tracking how many are in use"""
+        if self._sem.locked():
+            logger.debug(f"{task_type} waiting for a Gemini slot ({self._inflight_gauge} in flight)")
+        async with self._sem:
+            self._inflight_gauge += 1
+            try:
+                yield
+            finally:
+                self._inflight_gauge -= 1
+    
+    async def _call_once(
+        self,
+        model_config: Dict[str, Any],
+        prompt: str,
+        system_prompt: str,
+        task_type: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> str:
+        """Issue a single generate_content call against one model of the fallback chain"""
+        model_name = model_config["model"]
+        config_name = model_config["name"]
+        
+        # Deep research agent - use Google Search tool for grounding
+        # Note: The agent parameter may require different API structure
+        tools = [types.Tool(google_search=types.GoogleSearch())] if model_config.get("agent") else None
+        
+        logger.info(f"Using {config_name} for {task_type}")
+        await self._acquire_rate_limit(model_name, prompt, task_type, max_tokens)
+        async with self._gemini_slot(task_type):
+            response = await self.client.aio.models.generate_content(
+                model=model_name,
+                contents=[
+                    types.Content(
+                        role="user",
+                        parts=[types.Part(text=prompt)]
+                    )
+                ],
+                config=types.GenerateContentConfig(
+                    system_instruction=system_prompt,
+                    temperature=temperature,
+                    max_output_tokens=max_tokens,
+                    tools=tools,
+                )
+            )
+        
+        text = _response_text(response)
+        if text:
+            usage = getattr(response, "usage_metadata", None)
+            logger.debug(
+                f"Generated response for {task_type} using {config_name}: {len(text)} chars, "
+                f"{getattr(usage, 'cached_content_token_count', None) or 0} cached prompt tokens"
+            )
+            return text
+        
+        logger.warning(f"Empty response for {task_type}")
+        return ""
+    
+    async def _iter_stream(
+        self,
+        model_config: Dict[str, Any],
+        prompt: str,
+        system_prompt: str,
+        task_type: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> AsyncIterator[str]:
+        """Stream text chunks from a single generate_content_stream call"""
+        model_name = model_config["model"]
+        tools = [types.Tool(google_search=types.GoogleSearch())] if model_config.get("agent") else None
+        
+        await self._acquire_rate_limit(model_name, prompt, task_type, max_tokens)
+        async with self._gemini_slot(task_type):
+            stream = await self.client.aio.models.generate_content_stream(
+                model=model_name,
+                contents=[
+                    types.Content(
+                        role="user",
+                        parts=[types.Part(text=prompt)]
+                    )
+                ],
+                config=types.GenerateContentConfig(
+                    system_instruction=system_prompt,
+                    temperature=temperature,
+                    max_output_tokens=max_tokens,
+                    tools=tools,
+                )
+            )
+            async for chunk in stream:
+                text = _response_text(chunk)
+                if text:
+                    yield text
+    
+    async def _stream_json_once(
+        self,
+        model_config: Dict[str, Any],
+        prompt: str,
+        system_prompt: str,
+        task_type: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> str:
+        """Stream one model's response, returning as soon as its JSON value closes"""
+        config_name = model_config["name"]
+        logger.info(f"Streaming {config_name} for {task_type}")
+        
+        buffer = ""
+        scanner = _JsonObjectScanner()
+        async with aclosing(self._iter_stream(
+            model_config, prompt, system_prompt, task_type, temperature, max_tokens
+        )) as chunks:
+            async for text in chunks:
+                buffer += text
+                if scanner.feed(buffer):
+                    # Anything after the value (closing fence, commentary) is dropped
+                    logger.debug(f"JSON value complete for {task_type} after {len(buffer)} chars")
+                    return buffer[scanner.start:scanner.end]
+        
+        if not buffer:
+            logger.warning(f"Empty response for {task_type}")
+        return buffer
     
     async def generate_with_fallback(
         self,
@@ -267,101 +776,76 @@ Rank opportunities by potential impact and time sensitivity."""
         except Exception as e:
             logger.warning(f"Using fallback for {task_type}: {e}")
             if fallback_data is not None:
-                import json
-                return json.dumps(fallback_data)
+                return orjson.dumps(fallback_data, default=json_default).decode()
             return "{}"
 
-    async def analyze_patents(self, patents_data: List[Dict[str, Any]], query: str) -> Dict[str, Any]:
+    async def analyze_patents(self, patents_data: List[Dict[str, Any]], query: str) -> Mapping[str, Any]:
         """Analyze patent data and extract insights"""
-        prompt = f"""Analyze the following patent data for the research query: "{query}"
+        prompt = f"""{_PATENT_ANALYSIS_INSTRUCTIONS}
 
-Patent Data:
-{self._format_data(patents_data[:20])}  # Limit to avoid token limits
-
-Provide a structured analysis including:
-1. Key technology themes identified
-2. Dominant assignees and their apparent strategies
-3. Patent filing trends (increasing/decreasing/stable)
-4. Citation network insights (foundational vs emerging patents)
-5. Potential whitespace areas (gaps in patent coverage)
-6. Competitive landscape assessment
-
-Format your response as structured JSON."""
+---
+QUERY: "{query}"
+---
+PATENT DATA:
+{self._format_data(patents_data)}"""
 
         try:
-            response = await self.generate(prompt, task_type="patent_analysis", temperature=0.3)
+            response = await self.generate(
+                prompt, task_type="patent_analysis", temperature=0.3, model_override=self.structured_model
+            )
             return self._parse_json_response(response)
         except Exception as e:
             logger.warning(f"Patent analysis fallback activated: {e}")
             return DemoDataProvider.get_patent_analysis(query)
 
-    async def analyze_market(self, market_data: Dict[str, Any], query: str) -> Dict[str, Any]:
+    async def analyze_market(self, market_data: Dict[str, Any], query: str) -> Mapping[str, Any]:
         """Analyze market data and assess commercial viability"""
-        prompt = f"""Analyze the following market data for the research query: "{query}"
+        prompt = f"""{_MARKET_ANALYSIS_INSTRUCTIONS}
 
-Market Data:
-{self._format_data(market_data)}
-
-Provide a structured analysis including:
-1. Market size and growth assessment
-2. Key players and competitive positioning
-3. Funding trends and investment signals
-4. Regulatory considerations
-5. Commercial viability score (1-10) with reasoning
-6. Market timing recommendations
-
-Format your response as structured JSON."""
+---
+QUERY: "{query}"
+---
+MARKET DATA:
+{self._format_data(market_data)}"""
 
         try:
-            response = await self.generate(prompt, task_type="market_analysis", temperature=0.3)
+            response = await self.generate(
+                prompt, task_type="market_analysis", temperature=0.3, model_override=self.structured_model
+            )
             return self._parse_json_response(response)
         except Exception as e:
             logger.warning(f"Market analysis fallback activated: {e}")
             return DemoDataProvider.get_market_analysis(query)
 
-    async def analyze_tech_trends(self, papers_data: List[Dict[str, Any]], query: str) -> Dict[str, Any]:
+    async def analyze_tech_trends(self, papers_data: List[Dict[str, Any]], query: str) -> Mapping[str, Any]:
         """Analyze research papers and identify technology trends"""
-        prompt = f"""Analyze the following research paper data for the query: "{query}"
+        prompt = f"""{_TECH_TREND_INSTRUCTIONS}
 
-Research Papers:
-{self._format_data(papers_data[:15])}
-
-Provide a structured analysis including:
-1. Emerging research themes
-2. Technology Readiness Level (TRL) assessment
-3. Key research groups and collaboration networks
-4. Predicted technology maturation timeline
-5. Breakthrough indicators
-6. Research momentum assessment
-
-Format your response as structured JSON."""
+---
+QUERY: "{query}"
+---
+RESEARCH PAPERS:
+{self._format_data(papers_data)}"""
 
         try:
-            response = await self.generate(prompt, task_type="tech_trend", temperature=0.3)
+            response = await self.generate(
+                prompt, task_type="tech_trend", temperature=0.3, model_override=self.structured_model
+            )
             return self._parse_json_response(response)
         except Exception as e:
             logger.warning(f"Tech trend analysis fallback activated: {e}")
             return DemoDataProvider.get_tech_trend_analysis(query)
 
-    async def verify_claims(self, claims: List[str], supporting_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def verify_claims(self, claims: List[str], supporting_data: Dict[str, Any]) -> Mapping[str, Any]:
         """Verify claims using Epistemic Verification Protocol"""
-        prompt = f"""VERIFICATION CHALLENGE: Critically evaluate the following claims.
+        prompt = f"""{_VERIFICATION_INSTRUCTIONS}
 
-Claims to Verify:
+---
+CLAIMS TO VERIFY:
 {self._format_list(claims)}
-
-Supporting Data Available:
-{self._format_data(supporting_data)}
-
-For EACH claim:
-1. Search for supporting evidence in the data
-2. Identify any contradicting evidence
-3. Assess source credibility
-4. Calculate a confidence score (0-100%)
-5. Provide verification status (verified/partially_verified/unverified/contradicted)
-
-Apply Bayesian reasoning. Be SKEPTICAL. Cross-reference at least 3 sources.
-Format your response as structured JSON with a 'verified_claims' array."""
+---
+SUPPORTING DATA AVAILABLE:
+{self._format_data(supporting_data)}"""
 
         try:
             response = await self.generate(
@@ -381,36 +865,21 @@ Format your response as structured JSON with a 'verified_claims' array."""
         market_analysis: Dict[str, Any],
         tech_analysis: Dict[str, Any],
         query: str
-    ) -> List[Dict[str, Any]]:
+    ) -> Sequence[Mapping[str, Any]]:
         """Detect innovation whitespace opportunities"""
-        prompt = f"""INNOVATION WHITESPACE DETECTION for: "{query}"
+        prompt = f"""{_WHITESPACE_INSTRUCTIONS}
 
-Patent Landscape Analysis:
+---
+QUERY: "{query}"
+---
+PATENT LANDSCAPE ANALYSIS:
 {self._format_data(patent_analysis)}
 
-Market Intelligence:
+MARKET INTELLIGENCE:
 {self._format_data(market_analysis)}
 
-Technology Trends:
-{self._format_data(tech_analysis)}
-
-Identify innovation whitespace opportunities by looking for:
-1. Technology areas with mature research but sparse patent coverage
-2. Market segments with high demand but low R&D investment
-3. Convergence points where multiple patent families could integrate
-4. Timing windows for first-mover advantage
-5. Adjacent applications of existing technologies
-
-For each opportunity, provide:
-- Title and description
-- Opportunity type (technology_gap/market_gap/integration/timing)
-- Confidence score (0-100%)
-- Supporting evidence
-- Potential impact (high/medium/low)
-- Time sensitivity (urgent/moderate/flexible)
-- Recommended actions
-
-Return as JSON array of opportunities, ranked by potential impact."""
+TECHNOLOGY TRENDS:
+{self._format_data(tech_analysis)}"""
 
         try:
             response = await self.generate(
@@ -433,10 +902,13 @@ Return as JSON array of opportunities, ranked by potential impact."""
         tech_analysis: Dict[str, Any],
         verification_report: Dict[str, Any],
         whitespace_opportunities: List[Dict[str, Any]],
-    ) -> Dict[str, Any]:
+    ) -> Mapping[str, Any]:
         """Synthesize all analyses into final Innovation Opportunity Report"""
-        prompt = f"""FINAL SYNTHESIS: Create an Innovation Opportunity Report for: "{query}"
+        prompt = f"""{_SYNTHESIS_INSTRUCTIONS}
 
+---
+QUERY: "{query}"
+---
 === PATENT LANDSCAPE ===
 {self._format_data(patent_analysis)}
 
@@ -450,29 +922,7 @@ Return as JSON array of opportunities, ranked by potential impact."""
 {self._format_data(verification_report)}
 
 === WHITESPACE OPPORTUNITIES ===
-{self._format_data(whitespace_opportunities)}
-
-Create a comprehensive synthesis including:
-
-1. EXECUTIVE SUMMARY (2-3 paragraphs)
-   - Key finding headline
-   - Top 3 opportunities
-   - Recommended next steps
-
-2. STRATEGIC RECOMMENDATIONS (5-7 specific actions)
-   - Each with rationale and priority level
-
-3. TEMPORAL FORECAST
-   - Optimal timing for action
-   - Competitive threat timeline
-   - Technology maturation predictions
-
-4. OVERALL ASSESSMENT
-   - Confidence score (0-100%)
-   - Risk factors
-   - Success factors
-
-Format as structured JSON suitable for report generation."""
+{self._format_data(whitespace_opportunities)}"""
 
         try:
             response = await self.generate(
@@ -480,7 +930,8 @@ Format as structured JSON suitable for report generation."""
                 task_type="synthesis",
                 use_thinking=True,
                 temperature=0.4,
-                max_tokens=12000
+                max_tokens=12000,
+                stream_json=True,
             )
             return self._parse_json_response(response)
         except Exception as e:
@@ -489,21 +940,11 @@ Format as structured JSON suitable for report generation."""
 
     async def generate_audio_script(self, report: Dict[str, Any]) -> str:
         """Generate script for audio brief from report"""
-        prompt = f"""Create a 5-minute executive audio brief script from this Innovation Opportunity Report:
+        prompt = f"""{_AUDIO_SCRIPT_INSTRUCTIONS}
 
-{self._format_data(report)}
-
-The script should:
-1. Be conversational and engaging
-2. Start with a compelling hook
-3. Highlight the top 3 opportunities
-4. Include key statistics and findings
-5. End with clear call-to-action
-6. Be approximately 750 words (5 min at 150 wpm)
-
-Write the script in a natural, professional speaking style.
-Include [PAUSE] markers for natural breaks.
-Do not include any stage directions, just the spoken text."""
+---
+REPORT:
+{self._format_data(report)}"""
 
         try:
             return await self.generate(prompt, task_type="synthesis", temperature=0.6)
@@ -512,12 +953,23 @@ Do not include any stage directions, just the spoken text."""
             query = report.get("query", {}).get("query", "innovation") if isinstance(report.get("query"), dict) else "innovation"
             return DemoDataProvider.get_audio_script(query, report)
 
-    def _format_data(self, data: Any) -> str:
-        """Format data for prompt inclusion"""
-        import json
-        if isinstance(data, (dict, list)):
-            return json.dumps(data, indent=2, default=str)[:8000]  # Limit size
-        return str(data)[:8000]
+    def _format_data(self, data: Any, budget_tokens: int = _FORMAT_TOKEN_BUDGET) -> str:
+        """Format data for prompt inclusion, limited to a token budget"""
+        if isinstance(data, (list, tuple)):
+            # Drop whole items that can't fit before serializing the rest
+            data = data[:_max_items_for_budget(data, budget_tokens)]
+        if isinstance(data, BaseModel):
+            # pydantic-core serializes models directly, skipping the dict round trip
+            text = data.model_dump_json(indent=2)
+        elif isinstance(data, (list, tuple)) and data and isinstance(data[0], BaseModel):
+            text = "[\n" + ",\n".join(item.model_dump_json(indent=2) for item in data) + "\n]"
+        elif isinstance(data, (Mapping, list, tuple)):
+            text = orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=json_default
+            ).decode()
+        else:
+            text = str(data)
+        return _truncate_to_tokens(text, budget_tokens)
 
     def _format_list(self, items: List[str]) -> str:
         """Format list items for prompt"""
@@ -525,21 +977,14 @@ Do not include any stage directions, just the spoken text."""
 
     def _parse_json_response(self, response: str) -> Dict[str, Any]:
         """Parse JSON from AI response, handling markdown code blocks"""
-        import json
-        
-        # Try to extract JSON from markdown code blocks
-        if "```json" in response:
-            start = response.find("```json") + 7
-            end = response.find("```", start)
-            response = response[start:end].strip()
-        elif "```" in response:
-            start = response.find("```") + 3
-            end = response.find("```", start)
-            response = response[start:end].strip()
+        # Extract JSON from a markdown code block in a single scan
+        match = _JSON_FENCE_RE.search(response)
+        if match:
+            response = match.group(1).strip()
         
         try:
-            return json.loads(response)
-        except json.JSONDecodeError:
+            return orjson.loads(response)
+        except orjson.JSONDecodeError:
             logger.warning("Failed to parse JSON response, returning as text")
             return {"raw_response": response}
 
@@ -4,13 +4,14 @@ Pydantic models for research states, results, and reports
 """
 
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
-from enum import Enum
+from enum import Enum, StrEnum
 import uuid
+import numpy as np
 
 
-class AgentStatus(str, Enum):
+class AgentStatus(StrEnum):
     """Status of an agent's execution"""
     IDLE = "idle"
     RUNNING = "running"
@@ -19,7 +20,7 @@ class AgentStatus(str, Enum):
     WAITING = "waiting"
 
 
-class ResearchPhase(str, Enum):
+class ResearchPhase(StrEnum):
     """Current phase of the research process"""
     INITIALIZING = "initializing"
     PATENT_SEARCH = "patent_search"
@@ -48,10 +49,10 @@ class ResearchQuery(BaseModel):
     """Initial research query from user"""
     query: str = Field(..., description="The research question or topic")
     domain: Optional[str] = Field(None, description="Specific domain/industry focus")
-    geographic_scope: List[str] = Field(default=["US", "EU", "CN", "JP"], description="Patent jurisdictions")
+    geographic_scope: List[str] = Field(default_factory=lambda: ["US", "EU", "CN", "JP"], description="Patent jurisdictions")
     time_range_years: int = Field(default=5, description="How many years back to search")
     max_recursion_depth: int = Field(default=4, description="How deep to recurse in research")
-    priority_areas: List[str] = Field(default=[], description="Specific focus areas")
+    priority_areas: List[str] = Field(default_factory=list, description="Specific focus areas")
 
 
 class ResearchSession(BaseModel):
@@ -65,6 +66,20 @@ class ResearchSession(BaseModel):
     current_recursion_depth: int = 0
     total_sources_analyzed: int = 0
     error_message: Optional[str] = None
+    version: int = 0  # bumped on every state change, for delta polling
+    # ISO forms of the write-once timestamps, for the polled status summary
+    started_at_iso: str = Field(default="", exclude=True)
+    completed_at_iso: Optional[str] = Field(default=None, exclude=True)
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Format started_at once at creation"""
+        if not self.started_at_iso:
+            self.started_at_iso = self.started_at.isoformat()
+    
+    def mark_completed(self) -> None:
+        """Stamp completed_at along with its cached ISO form"""
+        self.completed_at = datetime.now()
+        self.completed_at_iso = self.completed_at.isoformat()
 
 
 # ============================================
@@ -76,16 +91,16 @@ class Patent(BaseModel):
     patent_id: str
     title: str
     abstract: str
-    claims: List[str] = Field(default=[])
-    inventors: List[str] = Field(default=[])
+    claims: List[str] = Field(default_factory=list)
+    inventors: List[str] = Field(default_factory=list)
     assignee: Optional[str] = None
     filing_date: Optional[datetime] = None
     publication_date: Optional[datetime] = None
     jurisdiction: str = "US"
-    classification_codes: List[str] = Field(default=[])
+    classification_codes: List[str] = Field(default_factory=list)
     citation_count: int = 0
-    cited_patents: List[str] = Field(default=[])
-    citing_patents: List[str] = Field(default=[])
+    cited_patents: List[str] = Field(default_factory=list)
+    citing_patents: List[str] = Field(default_factory=list)
     url: Optional[str] = None
     relevance_score: float = 0.0
 
@@ -96,8 +111,8 @@ class PatentCluster(BaseModel):
     name: str
     description: str
     patents: List[Patent]
-    dominant_assignees: List[str] = Field(default=[])
-    technology_themes: List[str] = Field(default=[])
+    dominant_assignees: List[str] = Field(default_factory=list)
+    technology_themes: List[str] = Field(default_factory=list)
     average_age_years: float = 0.0
     growth_trend: str = "stable"  # growing, stable, declining
 
@@ -110,8 +125,8 @@ class PatentLandscape(BaseModel):
     top_assignees: Dict[str, int] = Field(default_factory=dict)
     filing_trend: Dict[str, int] = Field(default_factory=dict)  # year -> count
     technology_distribution: Dict[str, int] = Field(default_factory=dict)
-    key_inventors: List[str] = Field(default=[])
-    whitespace_indicators: List[str] = Field(default=[])
+    key_inventors: List[str] = Field(default_factory=list)
+    whitespace_indicators: List[str] = Field(default_factory=list)
 
 
 # ============================================
@@ -126,7 +141,7 @@ class Startup(BaseModel):
     funding_total: Optional[float] = None
     latest_round: Optional[str] = None
     latest_round_amount: Optional[float] = None
-    investors: List[str] = Field(default=[])
+    investors: List[str] = Field(default_factory=list)
     headquarters: Optional[str] = None
     employee_count: Optional[str] = None
     website: Optional[str] = None
@@ -138,9 +153,9 @@ class MarketSegment(BaseModel):
     name: str
     market_size_usd: Optional[float] = None
     cagr_percent: Optional[float] = None
-    key_players: List[str] = Field(default=[])
-    growth_drivers: List[str] = Field(default=[])
-    challenges: List[str] = Field(default=[])
+    key_players: List[str] = Field(default_factory=list)
+    growth_drivers: List[str] = Field(default_factory=list)
+    challenges: List[str] = Field(default_factory=list)
 
 
 class MergersAcquisition(BaseModel):
@@ -160,9 +175,9 @@ class MarketIntelligence(BaseModel):
     relevant_startups: List[Startup]
     funding_total_usd: float = 0.0
     funding_trend: Dict[str, float] = Field(default_factory=dict)  # year -> amount
-    ma_activity: List[MergersAcquisition] = Field(default=[])
-    regulatory_factors: List[str] = Field(default=[])
-    key_insights: List[str] = Field(default=[])
+    ma_activity: List[MergersAcquisition] = Field(default_factory=list)
+    regulatory_factors: List[str] = Field(default_factory=list)
+    key_insights: List[str] = Field(default_factory=list)
 
 
 # ============================================
@@ -174,11 +189,11 @@ class ResearchPaper(BaseModel):
     paper_id: str
     title: str
     abstract: str
-    authors: List[str] = Field(default=[])
+    authors: List[str] = Field(default_factory=list)
     publication_date: Optional[datetime] = None
     venue: Optional[str] = None  # journal/conference
     citation_count: int = 0
-    keywords: List[str] = Field(default=[])
+    keywords: List[str] = Field(default_factory=list)
     url: Optional[str] = None
     pdf_url: Optional[str] = None
     relevance_score: float = 0.0
@@ -192,8 +207,8 @@ class TechnologyTrend(BaseModel):
     trl_level: int = Field(ge=1, le=9)  # Technology Readiness Level
     research_momentum: float = 0.0  # papers/year growth rate
     patent_momentum: float = 0.0  # patents/year growth rate
-    key_research_groups: List[str] = Field(default=[])
-    breakthrough_papers: List[ResearchPaper] = Field(default=[])
+    key_research_groups: List[str] = Field(default_factory=list)
+    breakthrough_papers: List[ResearchPaper] = Field(default_factory=list)
     predicted_commercialization_year: Optional[int] = None
 
 
@@ -202,10 +217,10 @@ class TechTrendAnalysis(BaseModel):
     total_papers_analyzed: int
     papers: List[ResearchPaper]
     trends: List[TechnologyTrend]
-    emerging_keywords: List[str] = Field(default=[])
+    emerging_keywords: List[str] = Field(default_factory=list)
     research_hotspots: Dict[str, int] = Field(default_factory=dict)
     collaboration_networks: Dict[str, List[str]] = Field(default_factory=dict)
-    key_insights: List[str] = Field(default=[])
+    key_insights: List[str] = Field(default_factory=list)
 
 
 # ============================================
@@ -230,7 +245,7 @@ class VerifiedClaim(BaseModel):
     confidence_score: float = Field(ge=0, le=1)
     confidence_level: ConfidenceLevel
     supporting_sources: List[VerificationSource]
-    contradicting_sources: List[VerificationSource] = Field(default=[])
+    contradicting_sources: List[VerificationSource] = Field(default_factory=list)
     verification_notes: Optional[str] = None
     verified_at: datetime = Field(default_factory=datetime.now)
 
@@ -239,11 +254,31 @@ class VerificationReport(BaseModel):
     """Complete verification report"""
     total_claims_analyzed: int
     verified_claims: List[VerifiedClaim]
-    unverified_claims: List[str] = Field(default=[])
+    unverified_claims: List[str] = Field(default_factory=list)
     total_sources_used: int
     source_distribution: Dict[str, int] = Field(default_factory=dict)
     average_confidence: float = 0.0
     verification_coverage: float = 0.0  # % of claims verified
+    
+    def as_soa(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Columnar view of the claims: (confidence scores, confidence level codes)"""
+        return claims_as_soa(self.verified_claims)
+
+
+# Stable integer code per ConfidenceLevel, in declaration order
+CONFIDENCE_LEVEL_CODES: Dict[ConfidenceLevel, int] = {
+    level: code for code, level in enumerate(ConfidenceLevel)
+}
+
+
+def claims_as_soa(claims: List[VerifiedClaim]) -> Tuple[np.ndarray, np.ndarray]:
+    """Split verified claims into score and level-code arrays for vectorized rollups"""
+    n = len(claims)
+    scores = np.fromiter((c.confidence_score for c in claims), dtype=np.float64, count=n)
+    levels = np.fromiter(
+        (CONFIDENCE_LEVEL_CODES[c.confidence_level] for c in claims), dtype=np.int8, count=n
+    )
+    return scores, levels
 
 
 # ============================================
@@ -257,11 +292,11 @@ class InnovationWhitespace(BaseModel):
     description: str
     opportunity_type: str  # technology_gap, market_gap, integration, timing
     confidence_score: float = Field(ge=0, le=1)
-    supporting_evidence: List[str] = Field(default=[])
+    supporting_evidence: List[str] = Field(default_factory=list)
     potential_impact: str  # high, medium, low
     time_sensitivity: str  # urgent, moderate, flexible
     competitive_landscape: str
-    recommended_actions: List[str] = Field(default=[])
+    recommended_actions: List[str] = Field(default_factory=list)
     estimated_market_size_usd: Optional[float] = None
     investment_score: float = Field(default=0.0, ge=0, le=100)  # 0-100 investment attractiveness
 
@@ -271,7 +306,7 @@ class CompetitiveThreat(BaseModel):
     company_name: str
     threat_level: str  # high, medium, low
     patent_count: int = 0
-    key_technologies: List[str] = Field(default=[])
+    key_technologies: List[str] = Field(default_factory=list)
     recent_filings: int = 0  # Patents filed in last 2 years
     market_overlap: float = Field(default=0.0, ge=0, le=1)  # 0-1 overlap score
     threat_summary: str = ""
@@ -5,10 +5,13 @@ Professional Innovation Opportunity Report export
 
 import io
 from datetime import datetime
-from typing import Dict, Any, Optional
+from functools import cached_property, lru_cache
+from itertools import islice
+from html import escape
+from typing import IO, Dict, Any, Optional, Union
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, StyleSheet1
 from reportlab.lib.units import inch
 from reportlab.platypus import (
     SimpleDocTemplate,
@@ -22,131 +25,286 @@ from reportlab.platypus import (
 )
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from loguru import logger
+from pydantic import BaseModel
+
+
+# Report palette, parsed once
+_C_INDIGO = colors.HexColor('#6366f1')
+_C_SUBTITLE = colors.HexColor('#64748b')
+_C_SLATE_BG = colors.HexColor('#f1f5f9')
+_C_SLATE_TEXT = colors.HexColor('#475569')
+_C_DARK = colors.HexColor('#1e293b')
+_C_BODY = colors.HexColor('#334155')
+_C_MUTED = colors.HexColor('#94a3b8')
+_C_GRID = colors.HexColor('#e2e8f0')
+_C_BG_LIGHT = colors.HexColor('#f8fafc')
+_C_RED = colors.HexColor('#ef4444')
+_C_AMBER = colors.HexColor('#f59e0b')
+_C_GREEN = colors.HexColor('#22c55e')
+_C_CYAN = colors.HexColor('#06b6d4')
+_C_CYAN_DARK = colors.HexColor('#0891b2')
+_C_PURPLE = colors.HexColor('#8b5cf6')
+_C_PINK = colors.HexColor('#db2777')
+_C_PINK_LIGHT = colors.HexColor('#ec4899')
+
+
+@lru_cache(maxsize=4096)
+def _esc(text: str) -> str:
+    """Escape report text for Paragraph markup; repeated names hit the cache"""
+    return escape(text, quote=False)
+
+
+@lru_cache(maxsize=256)
+def _pct(fraction: float) -> str:
+    """Format a 0-1 fraction as a whole percentage"""
+    return f"{fraction*100:.0f}%"
+
+
+@lru_cache(maxsize=256)
+def _usd_m(amount: float) -> str:
+    """Format a USD amount in millions"""
+    return f"${amount/1_000_000:.1f}M"
+
+
+def _build_styles() -> StyleSheet1:
+    """Build the sample stylesheet plus the report's custom styles"""
+    styles = getSampleStyleSheet()
+    
+    # Title style
+    styles.add(ParagraphStyle(
+        name='ReportTitle',
+        parent=styles['Heading1'],
+        fontSize=28,
+        spaceAfter=30,
+        textColor=_C_INDIGO,
+        alignment=TA_CENTER,
+    ))
+    
+    # Subtitle style
+    styles.add(ParagraphStyle(
+        name='ReportSubtitle',
+        parent=styles['Normal'],
+        fontSize=14,
+        textColor=_C_SUBTITLE,
+        alignment=TA_CENTER,
+        spaceAfter=20,
+    ))
+    
+    # Section header
+    styles.add(ParagraphStyle(
+        name='SectionHeader',
+        parent=styles['Heading2'],
+        fontSize=18,
+        textColor=_C_DARK,
+        spaceBefore=20,
+        spaceAfter=12,
+    ))
+    
+    # Subsection header
+    styles.add(ParagraphStyle(
+        name='SubsectionHeader',
+        parent=styles['Heading3'],
+        fontSize=14,
+        textColor=_C_SLATE_TEXT,
+        spaceBefore=15,
+        spaceAfter=8,
+    ))
+    
+    # Body text
+    styles.add(ParagraphStyle(
+        name='ReportBody',
+        parent=styles['Normal'],
+        fontSize=11,
+        textColor=_C_BODY,
+        spaceBefore=6,
+        spaceAfter=6,
+        leading=16,
+    ))
+    
+    # Highlight text
+    styles.add(ParagraphStyle(
+        name='Highlight',
+        parent=styles['Normal'],
+        fontSize=12,
+        textColor=_C_INDIGO,
+        spaceBefore=4,
+        spaceAfter=4,
+    ))
+    
+    # Small text
+    styles.add(ParagraphStyle(
+        name='SmallText',
+        parent=styles['Normal'],
+        fontSize=9,
+        textColor=_C_MUTED,
+    ))
+    
+    return styles
+
+
+# Built once at import; generators share it read-only
+_STYLES = _build_styles()
+
+
+# Paragraph markup for repeated report rows, filled with str.format per row
+_WHITESPACE_ITEM_MARKUP = (
+    '<font size="14" color="#475569"><b>{index}. {title}</b> ({impact} IMPACT)</font><br/>'
+    '{description}<br/>'
+    '<font size="9" color="#94a3b8">Confidence: {confidence} | '
+    'Investment Score: {investment:.0f}/100</font>'
+)
+_STARTUP_LINE_MARKUP = "• <b>{name}</b> ({funding}): {description}"
+
+# Page setup shared by every report
+_PAGE_MARGIN = 0.75*inch
+_DOC_LAYOUT: Dict[str, Any] = {
+    "pagesize": letter,
+    "rightMargin": _PAGE_MARGIN,
+    "leftMargin": _PAGE_MARGIN,
+    "topMargin": _PAGE_MARGIN,
+    "bottomMargin": _PAGE_MARGIN,
+}
+
+# Cover page stats table: only the value row changes per report
+_STATS_HEADER_ROW = ["Patents Analyzed", "Papers Reviewed", "Sources Used", "Processing Time"]
+_STATS_COL_WIDTHS = [1.5*inch] * 4
+
+# Column widths for the section tables
+_THREATS_COL_WIDTHS = [2.5*inch, 1.2*inch, 1*inch, 1.3*inch]
+_ASSIGNEE_COL_WIDTHS = [4*inch, 1.5*inch]
+_TRENDS_COL_WIDTHS = [2.5*inch, 1.2*inch, 0.8*inch, 1*inch]
+
+# Table styles only hold their command lists, so one instance serves every report
+_STATS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _C_SLATE_BG),
+    ('TEXTCOLOR', (0, 0), (-1, 0), _C_SLATE_TEXT),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('FONTSIZE', (0, 1), (-1, 1), 14),
+    ('TEXTCOLOR', (0, 1), (-1, 1), _C_INDIGO),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('TOPPADDING', (0, 1), (-1, 1), 12),
+    ('GRID', (0, 0), (-1, -1), 1, _C_GRID),
+])
+
+_THREATS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _C_DARK),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), _C_BG_LIGHT),
+    ('GRID', (0, 0), (-1, -1), 1, _C_GRID),
+    ('FONTSIZE', (0, 1), (-1, -1), 9),
+])
+
+_ASSIGNEE_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _C_CYAN_DARK),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('GRID', (0, 0), (-1, -1), 1, _C_GRID),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+])
+
+_TRENDS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _C_PINK),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('GRID', (0, 0), (-1, -1), 1, _C_GRID),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+])
 
 
 class PDFReportGenerator:
     """Generate professional PDF reports from research data"""
     
     def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
+        self.styles = _STYLES
     
-    def _setup_custom_styles(self):
-        """Define custom styles for the report"""
-        # Title style
-        self.styles.add(ParagraphStyle(
-            name='ReportTitle',
-            parent=self.styles['Heading1'],
-            fontSize=28,
-            spaceAfter=30,
-            textColor=colors.HexColor('#6366f1'),
-            alignment=TA_CENTER,
-        ))
-        
-        # Subtitle style
-        self.styles.add(ParagraphStyle(
-            name='ReportSubtitle',
-            parent=self.styles['Normal'],
-            fontSize=14,
-            textColor=colors.HexColor('#64748b'),
-            alignment=TA_CENTER,
-            spaceAfter=20,
-        ))
-        
-        # Section header
-        self.styles.add(ParagraphStyle(
-            name='SectionHeader',
-            parent=self.styles['Heading2'],
-            fontSize=18,
-            textColor=colors.HexColor('#1e293b'),
-            spaceBefore=20,
-            spaceAfter=12,
-        ))
-        
-        # Subsection header
-        self.styles.add(ParagraphStyle(
-            name='SubsectionHeader',
-            parent=self.styles['Heading3'],
-            fontSize=14,
-            textColor=colors.HexColor('#475569'),
-            spaceBefore=15,
-            spaceAfter=8,
-        ))
-        
-        # Body text
-        self.styles.add(ParagraphStyle(
-            name='ReportBody',
-            parent=self.styles['Normal'],
-            fontSize=11,
-            textColor=colors.HexColor('#334155'),
-            spaceBefore=6,
-            spaceAfter=6,
-            leading=16,
-        ))
-        
-        # Highlight text
-        self.styles.add(ParagraphStyle(
-            name='Highlight',
-            parent=self.styles['Normal'],
-            fontSize=12,
-            textColor=colors.HexColor('#6366f1'),
-            spaceBefore=4,
-            spaceAfter=4,
-        ))
-        
-        # Small text
-        self.styles.add(ParagraphStyle(
-            name='SmallText',
-            parent=self.styles['Normal'],
-            fontSize=9,
-            textColor=colors.HexColor('#94a3b8'),
-        ))
+    # Styles resolved once per generator, so builders use attribute access
+    @cached_property
+    def _title(self) -> ParagraphStyle:
+        return self.styles['ReportTitle']
+    
+    @cached_property
+    def _subtitle(self) -> ParagraphStyle:
+        return self.styles['ReportSubtitle']
+    
+    @cached_property
+    def _section(self) -> ParagraphStyle:
+        return self.styles['SectionHeader']
+    
+    @cached_property
+    def _subsection(self) -> ParagraphStyle:
+        return self.styles['SubsectionHeader']
+    
+    @cached_property
+    def _body(self) -> ParagraphStyle:
+        return self.styles['ReportBody']
+    
+    @cached_property
+    def _highlight(self) -> ParagraphStyle:
+        return self.styles['Highlight']
     
-    def generate_report(self, report_data: Dict[str, Any]) -> bytes:
-        """Generate PDF report from research data"""
-        buffer = io.BytesIO()
+    @cached_property
+    def _small(self) -> ParagraphStyle:
+        return self.styles['SmallText']
+    
+    def generate_report(
+        self,
+        report_data: Union[BaseModel, Dict[str, Any]],
+        output: Optional[IO[bytes]] = None,
+    ) -> Optional[bytes]:
+        """
+        Generate PDF report from research data
+        
+        Writes straight into output when given (returning None), otherwise
+        returns the PDF bytes.
+        """
+        # Builders read plain dicts; dump a model once up front
+        if isinstance(report_data, BaseModel):
+            report_data = report_data.model_dump()
+        
+        buffer = output if output is not None else io.BytesIO()
         
         doc = SimpleDocTemplate(
             buffer,
-            pagesize=letter,
-            rightMargin=0.75*inch,
-            leftMargin=0.75*inch,
-            topMargin=0.75*inch,
-            bottomMargin=0.75*inch,
+            **_DOC_LAYOUT,
         )
         
-        story = []
-        
-        # Cover page
-        story.extend(self._build_cover_page(report_data))
-        story.append(PageBreak())
-        
-        # Executive Summary
-        story.extend(self._build_executive_summary(report_data))
-        story.append(Spacer(1, 20))
-        
-        # Innovation Whitespace
-        story.extend(self._build_whitespace_section(report_data))
-        story.append(PageBreak())
-        
-        # Competitive Threats
-        story.extend(self._build_threats_section(report_data))
-        story.append(Spacer(1, 20))
-        
-        # Patent Landscape
-        story.extend(self._build_patent_section(report_data))
-        story.append(PageBreak())
-        
-        # Market Intelligence
-        story.extend(self._build_market_section(report_data))
-        story.append(Spacer(1, 20))
-        
-        # Tech Trends
-        story.extend(self._build_trends_section(report_data))
+        story = [
+            # Cover page
+            *self._build_cover_page(report_data),
+            PageBreak(),
+            # Executive Summary
+            *self._build_executive_summary(report_data),
+            Spacer(1, 20),
+            # Innovation Whitespace
+            *self._build_whitespace_section(report_data),
+            PageBreak(),
+            # Competitive Threats
+            *self._build_threats_section(report_data),
+            Spacer(1, 20),
+            # Patent Landscape
+            *self._build_patent_section(report_data),
+            PageBreak(),
+            # Market Intelligence
+            *self._build_market_section(report_data),
+            Spacer(1, 20),
+            # Tech Trends
+            *self._build_trends_section(report_data),
+        ]
         
         # Build PDF
         doc.build(story)
         
+        if output is not None:
+            return None
+        
         pdf_bytes = buffer.getvalue()
         buffer.close()
         
@@ -162,12 +320,12 @@ class PDFReportGenerator:
         # Title
         elements.append(Paragraph(
             "NEXUS-R&D",
-            self.styles['ReportTitle']
+            self._title
         ))
         
         elements.append(Paragraph(
             "Innovation Opportunity Report",
-            self.styles['ReportSubtitle']
+            self._subtitle
         ))
         
         elements.append(Spacer(1, 30))
@@ -176,52 +334,40 @@ class PDFReportGenerator:
         query = report_data.get("query", {})
         query_text = query.get("query", "Research Analysis") if isinstance(query, dict) else str(query)
         elements.append(Paragraph(
-            f"<b>Research Topic:</b> {query_text}",
-            self.styles['ReportBody']
+            f"<b>Research Topic:</b> {_esc(str(query_text))}",
+            self._body
         ))
         
         elements.append(Spacer(1, 20))
         
         # Report metadata
         report_id = report_data.get("report_id", "N/A")
-        generated_at = report_data.get("generated_at", datetime.now().isoformat())
+        generated_at = report_data.get("generated_at") or datetime.now()
+        if isinstance(generated_at, datetime):
+            generated_str = generated_at.strftime("%Y-%m-%d %H:%M:%S")
+        else:
+            generated_str = str(generated_at)[:19].replace('T', ' ')
         
+        # Short fixed lines share one Paragraph, so there is one flowable to lay out
         elements.append(Paragraph(
-            f"Report ID: {report_id}",
-            self.styles['SmallText']
-        ))
-        elements.append(Paragraph(
-            f"Generated: {generated_at[:19].replace('T', ' ')}",
-            self.styles['SmallText']
+            f"Report ID: {_esc(str(report_id))}<br/>"
+            f"Generated: {_esc(generated_str)}",
+            self._small
         ))
         
         # Key stats
         elements.append(Spacer(1, 40))
         
         metadata = report_data.get("metadata", {})
-        stats_data = [
-            ["Patents Analyzed", "Papers Reviewed", "Sources Used", "Processing Time"],
-            [
-                str(metadata.get("total_patents_analyzed", 0)),
-                str(metadata.get("total_papers_analyzed", 0)),
-                str(metadata.get("total_sources_analyzed", 0)),
-                f"{metadata.get('processing_time_seconds', 0):.0f}s",
-            ]
+        stats_row = [
+            str(metadata.get("total_patents_analyzed", 0)),
+            str(metadata.get("total_papers_analyzed", 0)),
+            str(metadata.get("total_sources_analyzed", 0)),
+            f"{metadata.get('processing_time_seconds', 0):.0f}s",
         ]
         
-        stats_table = Table(stats_data, colWidths=[1.5*inch, 1.5*inch, 1.5*inch, 1.5*inch])
-        stats_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f1f5f9')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#475569')),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('FONTSIZE', (0, 1), (-1, 1), 14),
-            ('TEXTCOLOR', (0, 1), (-1, 1), colors.HexColor('#6366f1')),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('TOPPADDING', (0, 1), (-1, 1), 12),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
-        ]))
+        stats_table = Table([_STATS_HEADER_ROW, stats_row], colWidths=_STATS_COL_WIDTHS)
+        stats_table.setStyle(_STATS_TABLE_STYLE)
         elements.append(stats_table)
         
         return elements
@@ -230,64 +376,72 @@ class PDFReportGenerator:
         """Build executive summary section"""
         elements = []
         
-        elements.append(Paragraph("Executive Summary", self.styles['SectionHeader']))
-        elements.append(HRFlowable(width="100%", thickness=2, color=colors.HexColor('#6366f1')))
+        elements.append(Paragraph("Executive Summary", self._section))
+        elements.append(HRFlowable(width="100%", thickness=2, color=_C_INDIGO))
         elements.append(Spacer(1, 10))
         
         summary = report_data.get("executive_summary", {})
         
         # Headline
         headline = summary.get("headline", "Research Analysis Complete")
-        elements.append(Paragraph(f"<b>{headline}</b>", self.styles['SubsectionHeader']))
+        elements.append(Paragraph(f"<b>{_esc(headline)}</b>", self._subsection))
         
         # Key finding
         key_finding = summary.get("key_finding", "")
         if key_finding:
-            elements.append(Paragraph(key_finding, self.styles['ReportBody']))
+            elements.append(Paragraph(_esc(key_finding), self._body))
         
         # Confidence score
         confidence = summary.get("overall_confidence", 0)
         elements.append(Spacer(1, 10))
         elements.append(Paragraph(
-            f"<b>Overall Confidence Score:</b> {confidence*100:.0f}%",
-            self.styles['Highlight']
+            f"<b>Overall Confidence Score:</b> {_pct(confidence)}",
+            self._highlight
         ))
         
         # Top opportunities
         top_opps = summary.get("top_opportunities", [])
         if top_opps:
             elements.append(Spacer(1, 15))
-            elements.append(Paragraph("<b>Top Opportunities:</b>", self.styles['ReportBody']))
-            for i, opp in enumerate(top_opps[:5], 1):
-                elements.append(Paragraph(f"  {i}. {opp}", self.styles['ReportBody']))
+            elements.append(Paragraph("<b>Top Opportunities:</b>", self._body))
+            elements.append(Paragraph(
+                "<br/>".join(f"&nbsp;&nbsp;{i}. {_esc(str(opp))}" for i, opp in enumerate(islice(top_opps, 5), 1)),
+                self._body
+            ))
         
         return elements
     
     def _build_whitespace_section(self, report_data: Dict[str, Any]) -> list:
         """Build whitespace opportunities section"""
+        opportunities = report_data.get("whitespace_opportunities", [])
+        if not opportunities:
+            return []
+        
         elements = []
         
-        elements.append(Paragraph("Innovation Whitespace Opportunities", self.styles['SectionHeader']))
-        elements.append(HRFlowable(width="100%", thickness=2, color=colors.HexColor('#6366f1')))
+        elements.append(Paragraph("Innovation Whitespace Opportunities", self._section))
+        elements.append(HRFlowable(width="100%", thickness=2, color=_C_INDIGO))
         elements.append(Spacer(1, 10))
         
-        opportunities = report_data.get("whitespace_opportunities", [])
-        
-        for i, opp in enumerate(opportunities[:6], 1):
+        for i, opp in enumerate(islice(opportunities, 6), 1):
             title = opp.get("title", "Opportunity")
             desc = opp.get("description", "")
             impact = opp.get("potential_impact", "medium")
             confidence = opp.get("confidence_score", 0)
             investment = opp.get("investment_score", 0)
             
+            # One Paragraph per opportunity, using inline markup for the
+            # heading and metadata lines instead of separate flowables
             elements.append(Paragraph(
-                f"<b>{i}. {title}</b> ({impact.upper()} IMPACT)",
-                self.styles['SubsectionHeader']
-            ))
-            elements.append(Paragraph(desc, self.styles['ReportBody']))
-            elements.append(Paragraph(
-                f"Confidence: {confidence*100:.0f}% | Investment Score: {investment:.0f}/100",
-                self.styles['SmallText']
+                _WHITESPACE_ITEM_MARKUP.format(
+                    index=i,
+                    title=_esc(title),
+                    impact=_esc(impact.upper()),
+                    description=_esc(desc),
+                    confidence=_pct(confidence),
+                    investment=investment,
+                ),
+                self._body
             ))
             elements.append(Spacer(1, 8))
         
@@ -297,175 +451,163 @@ class PDFReportGenerator:
         """Build competitive threats section"""
         elements = []
         
-        elements.append(Paragraph("Competitive Threat Radar", self.styles['SectionHeader']))
-        elements.append(HRFlowable(width="100%", thickness=2, color=colors.HexColor('#ef4444')))
+        elements.append(Paragraph("Competitive Threat Radar", self._section))
+        elements.append(HRFlowable(width="100%", thickness=2, color=_C_RED))
         elements.append(Spacer(1, 10))
         
         threats = report_data.get("competitive_threats", [])
         
         if not threats:
-            elements.append(Paragraph("No significant competitive threats identified.", self.styles['ReportBody']))
+            elements.append(Paragraph("No significant competitive threats identified.", self._body))
             return elements
         
         # Threats table
         table_data = [["Company", "Threat Level", "Patents", "Market Overlap"]]
         
         threat_colors = {
-            "high": colors.HexColor('#ef4444'),
-            "medium": colors.HexColor('#f59e0b'),
-            "low": colors.HexColor('#22c55e'),
+            "high": _C_RED,
+            "medium": _C_AMBER,
+            "low": _C_GREEN,
         }
         
-        for threat in threats[:8]:
+        for threat in islice(threats, 8):
             table_data.append([
                 threat.get("company_name", "Unknown"),
                 threat.get("threat_level", "low").upper(),
                 str(threat.get("patent_count", 0)),
-                f"{threat.get('market_overlap', 0)*100:.0f}%",
+                _pct(threat.get("market_overlap", 0)),
             ])
         
-        threats_table = Table(table_data, colWidths=[2.5*inch, 1.2*inch, 1*inch, 1.3*inch])
-        threats_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1e293b')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f8fafc')),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-        ]))
+        threats_table = Table(table_data, colWidths=_THREATS_COL_WIDTHS)
+        threats_table.setStyle(_THREATS_TABLE_STYLE)
         elements.append(threats_table)
         
         return elements
     
     def _build_patent_section(self, report_data: Dict[str, Any]) -> list:
         """Build patent landscape section"""
+        patent_data = report_data.get("patent_landscape", {})
+        if not patent_data:
+            return []
+        
         elements = []
         
-        elements.append(Paragraph("Patent Landscape", self.styles['SectionHeader']))
-        elements.append(HRFlowable(width="100%", thickness=2, color=colors.HexColor('#06b6d4')))
+        elements.append(Paragraph("Patent Landscape", self._section))
+        elements.append(HRFlowable(width="100%", thickness=2, color=_C_CYAN))
         elements.append(Spacer(1, 10))
         
-        patent_data = report_data.get("patent_landscape", {})
         total = patent_data.get("total_patents", 0)
         
         elements.append(Paragraph(
             f"<b>Total Patents Analyzed:</b> {total}",
-            self.styles['ReportBody']
+            self._body
         ))
         
         # Top assignees
         assignees = patent_data.get("top_assignees", {})
         if assignees:
             elements.append(Spacer(1, 15))
-            elements.append(Paragraph("<b>Top Patent Holders:</b>", self.styles['SubsectionHeader']))
+            elements.append(Paragraph("<b>Top Patent Holders:</b>", self._subsection))
             
             table_data = [["Company", "Patent Count"]]
-            for company, count in list(assignees.items())[:10]:
+            for company, count in islice(assignees.items(), 10):
                 table_data.append([company, str(count)])
             
-            assignee_table = Table(table_data, colWidths=[4*inch, 1.5*inch])
-            assignee_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#0891b2')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ]))
+            assignee_table = Table(table_data, colWidths=_ASSIGNEE_COL_WIDTHS)
+            assignee_table.setStyle(_ASSIGNEE_TABLE_STYLE)
             elements.append(assignee_table)
         
         return elements
     
     def _build_market_section(self, report_data: Dict[str, Any]) -> list:
         """Build market intelligence section"""
+        market_data = report_data.get("market_intelligence", {})
+        if not market_data:
+            return []
+        
         elements = []
         
-        elements.append(Paragraph("Market Intelligence", self.styles['SectionHeader']))
-        elements.append(HRFlowable(width="100%", thickness=2, color=colors.HexColor('#8b5cf6')))
+        elements.append(Paragraph("Market Intelligence", self._section))
+        elements.append(HRFlowable(width="100%", thickness=2, color=_C_PURPLE))
         elements.append(Spacer(1, 10))
         
-        market_data = report_data.get("market_intelligence", {})
-        
         funding = market_data.get("funding_total_usd", 0)
         elements.append(Paragraph(
-            f"<b>Total Funding Tracked:</b> ${funding/1_000_000:.1f}M",
-            self.styles['ReportBody']
+            f"<b>Total Funding Tracked:</b> {_usd_m(funding)}",
+            self._body
         ))
         
         # Startups
-        startups = market_data.get("relevant_startups", [])
+        startups = [s for s in islice(market_data.get("relevant_startups", []), 5) if isinstance(s, dict)]
         if startups:
             elements.append(Spacer(1, 15))
-            elements.append(Paragraph("<b>Key Startups:</b>", self.styles['SubsectionHeader']))
+            elements.append(Paragraph("<b>Key Startups:</b>", self._subsection))
             
-            for startup in startups[:5]:
-                if isinstance(startup, dict):
-                    name = startup.get("name", "Unknown")
-                    desc = startup.get("description", "")
-                    funding_amt = startup.get("funding_total", 0) or 0
-                    elements.append(Paragraph(
-                        f"• <b>{name}</b> (${funding_amt/1_000_000:.1f}M): {desc}",
-                        self.styles['ReportBody']
-                    ))
+            lines = [
+                _STARTUP_LINE_MARKUP.format(
+                    name=_esc(startup.get("name", "Unknown")),
+                    funding=_usd_m(startup.get("funding_total", 0) or 0),
+                    description=_esc(startup.get("description", "")),
+                )
+                for startup in startups
+            ]
+            elements.append(Paragraph("<br/>".join(lines), self._body))
         
         return elements
     
     def _build_trends_section(self, report_data: Dict[str, Any]) -> list:
         """Build tech trends section"""
+        tech_data = report_data.get("tech_trends", {})
+        if not tech_data:
+            return []
+        
         elements = []
         
-        elements.append(Paragraph("Technology Trends", self.styles['SectionHeader']))
-        elements.append(HRFlowable(width="100%", thickness=2, color=colors.HexColor('#ec4899')))
+        elements.append(Paragraph("Technology Trends", self._section))
+        elements.append(HRFlowable(width="100%", thickness=2, color=_C_PINK_LIGHT))
         elements.append(Spacer(1, 10))
         
-        tech_data = report_data.get("tech_trends", {})
         total_papers = tech_data.get("total_papers_analyzed", 0)
         
         elements.append(Paragraph(
             f"<b>Research Papers Analyzed:</b> {total_papers}",
-            self.styles['ReportBody']
+            self._body
         ))
         
-        trends = tech_data.get("trends", [])
+        trends = [t for t in islice(tech_data.get("trends", []), 8) if isinstance(t, dict)]
         if trends:
             elements.append(Spacer(1, 15))
-            elements.append(Paragraph("<b>Emerging Technologies:</b>", self.styles['SubsectionHeader']))
+            elements.append(Paragraph("<b>Emerging Technologies:</b>", self._subsection))
             
             table_data = [["Technology", "Maturity", "TRL", "Momentum"]]
-            for trend in trends[:8]:
-                if isinstance(trend, dict):
-                    table_data.append([
-                        trend.get("technology_name", "Unknown"),
-                        trend.get("maturity_level", "N/A"),
-                        str(trend.get("trl_level", 0)),
-                        f"{trend.get('research_momentum', 0)*100:.0f}%",
-                    ])
+            table_data.extend([
+                trend.get("technology_name", "Unknown"),
+                trend.get("maturity_level", "N/A"),
+                str(trend.get("trl_level", 0)),
+                _pct(trend.get("research_momentum", 0)),
+            ] for trend in trends)
             
-            if len(table_data) > 1:
-                trends_table = Table(table_data, colWidths=[2.5*inch, 1.2*inch, 0.8*inch, 1*inch])
-                trends_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#db2777')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                    ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ]))
-                elements.append(trends_table)
+            trends_table = Table(table_data, colWidths=_TRENDS_COL_WIDTHS)
+            trends_table.setStyle(_TRENDS_TABLE_STYLE)
+            elements.append(trends_table)
         
         return elements
 
 
-# Singleton instance
-_pdf_generator: Optional[PDFReportGenerator] = None
+# Singleton instance, created at import so concurrent first requests can't race
+_pdf_generator = PDFReportGenerator()
 
 
 def get_pdf_generator() -> PDFReportGenerator:
     """Get PDF generator singleton"""
-    global _pdf_generator
-    if _pdf_generator is None:
-        _pdf_generator = PDFReportGenerator()
     return _pdf_generator
+
+
+def warm_up_worker() -> None:
+    """Load ReportLab and build the generator in a pool worker before the first export"""
+    get_pdf_generator()
+
+
+def render_report_pdf(report_data: Dict[str, Any]) -> bytes:
+    """Render a report dict to PDF bytes, as a picklable entry point for worker processes"""
+    return _pdf_generator.generate_report(report_data)
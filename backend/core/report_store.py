@@ -0,0 +1,188 @@
+"""
+NEXUS-R&D Report Store
+Completed reports and live session updates, shared across workers via Redis
+"""
+
+import asyncio
+import hashlib
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+import orjson
+from cachetools import TTLCache
+from loguru import logger
+
+from config import get_settings
+from core.demo_data import json_default
+
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+# Completed reports expire after a day, in Redis and in-process alike
+_REPORT_TTL_SECONDS = 24 * 60 * 60
+_LOCAL_REPORT_LIMIT = 1024
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+# Updates buffered per in-process subscriber; a slow client loses the oldest
+# (status updates are snapshots, so only the latest matters)
+_SUBSCRIBER_QUEUE_SIZE = 32
+
+# Updates kept per session stream in Redis (trimmed approximately)
+_STREAM_MAXLEN = 1000
+
+
+def _report_key(session_id: str) -> str:
+    # Hash of payload, etag and length, so HEAD and revalidation skip the body
+    return f"report:{session_id}"
+
+
+def _report_etag(payload: bytes) -> str:
+    """Quoted strong ETag for an encoded report"""
+    return f'"{hashlib.blake2b(payload, digest_size=16).hexdigest()}"'
+
+
+def _demo_key(demo_key: str) -> str:
+    return f"demo:{demo_key}"
+
+
+def _stream_key(session_id: str) -> str:
+    return f"events:{session_id}"
+
+
+class ReportStore:
+    """
+    Storage for completed reports and fan-out of session updates
+    
+    Uses Redis when ENABLE_REDIS is set and redis is installed, so any
+    Uvicorn worker can serve a report or deliver a WebSocket update.
+    Session updates go to a Redis Stream per session, so they outlive the
+    worker that produced them and a late subscriber starts from the latest.
+    Otherwise falls back to in-process dicts and queues.
+    """
+    
+    def __init__(self):
+        settings = get_settings()
+        self.redis = None
+        if settings.enable_redis:
+            if REDIS_AVAILABLE:
+                self.redis = aioredis.from_url(settings.redis_url)
+                logger.info("ReportStore using Redis")
+            else:
+                logger.warning("ENABLE_REDIS is set but redis is not installed. Install with: pip install redis")
+        
+        # In-process fallbacks
+        # session_id -> (report encoded once at save, its ETag)
+        self._reports: TTLCache = TTLCache(maxsize=_LOCAL_REPORT_LIMIT, ttl=_REPORT_TTL_SECONDS)
+        # demo query hash -> report
+        self._demo_reports: TTLCache = TTLCache(maxsize=16, ttl=_REPORT_TTL_SECONDS)
+        self._subscribers: Dict[str, set] = {}  # session_id -> subscriber queues
+    
+    async def save_report(self, session_id: str, report: Dict[str, Any]) -> None:
+        """Store a completed report"""
+        payload = orjson.dumps(report, default=json_default, option=_ORJSON_OPTIONS)
+        etag = _report_etag(payload)
+        if self.redis is None:
+            self._reports[session_id] = (payload, etag)
+            return
+        key = _report_key(session_id)
+        async with self.redis.pipeline() as pipe:
+            pipe.delete(key)
+            pipe.hset(key, mapping={"payload": payload, "etag": etag, "length": len(payload)})
+            pipe.expire(key, _REPORT_TTL_SECONDS)
+            await pipe.execute()
+    
+    async def get_report(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Get a completed report, or None if it is not ready"""
+        # Decoded from the stored JSON, so callers get plain (picklable) data
+        # even when the report embeds frozen demo views
+        payload = await self.get_report_json(session_id)
+        return orjson.loads(payload) if payload else None
+    
+    async def get_report_json(self, session_id: str) -> Optional[bytes]:
+        """Get a completed report as stored JSON bytes, without decoding it"""
+        if self.redis is None:
+            stored = self._reports.get(session_id)
+            return stored[0] if stored else None
+        return await self.redis.hget(_report_key(session_id), "payload")
+    
+    async def get_report_meta(self, session_id: str) -> Optional[Tuple[str, int]]:
+        """Get the ETag and encoded length of a completed report, without its body"""
+        if self.redis is None:
+            stored = self._reports.get(session_id)
+            return (stored[1], len(stored[0])) if stored else None
+        etag, length = await self.redis.hmget(_report_key(session_id), "etag", "length")
+        return (etag.decode(), int(length)) if etag else None
+    
+    async def save_demo_report(self, demo_key: str, report: Dict[str, Any]) -> None:
+        """Cache the report of a fixed demo query for replay"""
+        if self.redis is None:
+            self._demo_reports[demo_key] = report
+            return
+        payload = orjson.dumps(report, default=json_default, option=_ORJSON_OPTIONS)
+        await self.redis.set(_demo_key(demo_key), payload, ex=_REPORT_TTL_SECONDS)
+    
+    async def get_demo_report(self, demo_key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached demo report, or None on a miss"""
+        if self.redis is None:
+            return self._demo_reports.get(demo_key)
+        payload = await self.redis.get(_demo_key(demo_key))
+        return orjson.loads(payload) if payload else None
+    
+    async def publish(self, session_id: str, update: Dict[str, Any]) -> None:
+        """Publish an update to every subscriber of a session, encoded once"""
+        payload = orjson.dumps(update, default=json_default, option=_ORJSON_OPTIONS)
+        if self.redis is None:
+            text = payload.decode()
+            for queue in self._subscribers.get(session_id, ()):
+                if queue.full():
+                    queue.get_nowait()
+                queue.put_nowait(text)
+            return
+        async with self.redis.pipeline() as pipe:
+            pipe.xadd(_stream_key(session_id), {"data": payload}, maxlen=_STREAM_MAXLEN, approximate=True)
+            pipe.expire(_stream_key(session_id), _REPORT_TTL_SECONDS)
+            await pipe.execute()
+    
+    async def subscribe(self, session_id: str) -> AsyncIterator[str]:
+        """Yield JSON-encoded updates for a session until the caller stops iterating"""
+        if self.redis is None:
+            queue: asyncio.Queue = asyncio.Queue(maxsize=_SUBSCRIBER_QUEUE_SIZE)
+            self._subscribers.setdefault(session_id, set()).add(queue)
+            try:
+                while True:
+                    yield await queue.get()
+            finally:
+                subscribers = self._subscribers.get(session_id)
+                if subscribers is not None:
+                    subscribers.discard(queue)
+                    if not subscribers:
+                        del self._subscribers[session_id]
+            return
+        
+        # Start from the latest update, then block for newer ones; reading an
+        # empty stream from 0 also picks up anything added in between
+        stream = _stream_key(session_id)
+        last_id = "0-0"
+        latest = await self.redis.xrevrange(stream, count=1)
+        if latest:
+            last_id, fields = latest[0]
+            yield fields[b"data"].decode()
+        while True:
+            for _, entries in await self.redis.xread({stream: last_id}, block=0):
+                for last_id, fields in entries:
+                    yield fields[b"data"].decode()
+    
+    async def close(self) -> None:
+        """Close the Redis connection pool"""
+        if self.redis is not None:
+            await self.redis.aclose()
+
+
+# Singleton instance
+@lru_cache(maxsize=None)
+def get_report_store() -> ReportStore:
+    """Get or create singleton ReportStore"""
+    return ReportStore()
@@ -4,10 +4,16 @@ Manages research session state and agent coordination
 """
 
 import asyncio
-from typing import Optional, Dict, Any, List, Callable
+import heapq
+import time
+from collections import deque
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Callable, Tuple
 from datetime import datetime
 from loguru import logger
 
+from config import get_settings
+
 from core.models import (
     ResearchSession,
     ResearchQuery,
@@ -18,6 +24,30 @@ from core.models import (
     InnovationOpportunityReport,
 )
 
+# Agents that get state and a message queue in every session
+_AGENT_IDS = ("patent_scout", "market_analyst", "tech_trend", "verifier", "synthesizer")
+
+# Message types delivered to every agent in the session
+_BROADCAST_MESSAGE_TYPES = frozenset({"notification", "broadcast"})
+
+# Memory timestamps share one ISO string per millisecond bucket
+_TIMESTAMP_BUCKET_NS = 1_000_000
+_now_iso_cache: List[Any] = [-1, ""]  # [bucket, iso timestamp]
+
+
+def _now_iso() -> str:
+    """Current local time as an ISO string, formatted at most once per millisecond"""
+    bucket = time.monotonic_ns() // _TIMESTAMP_BUCKET_NS
+    if bucket != _now_iso_cache[0]:
+        _now_iso_cache[0] = bucket
+        _now_iso_cache[1] = datetime.now().isoformat()
+    return _now_iso_cache[1]
+
+
+def _copy_summary(summary: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a cached session summary so callers can't alter the cached one"""
+    return {**summary, "agents": {agent_id: dict(agent) for agent_id, agent in summary["agents"].items()}}
+
 
 class StateManager:
     """
@@ -28,9 +58,15 @@ class StateManager:
     def __init__(self):
         self.sessions: Dict[str, ResearchSession] = {}
         self.agent_states: Dict[str, Dict[str, AgentState]] = {}  # session_id -> {agent_id -> state}
-        self.message_queue: Dict[str, asyncio.Queue] = {}  # session_id -> message queue
+        self.message_queue: Dict[str, Dict[str, asyncio.Queue]] = {}  # session_id -> {agent_id -> queue}
+        self._pending_receivers: Dict[Tuple[str, str], asyncio.Future] = {}  # (session_id, agent_id) -> waiting receive
         self.event_callbacks: Dict[str, List[Callable]] = {}
-        self._lock = asyncio.Lock()
+        # Callbacks split by kind at registration so emitting never inspects them
+        self._sync_callbacks: Dict[str, List[Callable]] = {}
+        self._async_callbacks: Dict[str, List[Callable]] = {}
+        self.session_locks: Dict[str, asyncio.Lock] = {}  # session_id -> lock for that session's state
+        self._lock = asyncio.Lock()  # guards the session registry only
+        self._summaries: Dict[str, Dict[str, Any]] = {}  # session_id -> last summary built, reused until version changes
         
         logger.info("StateManager initialized")
     
@@ -40,18 +76,14 @@ class StateManager:
             session = ResearchSession(query=query)
             self.sessions[session.session_id] = session
             self.agent_states[session.session_id] = {}
-            self.message_queue[session.session_id] = asyncio.Queue()
+            self.message_queue[session.session_id] = {agent_id: asyncio.Queue() for agent_id in _AGENT_IDS}
+            self.session_locks[session.session_id] = asyncio.Lock()
             
-            # Initialize agent states
-            for agent_id in ["patent_scout", "market_analyst", "tech_trend", "verifier", "synthesizer"]:
-                self.agent_states[session.session_id][agent_id] = AgentState(
-                    agent_id=agent_id,
-                    agent_type=agent_id,
-                    status=AgentStatus.IDLE,
-                )
+            # Agent states are created on their first status update
             
             logger.info(f"Created research session: {session.session_id}")
-            await self._emit_event("session_created", session.session_id, {"session": session.model_dump()})
+            # Listeners get the model itself and serialize only if they need to
+            await self._emit_event("session_created", session.session_id, {"session": session})
             
             return session
     
@@ -61,11 +93,15 @@ class StateManager:
     
     async def update_phase(self, session_id: str, phase: ResearchPhase) -> None:
         """Update the current research phase"""
-        async with self._lock:
-            if session_id in self.sessions:
-                self.sessions[session_id].phase = phase
-                logger.info(f"Session {session_id} phase updated to: {phase.value}")
-                await self._emit_event("phase_updated", session_id, {"phase": phase.value})
+        lock = self.session_locks.get(session_id)
+        if lock is None:
+            return
+        async with lock:
+            session = self.sessions[session_id]
+            session.phase = phase
+            session.version += 1
+            logger.info(f"Session {session_id} phase updated to: {phase}")
+            await self._emit_event("phase_updated", session_id, {"phase": phase})
     
     async def update_agent_status(
         self,
@@ -78,34 +114,38 @@ class StateManager:
         error: Optional[str] = None,
     ) -> None:
         """Update an agent's status"""
-        async with self._lock:
-            if session_id in self.agent_states:
-                if agent_id not in self.agent_states[session_id]:
-                    self.agent_states[session_id][agent_id] = AgentState(
-                        agent_id=agent_id,
-                        agent_type=agent_id,
-                        status=status,
-                    )
-                
-                state = self.agent_states[session_id][agent_id]
-                state.status = status
-                state.current_task = current_task
-                state.progress_percent = progress
-                state.results_count = results_count
-                state.error_message = error
-                state.last_updated = datetime.now()
-                
-                # Also update session's agent status map
-                self.sessions[session_id].agent_statuses[agent_id] = status
-                
-                logger.debug(f"Agent {agent_id} status: {status.value} ({progress:.0f}%)")
-                await self._emit_event("agent_status_updated", session_id, {
-                    "agent_id": agent_id,
-                    "status": status.value,
-                    "current_task": current_task,
-                    "progress": progress,
-                    "results_count": results_count,
-                })
+        lock = self.session_locks.get(session_id)
+        if lock is None:
+            return
+        async with lock:
+            if agent_id not in self.agent_states[session_id]:
+                self.agent_states[session_id][agent_id] = AgentState(
+                    agent_id=agent_id,
+                    agent_type=agent_id,
+                    status=status,
+                )
+            
+            state = self.agent_states[session_id][agent_id]
+            state.status = status
+            state.current_task = current_task
+            state.progress_percent = progress
+            state.results_count = results_count
+            state.error_message = error
+            state.last_updated = datetime.now()
+            
+            # Also update session's agent status map
+            session = self.sessions[session_id]
+            session.agent_statuses[agent_id] = status
+            session.version += 1
+            
+            logger.debug(f"Agent {agent_id} status: {status} ({progress:.0f}%)")
+            await self._emit_event("agent_status_updated", session_id, {
+                "agent_id": agent_id,
+                "status": status,
+                "current_task": current_task,
+                "progress": progress,
+                "results_count": results_count,
+            })
     
     async def get_agent_states(self, session_id: str) -> Dict[str, AgentState]:
         """Get all agent states for a session"""
@@ -113,23 +153,61 @@ class StateManager:
     
     async def increment_sources(self, session_id: str, count: int = 1) -> None:
         """Increment the total sources analyzed counter"""
-        async with self._lock:
-            if session_id in self.sessions:
-                self.sessions[session_id].total_sources_analyzed += count
+        # No await between read and write, so this is atomic on the event loop
+        session = self.sessions.get(session_id)
+        if session is not None:
+            session.total_sources_analyzed += count
+            session.version += 1
     
     async def increment_recursion_depth(self, session_id: str) -> int:
         """Increment and return the current recursion depth"""
-        async with self._lock:
-            if session_id in self.sessions:
-                self.sessions[session_id].current_recursion_depth += 1
-                return self.sessions[session_id].current_recursion_depth
+        session = self.sessions.get(session_id)
+        if session is None:
             return 0
+        session.current_recursion_depth += 1
+        session.version += 1
+        return session.current_recursion_depth
     
     async def send_message(self, session_id: str, message: AgentMessage) -> None:
-        """Send a message to the session's message queue"""
-        if session_id in self.message_queue:
-            await self.message_queue[session_id].put(message)
-            logger.debug(f"Message sent: {message.from_agent} -> {message.to_agent}")
+        """Send a message to the recipient agent's queue"""
+        queues = self.message_queue.get(session_id)
+        if queues is None:
+            return
+        
+        if message.message_type in _BROADCAST_MESSAGE_TYPES:
+            await self.broadcast_message(session_id, message)
+            return
+        
+        queue = queues.get(message.to_agent)
+        if queue is None:
+            queue = queues[message.to_agent] = asyncio.Queue()
+        self._deliver(session_id, message.to_agent, queue, message)
+        logger.debug(f"Message sent: {message.from_agent} -> {message.to_agent}")
+    
+    async def broadcast_message(self, session_id: str, message: AgentMessage) -> None:
+        """Deliver a message to every agent in the session except its sender"""
+        queues = self.message_queue.get(session_id)
+        if queues is None:
+            return
+        
+        for agent_id, queue in queues.items():
+            if agent_id != message.from_agent:
+                self._deliver(session_id, agent_id, queue, message)
+        logger.debug(f"Message broadcast from {message.from_agent}")
+    
+    def _deliver(
+        self,
+        session_id: str,
+        agent_id: str,
+        queue: asyncio.Queue,
+        message: AgentMessage
+    ) -> None:
+        """Hand a message straight to a waiting receiver, else enqueue it"""
+        waiter = self._pending_receivers.pop((session_id, agent_id), None)
+        if waiter is not None and not waiter.done():
+            waiter.set_result(message)
+        else:
+            queue.put_nowait(message)
     
     async def receive_message(
         self,
@@ -138,24 +216,35 @@ class StateManager:
         timeout: float = 30.0
     ) -> Optional[AgentMessage]:
         """Receive a message for a specific agent"""
-        if session_id not in self.message_queue:
+        queues = self.message_queue.get(session_id)
+        if queues is None:
             return None
         
-        try:
-            # This is a simplified implementation - in production, 
-            # you'd have per-agent queues
-            message = await asyncio.wait_for(
-                self.message_queue[session_id].get(),
-                timeout=timeout
-            )
-            if message.to_agent == agent_id:
-                return message
-            else:
-                # Put it back if not for this agent
-                await self.message_queue[session_id].put(message)
+        queue = queues.get(agent_id)
+        if queue is None:
+            queue = queues[agent_id] = asyncio.Queue()
+        
+        if not queue.empty():
+            return queue.get_nowait()
+        
+        # Another receive for this agent is already parked; wait on the queue
+        key = (session_id, agent_id)
+        if key in self._pending_receivers:
+            try:
+                return await asyncio.wait_for(queue.get(), timeout=timeout)
+            except asyncio.TimeoutError:
                 return None
+        
+        # Park a future that send_message resolves directly, skipping the queue
+        waiter = asyncio.get_running_loop().create_future()
+        self._pending_receivers[key] = waiter
+        try:
+            return await asyncio.wait_for(waiter, timeout=timeout)
         except asyncio.TimeoutError:
             return None
+        finally:
+            if self._pending_receivers.get(key) is waiter:
+                del self._pending_receivers[key]
     
     async def complete_session(
         self,
@@ -164,93 +253,132 @@ class StateManager:
         error: Optional[str] = None
     ) -> None:
         """Mark a session as completed"""
-        async with self._lock:
-            if session_id in self.sessions:
-                session = self.sessions[session_id]
-                session.completed_at = datetime.now()
-                
-                if error:
-                    session.phase = ResearchPhase.FAILED
-                    session.error_message = error
-                else:
-                    session.phase = ResearchPhase.COMPLETED
-                
-                logger.info(f"Session {session_id} completed. Phase: {session.phase.value}")
-                await self._emit_event("session_completed", session_id, {
-                    "phase": session.phase.value,
-                    "error": error,
-                    "report_id": report.report_id if report else None,
-                })
+        lock = self.session_locks.get(session_id)
+        if lock is None:
+            return
+        async with lock:
+            session = self.sessions[session_id]
+            session.mark_completed()
+            session.version += 1
+            self._summaries.pop(session_id, None)
+            
+            if error:
+                session.phase = ResearchPhase.FAILED
+                session.error_message = error
+            else:
+                session.phase = ResearchPhase.COMPLETED
+            
+            logger.info(f"Session {session_id} completed. Phase: {session.phase}")
+            await self._emit_event("session_completed", session_id, {
+                "phase": session.phase,
+                "error": error,
+                "report_id": report.report_id if report else None,
+            })
     
     def on_event(self, event_type: str, callback: Callable) -> None:
         """Register an event callback"""
-        if event_type not in self.event_callbacks:
-            self.event_callbacks[event_type] = []
-        self.event_callbacks[event_type].append(callback)
+        self.event_callbacks.setdefault(event_type, []).append(callback)
+        kind = self._async_callbacks if asyncio.iscoroutinefunction(callback) else self._sync_callbacks
+        kind.setdefault(event_type, []).append(callback)
     
     async def _emit_event(self, event_type: str, session_id: str, data: Dict[str, Any]) -> None:
         """Emit an event to all registered callbacks"""
-        if event_type in self.event_callbacks:
-            for callback in self.event_callbacks[event_type]:
-                try:
-                    if asyncio.iscoroutinefunction(callback):
-                        await callback(session_id, data)
-                    else:
-                        callback(session_id, data)
-                except Exception as e:
-                    logger.error(f"Error in event callback: {e}")
-    
-    async def get_session_summary(self, session_id: str) -> Dict[str, Any]:
-        """Get a summary of the current session state"""
+        for callback in self._sync_callbacks.get(event_type, ()):
+            try:
+                callback(session_id, data)
+            except Exception as e:
+                logger.error(f"Error in event callback: {e}")
+        
+        async_callbacks = self._async_callbacks.get(event_type)
+        if not async_callbacks:
+            return
+        
+        # Run the async listeners concurrently rather than one after another
+        results = await asyncio.gather(
+            *(callback(session_id, data) for callback in async_callbacks),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error in event callback: {result}")
+    
+    async def get_session_summary(self, session_id: str, since: int = -1) -> Optional[Dict[str, Any]]:
+        """Get a summary of the current session state, or None if unchanged since that version"""
         session = await self.get_session(session_id)
         if not session:
             return {}
         
+        if session.version == since:
+            return None
+        
+        # Every mutation bumps the version, so a summary of the same version is still exact
+        cached = self._summaries.get(session_id)
+        if cached is not None and cached["version"] == session.version:
+            return _copy_summary(cached)
+        
         agent_states = await self.get_agent_states(session_id)
         
-        return {
+        # Agents that have not reported yet are shown as idle
+        agents = {
+            agent_id: {"status": AgentStatus.IDLE, "task": None, "progress": 0.0, "results": 0}
+            for agent_id in _AGENT_IDS
+        }
+        for agent_id, state in agent_states.items():
+            agents[agent_id] = {
+                "status": state.status,
+                "task": state.current_task,
+                "progress": state.progress_percent,
+                "results": state.results_count,
+            }
+        
+        summary = {
             "session_id": session_id,
+            "version": session.version,
             "query": session.query.query,
-            "phase": session.phase.value,
-            "started_at": session.started_at.isoformat(),
-            "completed_at": session.completed_at.isoformat() if session.completed_at else None,
+            "phase": session.phase,
+            "started_at": session.started_at_iso,
+            "completed_at": session.completed_at_iso,
             "recursion_depth": session.current_recursion_depth,
             "sources_analyzed": session.total_sources_analyzed,
-            "agents": {
-                agent_id: {
-                    "status": state.status.value,
-                    "task": state.current_task,
-                    "progress": state.progress_percent,
-                    "results": state.results_count,
-                }
-                for agent_id, state in agent_states.items()
-            },
+            "agents": agents,
             "error": session.error_message,
         }
+        # Finished sessions no longer change often enough to be worth caching
+        if session.phase not in (ResearchPhase.COMPLETED, ResearchPhase.FAILED):
+            self._summaries[session_id] = summary
+            return _copy_summary(summary)
+        return summary
 
 
 class RecursiveMemory:
     """
     Recursive memory system for tracking research paths and discoveries
     Enables agents to build on previous findings
+    
+    Assumes a single event loop: the append-only writers never await, so they
+    run without the lock, which is kept for track_entity's read-modify-write
+    
+    Discoveries, facts, hints and research paths are ring buffers capped at
+    MAX_MEMORY_ITEMS per session, so the oldest entries are evicted first
     """
     
-    def __init__(self):
+    def __init__(self, max_items: Optional[int] = None):
         self.memory: Dict[str, Dict[str, Any]] = {}  # session_id -> memory
-        self.research_paths: Dict[str, List[Dict[str, Any]]] = {}  # session_id -> paths
+        self.research_paths: Dict[str, deque] = {}  # session_id -> paths
+        self.max_items = max_items or get_settings().max_memory_items
         self._lock = asyncio.Lock()
     
     async def initialize_session(self, session_id: str) -> None:
         """Initialize memory for a new session"""
         async with self._lock:
             self.memory[session_id] = {
-                "discoveries": [],
-                "verified_facts": [],
-                "whitespace_hints": [],
+                "discoveries": deque(maxlen=self.max_items),
+                "verified_facts": deque(maxlen=self.max_items),
+                "whitespace_hints": deque(maxlen=self.max_items),
                 "key_entities": {},
                 "citation_network": {},
             }
-            self.research_paths[session_id] = []
+            self.research_paths[session_id] = deque(maxlen=self.max_items)
     
     async def add_discovery(
         self,
@@ -262,16 +390,15 @@ class RecursiveMemory:
         recursion_level: int = 0,
     ) -> None:
         """Add a discovery to memory"""
-        async with self._lock:
-            if session_id in self.memory:
-                self.memory[session_id]["discoveries"].append({
-                    "type": discovery_type,
-                    "content": content,
-                    "source": source,
-                    "confidence": confidence,
-                    "recursion_level": recursion_level,
-                    "timestamp": datetime.now().isoformat(),
-                })
+        if session_id in self.memory:
+            self.memory[session_id]["discoveries"].append({
+                "type": discovery_type,
+                "content": content,
+                "source": source,
+                "confidence": confidence,
+                "recursion_level": recursion_level,
+                "timestamp": _now_iso(),
+            })
     
     async def add_verified_fact(
         self,
@@ -281,14 +408,13 @@ class RecursiveMemory:
         confidence: float,
     ) -> None:
         """Add a verified fact to memory"""
-        async with self._lock:
-            if session_id in self.memory:
-                self.memory[session_id]["verified_facts"].append({
-                    "fact": fact,
-                    "sources": sources,
-                    "confidence": confidence,
-                    "verified_at": datetime.now().isoformat(),
-                })
+        if session_id in self.memory:
+            self.memory[session_id]["verified_facts"].append({
+                "fact": fact,
+                "sources": sources,
+                "confidence": confidence,
+                "verified_at": _now_iso(),
+            })
     
     async def add_whitespace_hint(
         self,
@@ -298,14 +424,13 @@ class RecursiveMemory:
         agent_source: str,
     ) -> None:
         """Add a whitespace opportunity hint"""
-        async with self._lock:
-            if session_id in self.memory:
-                self.memory[session_id]["whitespace_hints"].append({
-                    "hint": hint,
-                    "evidence": evidence,
-                    "agent_source": agent_source,
-                    "timestamp": datetime.now().isoformat(),
-                })
+        if session_id in self.memory:
+            self.memory[session_id]["whitespace_hints"].append({
+                "hint": hint,
+                "evidence": evidence,
+                "agent_source": agent_source,
+                "timestamp": _now_iso(),
+            })
     
     async def track_entity(
         self,
@@ -337,15 +462,14 @@ class RecursiveMemory:
         link_type: str = "cites",
     ) -> None:
         """Add a citation link to the network"""
-        async with self._lock:
-            if session_id in self.memory:
-                network = self.memory[session_id]["citation_network"]
-                if source_id not in network:
-                    network[source_id] = []
-                network[source_id].append({
-                    "target": target_id,
-                    "type": link_type,
-                })
+        if session_id in self.memory:
+            network = self.memory[session_id]["citation_network"]
+            if source_id not in network:
+                network[source_id] = []
+            network[source_id].append({
+                "target": target_id,
+                "type": link_type,
+            })
     
     async def record_research_path(
         self,
@@ -356,15 +480,14 @@ class RecursiveMemory:
         recursion_level: int,
     ) -> None:
         """Record a recursive research path"""
-        async with self._lock:
-            if session_id in self.research_paths:
-                self.research_paths[session_id].append({
-                    "from": from_query,
-                    "to": to_query,
-                    "reason": reason,
-                    "level": recursion_level,
-                    "timestamp": datetime.now().isoformat(),
-                })
+        if session_id in self.research_paths:
+            self.research_paths[session_id].append({
+                "from": from_query,
+                "to": to_query,
+                "reason": reason,
+                "level": recursion_level,
+                "timestamp": _now_iso(),
+            })
     
     async def get_discoveries(
         self,
@@ -376,7 +499,7 @@ class RecursiveMemory:
         if session_id not in self.memory:
             return []
         
-        discoveries = self.memory[session_id]["discoveries"]
+        discoveries = list(self.memory[session_id]["discoveries"])
         
         if discovery_type:
             discoveries = [d for d in discoveries if d["type"] == discovery_type]
@@ -390,13 +513,13 @@ class RecursiveMemory:
         """Get all verified facts"""
         if session_id not in self.memory:
             return []
-        return self.memory[session_id]["verified_facts"]
+        return list(self.memory[session_id]["verified_facts"])
     
     async def get_whitespace_hints(self, session_id: str) -> List[Dict[str, Any]]:
         """Get all whitespace hints"""
         if session_id not in self.memory:
             return []
-        return self.memory[session_id]["whitespace_hints"]
+        return list(self.memory[session_id]["whitespace_hints"])
     
     async def get_top_entities(
         self,
@@ -408,17 +531,16 @@ class RecursiveMemory:
         if session_id not in self.memory:
             return []
         
-        entities = list(self.memory[session_id]["key_entities"].values())
+        entities = self.memory[session_id]["key_entities"].values()
         
         if entity_type:
-            entities = [e for e in entities if e["type"] == entity_type]
+            entities = (e for e in entities if e["type"] == entity_type)
         
-        entities.sort(key=lambda x: x["mentions"], reverse=True)
-        return entities[:limit]
+        return heapq.nlargest(limit, entities, key=lambda x: x["mentions"])
     
     async def get_research_paths(self, session_id: str) -> List[Dict[str, Any]]:
         """Get all research paths taken"""
-        return self.research_paths.get(session_id, [])
+        return list(self.research_paths.get(session_id, ()))
     
     async def get_full_memory(self, session_id: str) -> Dict[str, Any]:
         """Get the complete memory for a session"""
@@ -427,26 +549,18 @@ class RecursiveMemory:
         
         return {
             "memory": self.memory[session_id],
-            "research_paths": self.research_paths.get(session_id, []),
+            "research_paths": list(self.research_paths.get(session_id, ())),
         }
 
 
 # Singleton instances
-_state_manager: Optional[StateManager] = None
-_recursive_memory: Optional[RecursiveMemory] = None
-
-
+@lru_cache(maxsize=None)
 def get_state_manager() -> StateManager:
     """Get or create singleton StateManager"""
-    global _state_manager
-    if _state_manager is None:
-        _state_manager = StateManager()
-    return _state_manager
+    return StateManager()
 
 
+@lru_cache(maxsize=None)
 def get_recursive_memory() -> RecursiveMemory:
     """Get or create singleton RecursiveMemory"""
-    global _recursive_memory
-    if _recursive_memory is None:
-        _recursive_memory = RecursiveMemory()
-    return _recursive_memory
+    return RecursiveMemory()
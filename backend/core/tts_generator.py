@@ -3,8 +3,13 @@ NEXUS-R&D TTS Generator
 Text-to-Speech Audio Brief generation using ElevenLabs AI Voices
 """
 
+import asyncio
 import os
-from typing import Dict, Any, Optional
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, Iterator, Optional, Tuple
 from loguru import logger
 
 try:
@@ -14,6 +19,12 @@ except ImportError:
     ELEVENLABS_AVAILABLE = False
     logger.warning("ElevenLabs not installed. Install with: pip install elevenlabs")
 
+# Markdown emphasis markers, stripped before text is spoken
+_MD_STAR_RE = re.compile(r"\*+")
+
+# Blocking ElevenLabs calls run on their own small pool, not the default executor
+_TTS_MAX_WORKERS = 2
+
 
 class TTSGenerator:
     """
@@ -24,23 +35,36 @@ class TTSGenerator:
     """
     
     def __init__(self, output_dir: str = "static/audio"):
-        self.output_dir = output_dir
+        self.output_dir = os.path.abspath(output_dir)
         os.makedirs(output_dir, exist_ok=True)
         
-        # Initialize ElevenLabs client
-        self.client = None
-        if ELEVENLABS_AVAILABLE:
-            api_key = os.getenv("ELEVENLABS_API_KEY")
-            if api_key:
-                self.client = ElevenLabs(api_key=api_key)
-            else:
-                logger.warning("ELEVENLABS_API_KEY not set in environment")
+        # ElevenLabs client is built on first use
+        self._client = None
+        self._api_key = os.getenv("ELEVENLABS_API_KEY")
+        if ELEVENLABS_AVAILABLE and not self._api_key:
+            logger.warning("ELEVENLABS_API_KEY not set in environment")
+        
+        self._executor = ThreadPoolExecutor(max_workers=_TTS_MAX_WORKERS, thread_name_prefix="tts")
         
         # Default voice settings - use env var or fallback to Rachel
         self.voice_id = os.getenv("ELEVENLABS_VOICE_ID", "21m00Tcm4TlvDq8ikWAM")
         self.model_id = "eleven_monolingual_v1"
         
-    def generate_audio_brief(
+        # Last script built, as (report key, script, word count)
+        self._script_cache: Optional[Tuple[str, str, int]] = None
+    
+    @property
+    def client(self):
+        """ElevenLabs client, or None when the SDK or API key is missing"""
+        if self._client is None and ELEVENLABS_AVAILABLE and self._api_key:
+            self._client = ElevenLabs(api_key=self._api_key)
+        return self._client
+    
+    def close(self) -> None:
+        """Stop the TTS worker threads"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+    
+    async def generate_audio_brief(
         self,
         session_id: str,
         report: Dict[str, Any],
@@ -77,19 +101,15 @@ class TTSGenerator:
             
             logger.info(f"Generating ElevenLabs audio brief for session {session_id}")
             
-            # Generate audio using ElevenLabs
-            audio = self.client.text_to_speech.convert(
-                text=script,
-                voice_id=voice_id or self.voice_id,
-                model_id=self.model_id,
-                output_format="mp3_44100_128"
+            # The ElevenLabs client and file writes are blocking, keep them off the event loop
+            await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                self._stream_audio_to_file,
+                script,
+                voice_id or self.voice_id,
+                output_path,
             )
             
-            # Save audio to file
-            with open(output_path, "wb") as f:
-                for chunk in audio:
-                    f.write(chunk)
-            
             logger.info(f"Audio brief saved to {output_path}")
             
             return output_path
@@ -98,92 +118,122 @@ class TTSGenerator:
             logger.error(f"ElevenLabs TTS generation error: {e}")
             return None
     
+    def _stream_audio_to_file(self, script: str, voice_id: str, output_path: str) -> None:
+        """Stream synthesized audio to a temp file, then move it to output_path"""
+        audio = self.client.text_to_speech.stream(
+            text=script,
+            voice_id=voice_id,
+            model_id=self.model_id,
+            output_format="mp3_44100_128"
+        )
+        
+        # A failed or concurrent stream never leaves a partial MP3 at the served path
+        fd, temp_path = tempfile.mkstemp(dir=self.output_dir, suffix=".mp3.part")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in audio:
+                    if chunk:
+                        f.write(chunk)
+            os.replace(temp_path, output_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    
     def _generate_script(self, report: Dict[str, Any]) -> str:
         """Generate a spoken script from the research report"""
+        return self._script_with_word_count(report)[0]
+    
+    def _script_with_word_count(self, report: Dict[str, Any]) -> Tuple[str, int]:
+        """Build the script and its word count, reusing the last result for the same report"""
+        key = report.get("report_id") or report.get("session_id")
+        cached = self._script_cache
+        if key and cached is not None and cached[0] == key:
+            return cached[1], cached[2]
         
-        parts = []
+        # Join with natural pauses
+        script = " ".join(self._iter_script(report))
+        word_count = len(script.split())
+        if key:
+            self._script_cache = (key, script, word_count)
+        return script, word_count
+    
+    def _iter_script(self, report: Dict[str, Any]) -> Iterator[str]:
+        """Yield the spoken script for a research report sentence by sentence"""
         
         # Introduction
         query = report.get("query", "the research topic")
-        parts.append(f"NEXUS R&D Innovation Brief for: {query}.")
-        parts.append("Here is your executive summary.")
+        yield f"NEXUS R&D Innovation Brief for: {query}."
+        yield "Here is your executive summary."
         
         # Executive Summary
         executive_summary = report.get("executive_summary", "")
         if executive_summary:
             # Clean up for speech
-            summary = executive_summary.replace("**", "").replace("*", "")
+            summary = _MD_STAR_RE.sub("", executive_summary)
             summary = summary.replace("\n", " ").strip()
             if len(summary) > 600:
                 summary = summary[:600] + "..."
-            parts.append(summary)
+            yield summary
         
         # Key Statistics
-        parts.append("Key findings from our analysis.")
+        yield "Key findings from our analysis."
         
         patent_count = report.get("patent_analysis", {}).get("total_patents_found", 0)
         if patent_count:
-            parts.append(f"We analyzed {patent_count} patents in this domain.")
+            yield f"We analyzed {patent_count} patents in this domain."
         
         papers_count = report.get("tech_analysis", {}).get("total_papers_analyzed", 0)
         if papers_count:
-            parts.append(f"We reviewed {papers_count} research papers.")
+            yield f"We reviewed {papers_count} research papers."
         
         sources = report.get("sources_analyzed", 0)
         if sources:
-            parts.append(f"Total sources analyzed: {sources}.")
+            yield f"Total sources analyzed: {sources}."
         
         # Innovation Whitespace
         whitespace = report.get("innovation_whitespace", [])
         if whitespace:
-            parts.append(f"We identified {len(whitespace)} innovation opportunities.")
+            yield f"We identified {len(whitespace)} innovation opportunities."
             
             # Top opportunity
             if len(whitespace) > 0:
                 top = whitespace[0]
                 area = top.get("opportunity_area", "")
                 if area:
-                    parts.append(f"The top opportunity is: {area}.")
+                    yield f"The top opportunity is: {area}."
                     
                 description = top.get("description", "")
                 if description:
-                    desc_clean = description.replace("**", "").replace("*", "")[:250]
-                    parts.append(desc_clean)
+                    yield _MD_STAR_RE.sub("", description[:250])
         
         # Technology Trends
         trends = report.get("tech_analysis", {}).get("trends", [])
         if trends:
-            parts.append(f"We identified {len(trends)} technology trends.")
+            yield f"We identified {len(trends)} technology trends."
             
             # Mention top trends
             for trend in trends[:2]:
                 name = trend.get("technology_name", "")
                 if name:
                     maturity = trend.get("maturity_level", "emerging")
-                    parts.append(f"{name} is currently {maturity}.")
+                    yield f"{name} is currently {maturity}."
         
         # Competitive Threats
         threats = report.get("competitive_threats", [])
         if threats:
-            parts.append(f"We detected {len(threats)} competitive threats to monitor.")
+            yield f"We detected {len(threats)} competitive threats to monitor."
         
         # Conclusion
         confidence = report.get("confidence_score", 0.8)
         confidence_pct = int(confidence * 100)
-        parts.append(f"Overall analysis confidence: {confidence_pct} percent.")
-        
-        parts.append("This concludes your NEXUS R&D innovation brief. For the full report, please refer to the dashboard or export the PDF.")
+        yield f"Overall analysis confidence: {confidence_pct} percent."
         
-        # Join with natural pauses
-        script = " ".join(parts)
-        
-        return script
+        yield "This concludes your NEXUS R&D innovation brief. For the full report, please refer to the dashboard or export the PDF."
     
     def get_audio_duration_estimate(self, report: Dict[str, Any]) -> int:
         """Estimate audio duration in seconds"""
-        script = self._generate_script(report)
+        _, word_count = self._script_with_word_count(report)
         # Average speaking rate: ~150 words per minute
-        word_count = len(script.split())
         duration_seconds = int((word_count / 150) * 60)
         return max(30, min(180, duration_seconds))  # 30s to 3min
     
@@ -201,12 +251,7 @@ class TTSGenerator:
 
 
 # Singleton instance
-_tts_generator: Optional[TTSGenerator] = None
-
-
+@lru_cache(maxsize=None)
 def get_tts_generator() -> TTSGenerator:
     """Get or create TTS generator instance"""
-    global _tts_generator
-    if _tts_generator is None:
-        _tts_generator = TTSGenerator()
-    return _tts_generator
+    return TTSGenerator()
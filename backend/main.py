@@ -4,25 +4,41 @@ Main entry point for the backend API
 """
 
 import asyncio
-from contextlib import asynccontextmanager
+import hashlib
+from contextlib import aclosing, asynccontextmanager
 from datetime import datetime
 from typing import Optional
 import sys
 import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from cachetools import TTLCache
+from fastapi import Depends, FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from pydantic import BaseModel, Field
 from loguru import logger
 
 from config import get_settings
 from core.models import ResearchQuery, ResearchPhase
 from core.state_manager import get_state_manager
-from orchestrator import get_orchestrator
+from core.report_store import get_report_store
+from core.gemini_engine import get_gemini_engine
+from core.pdf_generator import render_report_pdf, warm_up_worker
+from core.tts_generator import get_tts_generator
+from agents.base_agent import get_http_client
+from orchestrator import Orchestrator, get_orchestrator
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:  # not available on Windows
+    UVLOOP_AVAILABLE = False
 
 
 # Configure logging
@@ -34,20 +50,78 @@ logger.add(
 )
 
 
-# Store active research tasks
-active_tasks: dict = {}
-completed_reports: dict = {}
+# Store active research tasks (session_id -> task), drained on shutdown
+active_tasks: dict[str, asyncio.Task] = {}
+_SHUTDOWN_DRAIN_SECONDS = 30
+
+# PDF layout is CPU-bound, so it runs in worker processes (spawned at
+# startup, never forked from the running loop) where it can't hold the GIL
+# against the event loop
+_PDF_WORKERS = 2
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """Get the PDF worker pool, creating it on first use"""
+    global _pdf_pool
+    if _pdf_pool is None:
+        _pdf_pool = ProcessPoolExecutor(
+            max_workers=_PDF_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pdf_pool
+
+# Rendered exports keyed by (session_id, report_id); PDFs above the item
+# size are served without caching
+_PDF_CACHE_ITEM_MAX_BYTES = 4 * 1024 * 1024
+_pdf_cache: TTLCache = TTLCache(maxsize=64 * 1024 * 1024, ttl=3600, getsizeof=len)
+_audio_cache: TTLCache = TTLCache(maxsize=256, ttl=3600)
+_audio_inflight: dict[tuple, asyncio.Task] = {}  # (session_id, report_id) -> running generation
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler"""
+    global _pdf_pool
     logger.info("🚀 NEXUS-R&D Starting up...")
     settings = get_settings()
     logger.info(f"📊 Debug mode: {settings.debug}")
     logger.info(f"🤖 Gemini model: {settings.gemini_model}")
+    try:
+        await get_gemini_engine().warm_up()
+    except Exception as e:
+        logger.warning(f"Gemini engine unavailable at startup: {e}")
+    setup_broadcast()
+    try:
+        # Build the orchestrator and its agents now rather than on the first request
+        get_orchestrator()
+    except Exception as e:
+        logger.warning(f"Orchestrator unavailable at startup: {e}")
+    try:
+        # Start the PDF workers with ReportLab loaded, and build the TTS generator up front
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(
+            loop.run_in_executor(_get_pdf_pool(), warm_up_worker) for _ in range(_PDF_WORKERS)
+        ))
+        get_tts_generator()
+    except Exception as e:
+        logger.warning(f"Export warm-up failed: {e}")
     yield
     logger.info("👋 NEXUS-R&D Shutting down...")
+    if active_tasks:
+        logger.info(f"Waiting for {len(active_tasks)} research task(s) to finish...")
+        _, pending = await asyncio.wait(list(active_tasks.values()), timeout=_SHUTDOWN_DRAIN_SECONDS)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    if _pdf_pool is not None:
+        _pdf_pool.shutdown(wait=False, cancel_futures=True)
+        _pdf_pool = None
+    if get_http_client.cache_info().currsize:
+        await get_http_client().aclose()
+    await get_report_store().close()
+    if get_tts_generator.cache_info().currsize:
+        get_tts_generator().close()
 
 
 # Create FastAPI app
@@ -56,8 +130,41 @@ app = FastAPI(
     description="Recursive Innovation Intelligence Engine - Autonomous R&D research platform",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+
+class UnhandledExceptionMiddleware:
+    """Log unexpected handler errors with their traceback and return a 500"""
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        
+        response_started = False
+        
+        async def send_tracking(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_tracking)
+        except Exception as exc:
+            logger.opt(exception=exc).error(f"{scope['method']} {scope['path']} failed")
+            # Once headers are out the client only sees a truncated body
+            if not response_started:
+                response = ORJSONResponse(status_code=500, content={"detail": str(exc)})
+                await response(scope, receive, send)
+
+
+# Added before CORS so CORS wraps it and the 500 still carries its headers
+app.add_middleware(UnhandledExceptionMiddleware)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -67,6 +174,7 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
 from fastapi.staticfiles import StaticFiles
 import os
 
@@ -145,8 +253,16 @@ async def health_check():
     }
 
 
+def orchestrator_dep() -> Orchestrator:
+    """FastAPI dependency for the process-wide Orchestrator"""
+    return get_orchestrator()
+
+
 @app.post("/research", response_model=ResearchResponse)
-async def start_research(request: ResearchRequest, background_tasks: BackgroundTasks):
+async def start_research(
+    request: ResearchRequest,
+    orchestrator: Orchestrator = Depends(orchestrator_dep),
+):
     """
     Start a new research session
     
@@ -157,54 +273,56 @@ async def start_research(request: ResearchRequest, background_tasks: BackgroundT
     4. Verifier validates all claims
     5. Synthesizer generates final report
     """
-    try:
-        # Create research query
-        query = ResearchQuery(
-            query=request.query,
-            domain=request.domain,
-            geographic_scope=request.geographic_scope,
-            time_range_years=request.time_range_years,
-            max_recursion_depth=request.max_recursion_depth,
-        )
-        
-        # Get orchestrator
-        orchestrator = get_orchestrator()
-        
-        # Create session
-        state_manager = get_state_manager()
-        session = await state_manager.create_session(query)
-        session_id = session.session_id
-        
-        # Start research in background
-        background_tasks.add_task(
-            run_research_task,
-            session_id,
-            query,
-        )
-        
-        logger.info(f"Research session started: {session_id}")
-        
-        return ResearchResponse(
-            session_id=session_id,
-            status="started",
-            message=f"Research initiated for: {request.query}",
-        )
-        
-    except Exception as e:
-        logger.error(f"Failed to start research: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    # Create research query
+    query = ResearchQuery(
+        query=request.query,
+        domain=request.domain,
+        geographic_scope=request.geographic_scope,
+        time_range_years=request.time_range_years,
+        max_recursion_depth=request.max_recursion_depth,
+    )
+    
+    session_id = await _launch_research(orchestrator, query)
+    
+    logger.info(f"Research session started: {session_id}")
+    
+    return ResearchResponse(
+        session_id=session_id,
+        status="started",
+        message=f"Research initiated for: {request.query}",
+    )
 
 
-async def run_research_task(session_id: str, query: ResearchQuery):
+async def _launch_research(
+    orchestrator: Orchestrator,
+    query: ResearchQuery,
+    demo_key: Optional[str] = None,
+) -> str:
+    """Create a session and start its research in the background"""
+    state_manager = get_state_manager()
+    session = await state_manager.create_session(query)
+    session_id = session.session_id
+    
+    # Start research in background, tracked so shutdown can drain it
+    task = asyncio.create_task(run_research_task(orchestrator, session_id, query, demo_key))
+    active_tasks[session_id] = task
+    task.add_done_callback(lambda _: active_tasks.pop(session_id, None))
+    return session_id
+
+
+async def run_research_task(
+    orchestrator: Orchestrator,
+    session_id: str,
+    query: ResearchQuery,
+    demo_key: Optional[str] = None,
+):
     """Background task to run research"""
     try:
-        orchestrator = get_orchestrator()
-        
-        # Run the full workflow
+        # Run the full workflow; the orchestrator stores the session's report
         report = await orchestrator.run(session_id, query)
         
-        # Store completed report
-        completed_reports[session_id] = report
+        if demo_key:
+            await get_report_store().save_demo_report(demo_key, report)
         
         logger.info(f"Research completed: {session_id}")
         
@@ -215,71 +333,99 @@ async def run_research_task(session_id: str, query: ResearchQuery):
 
 
 @app.get("/research/{session_id}/status")
-async def get_research_status(session_id: str):
+async def get_research_status(session_id: str, since: int = -1):
     """
     Get the current status of a research session
     
-    Returns real-time status of all agents and overall progress
+    Returns real-time status of all agents and overall progress,
+    or 304 when the session's version still equals `since`
     """
-    try:
-        state_manager = get_state_manager()
-        status = await state_manager.get_session_summary(session_id)
-        
-        if not status:
-            raise HTTPException(status_code=404, detail="Session not found")
-        
-        return status
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Status check error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    state_manager = get_state_manager()
+    status = await state_manager.get_session_summary(session_id, since=since)
+    
+    if status is None:
+        return Response(status_code=304)
+    
+    if not status:
+        raise HTTPException(status_code=404, detail="Session not found")
+    
+    return status
 
 
-@app.get("/research/{session_id}/report")
-async def get_research_report(session_id: str):
+@app.api_route("/research/{session_id}/report", methods=["GET", "HEAD"])
+async def get_research_report(session_id: str, request: Request):
     """
     Get the completed Innovation Opportunity Report
     
-    Returns the full report once research is complete
+    Returns the full report once research is complete. Supports
+    If-None-Match revalidation and HEAD readiness checks.
     """
-    try:
-        # Check if report is ready
-        if session_id in completed_reports:
-            return completed_reports[session_id]
-        
-        # Check session status
-        state_manager = get_state_manager()
-        session = await state_manager.get_session(session_id)
-        
-        if not session:
-            raise HTTPException(status_code=404, detail="Session not found")
-        
-        if session.phase == ResearchPhase.FAILED:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Research failed: {session.error_message}"
+    store = get_report_store()
+    meta = await store.get_report_meta(session_id)
+    if meta is not None:
+        etag, length = meta
+        # Client already holds this report
+        if_none_match = request.headers.get("if-none-match", "")
+        if etag in (tag.strip() for tag in if_none_match.split(",")):
+            return Response(status_code=304, headers={"ETag": etag})
+        
+        # Readiness check answered from the stored length, without the body
+        if request.method == "HEAD":
+            return Response(
+                media_type="application/json",
+                headers={"ETag": etag, "Content-Length": str(length)}
             )
         
-        if session.phase != ResearchPhase.COMPLETED:
-            return JSONResponse(
-                status_code=202,
-                content={
-                    "status": "in_progress",
-                    "phase": session.phase.value,
-                    "message": "Research still in progress. Please check status endpoint.",
-                },
+        # Report is stored already encoded, so send the bytes as-is
+        report_json = await store.get_report_json(session_id)
+        if report_json is not None:
+            return Response(
+                content=report_json,
+                media_type="application/json",
+                headers={"ETag": etag}
             )
-        
-        # If completed but not in cache, return error
-        raise HTTPException(status_code=404, detail="Report not found")
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Report retrieval error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    
+    # Check session status
+    state_manager = get_state_manager()
+    session = await state_manager.get_session(session_id)
+    
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+    
+    if session.phase == ResearchPhase.FAILED:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Research failed: {session.error_message}"
+        )
+    
+    if session.phase != ResearchPhase.COMPLETED:
+        return ORJSONResponse(
+            status_code=202,
+            content={
+                "status": "in_progress",
+                "phase": session.phase,
+                "message": "Research still in progress. Please check status endpoint.",
+            },
+        )
+    
+    # If completed but not in cache, return error
+    raise HTTPException(status_code=404, detail="Report not found")
+
+
+async def _render_pdf(report: dict) -> bytes:
+    """Render a PDF in the worker pool, replacing the pool once if a worker has died"""
+    global _pdf_pool
+    loop = asyncio.get_running_loop()
+    pool = _get_pdf_pool()
+    try:
+        return await loop.run_in_executor(pool, render_report_pdf, report)
+    except BrokenProcessPool:
+        logger.warning("PDF worker died, restarting the worker pool")
+        # A concurrent export may already have replaced it
+        if _pdf_pool is pool:
+            pool.shutdown(wait=False, cancel_futures=True)
+            _pdf_pool = None
+        return await loop.run_in_executor(_get_pdf_pool(), render_report_pdf, report)
 
 
 @app.get("/research/{session_id}/export/pdf")
@@ -289,39 +435,48 @@ async def export_report_pdf(session_id: str):
     
     Returns a downloadable PDF file with the full Innovation Opportunity Report
     """
-    from fastapi.responses import Response
+    # Check if report exists
+    report = await get_report_store().get_report(session_id)
+    if report is None:
+        raise HTTPException(status_code=404, detail="Report not found. Research may still be in progress.")
     
+    # Generate filename
+    report_id = report.get("report_id", f"IOR-{session_id[:8]}")
+    filename = f"{report_id}.pdf"
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    
+    cache_key = (session_id, report_id)
+    pdf_bytes = _pdf_cache.get(cache_key)
+    if pdf_bytes is not None:
+        return Response(content=pdf_bytes, media_type="application/pdf", headers=headers)
+    
+    # Generate PDF in a worker process
+    pdf_bytes = await _render_pdf(report)
+    
+    logger.info(f"Generated PDF report: {filename}")
+    
+    if len(pdf_bytes) <= _PDF_CACHE_ITEM_MAX_BYTES:
+        _pdf_cache[cache_key] = pdf_bytes
+    return Response(content=pdf_bytes, media_type="application/pdf", headers=headers)
+
+
+def _stat_or_none(path: str) -> Optional[os.stat_result]:
+    """Stat a file, or None if it no longer exists"""
     try:
-        # Check if report exists
-        if session_id not in completed_reports:
-            raise HTTPException(status_code=404, detail="Report not found. Research may still be in progress.")
-        
-        report = completed_reports[session_id]
-        
-        # Generate PDF
-        from core.pdf_generator import get_pdf_generator
-        pdf_generator = get_pdf_generator()
-        pdf_bytes = pdf_generator.generate_report(report)
-        
-        # Generate filename
-        report_id = report.get("report_id", f"IOR-{session_id[:8]}")
-        filename = f"{report_id}.pdf"
-        
-        logger.info(f"Generated PDF report: {filename}")
-        
-        return Response(
-            content=pdf_bytes,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f'attachment; filename="{filename}"'
-            }
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"PDF export error: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to generate PDF: {str(e)}")
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+async def _generate_audio_once(cache_key: tuple, session_id: str, report: dict) -> Optional[str]:
+    """Generate an audio brief, sharing one generation between concurrent requests"""
+    task = _audio_inflight.get(cache_key)
+    if task is None:
+        task = asyncio.create_task(get_tts_generator().generate_audio_brief(session_id, report))
+        _audio_inflight[cache_key] = task
+        task.add_done_callback(lambda _: _audio_inflight.pop(cache_key, None))
+    # A disconnecting client must not cancel a generation others are waiting on
+    return await asyncio.shield(task)
 
 
 @app.get("/research/{session_id}/export/audio")
@@ -331,19 +486,22 @@ async def export_audio_brief(session_id: str):
     
     Returns a downloadable MP3 file with a spoken summary of key findings
     """
-    from fastapi.responses import FileResponse
+    # Check if report exists
+    report = await get_report_store().get_report(session_id)
+    if report is None:
+        raise HTTPException(status_code=404, detail="Report not found. Research may still be in progress.")
     
-    try:
-        # Check if report exists
-        if session_id not in completed_reports:
-            raise HTTPException(status_code=404, detail="Report not found. Research may still be in progress.")
-        
-        report = completed_reports[session_id]
-        
+    # Generate filename
+    report_id = report.get("report_id", f"IOR-{session_id[:8]}")
+    filename = f"{report_id}_brief.mp3"
+    
+    # Reuse the MP3 already rendered for this report if it is still on disk
+    cache_key = (session_id, report_id)
+    audio_path = _audio_cache.get(cache_key)
+    audio_stat = _stat_or_none(audio_path) if audio_path else None
+    if audio_stat is None:
         # Generate Audio Brief
-        from core.tts_generator import get_tts_generator
-        tts_generator = get_tts_generator()
-        audio_path = tts_generator.generate_audio_brief(session_id, report)
+        audio_path = await _generate_audio_once(cache_key, session_id, report)
         
         if not audio_path:
             raise HTTPException(
@@ -351,35 +509,31 @@ async def export_audio_brief(session_id: str):
                 detail="Failed to generate audio. Please install gTTS: pip install gtts"
             )
         
-        # Generate filename
-        report_id = report.get("report_id", f"IOR-{session_id[:8]}")
-        filename = f"{report_id}_brief.mp3"
-        
+        audio_stat = os.stat(audio_path)
+        _audio_cache[cache_key] = audio_path
         logger.info(f"Generated audio brief: {filename}")
-        
-        return FileResponse(
-            path=audio_path,
-            media_type="audio/mpeg",
-            filename=filename,
-            headers={
-                "Content-Disposition": f'attachment; filename="{filename}"'
-            }
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Audio export error: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to generate audio: {str(e)}")
+    
+    # Passing the stat result sets Content-Length up front and lets the
+    # server send the file with sendfile(2) when it supports it
+    return FileResponse(
+        path=audio_path,
+        media_type="audio/mpeg",
+        filename=filename,
+        stat_result=audio_stat,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Cache-Control": "public, max-age=3600"
+        }
+    )
 
 @app.post("/research/demo")
-async def run_demo_research(background_tasks: BackgroundTasks):
+async def run_demo_research(orchestrator: Orchestrator = Depends(orchestrator_dep)):
     """
     Run a demo research session with pre-configured query
     
     This is for demonstration purposes - runs the "Battery Technology" scenario
     """
-    demo_query = ResearchRequest(
+    query = ResearchQuery(
         query="next-generation battery technology for electric vehicles",
         domain="energy storage",
         geographic_scope=["US", "EU", "CN", "JP"],
@@ -387,7 +541,31 @@ async def run_demo_research(background_tasks: BackgroundTasks):
         max_recursion_depth=3,
     )
     
-    return await start_research(demo_query, background_tasks)
+    # The demo query is fixed, so its report is cached and replayed into a new session
+    demo_key = hashlib.sha1(query.model_dump_json().encode()).hexdigest()
+    store = get_report_store()
+    cached_report = await store.get_demo_report(demo_key)
+    if cached_report is None:
+        session_id = await _launch_research(orchestrator, query, demo_key)
+        logger.info(f"Demo research session started: {session_id}")
+        return ResearchResponse(
+            session_id=session_id,
+            status="started",
+            message=f"Research initiated for: {query.query}",
+        )
+    
+    state_manager = get_state_manager()
+    session = await state_manager.create_session(query)
+    session_id = session.session_id
+    await store.save_report(session_id, {**cached_report, "session_id": session_id})
+    await state_manager.complete_session(session_id)
+    
+    logger.info(f"Demo research session served from cache: {session_id}")
+    return ResearchResponse(
+        session_id=session_id,
+        status="completed",
+        message=f"Cached demo report replayed for: {query.query}",
+    )
 
 
 # ============================================
@@ -396,17 +574,22 @@ async def run_demo_research(background_tasks: BackgroundTasks):
 
 from fastapi import WebSocket, WebSocketDisconnect
 
-connected_clients: dict[str, list[WebSocket]] = {}
-
 
 @app.websocket("/ws/{session_id}")
 async def websocket_endpoint(websocket: WebSocket, session_id: str):
     """WebSocket endpoint for real-time research updates"""
     await websocket.accept()
     
-    if session_id not in connected_clients:
-        connected_clients[session_id] = []
-    connected_clients[session_id].append(websocket)
+    # Updates may be published by any worker, so forward them from the store
+    async def forward_updates():
+        try:
+            async with aclosing(get_report_store().subscribe(session_id)) as updates:
+                async for payload in updates:
+                    await websocket.send_text(payload)
+        except Exception as e:
+            logger.debug(f"WebSocket forwarding stopped for {session_id}: {e}")
+    
+    forwarder = asyncio.create_task(forward_updates())
     
     try:
         while True:
@@ -418,19 +601,31 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
                 await websocket.send_text("pong")
                 
     except WebSocketDisconnect:
-        connected_clients[session_id].remove(websocket)
-        if not connected_clients[session_id]:
-            del connected_clients[session_id]
+        pass
+    finally:
+        forwarder.cancel()
 
 
 async def broadcast_update(session_id: str, update: dict):
     """Broadcast update to all connected clients for a session"""
-    if session_id in connected_clients:
-        for client in connected_clients[session_id]:
-            try:
-                await client.send_json(update)
-            except:
-                pass
+    try:
+        await get_report_store().publish(session_id, update)
+    except Exception as e:
+        logger.warning(f"Failed to publish update for {session_id}: {e}")
+
+
+# Status updates are coalesced per session and flushed as one snapshot
+_STATUS_FLUSH_SECONDS = 0.2
+_status_flushes: dict[str, asyncio.Task] = {}
+
+
+async def _flush_status(session_id: str):
+    """Send the latest session summary once the coalescing window closes"""
+    await asyncio.sleep(_STATUS_FLUSH_SECONDS)
+    _status_flushes.pop(session_id, None)
+    summary = await get_state_manager().get_session_summary(session_id)
+    if summary:
+        await broadcast_update(session_id, {"type": "status_update", "data": summary})
 
 
 # Register broadcast callback with state manager
@@ -438,11 +633,13 @@ def setup_broadcast():
     """Setup broadcast callbacks"""
     state_manager = get_state_manager()
     
-    async def on_status_update(session_id: str, data: dict):
-        await broadcast_update(session_id, {"type": "status_update", "data": data})
+    def on_status_update(session_id: str, data: dict):
+        if session_id not in _status_flushes:
+            _status_flushes[session_id] = asyncio.create_task(_flush_status(session_id))
     
     state_manager.on_event("agent_status_updated", on_status_update)
     state_manager.on_event("phase_updated", on_status_update)
+    state_manager.on_event("session_completed", on_status_update)
 
 
 # ============================================
@@ -454,12 +651,11 @@ if __name__ == "__main__":
     
     settings = get_settings()
     
-    setup_broadcast()
-    
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
         reload=settings.debug,
         log_level="info",
+        loop="uvloop" if UVLOOP_AVAILABLE else "asyncio",
     )
@@ -10,6 +10,7 @@ from loguru import logger
 
 from core.models import ResearchQuery, ResearchPhase
 from core.state_manager import get_state_manager, get_recursive_memory
+from core.report_store import get_report_store
 from agents import (
     PatentScoutAgent,
     MarketAnalystAgent,
@@ -68,42 +69,36 @@ class Orchestrator:
              session = await self.state_manager.create_session(query)
              session_id = session.session_id
         
-        # Initialize memory for session
-        await self.memory.initialize_session(session_id)
-        
         try:
-            # Phase 1: Parallel research execution
-            await self.state_manager.update_phase(session_id, ResearchPhase.PATENT_SEARCH)
+            # Memory setup and the phase update (which notifies listeners) are
+            # independent, so run them together before the agents start
+            await asyncio.gather(
+                self.memory.initialize_session(session_id),
+                self.state_manager.update_phase(session_id, ResearchPhase.PATENT_SEARCH),
+            )
             
+            # Phase 1: Parallel research execution
             logger.info("Phase 1: Executing research agents...")
             
-            # Run agents SEQUENTIALLY to avoid rate limiting
-            # (Gemini free tier has strict per-minute limits)
-            
-            logger.info("Running Patent Scout...")
-            try:
-                patent_result = await self._run_agent(self.patent_scout, session_id, query)
-            except Exception as e:
-                logger.error(f"Patent Scout failed: {e}")
-                patent_result = {}
-            
-            await asyncio.sleep(1)  # Rate limit buffer
-            
-            logger.info("Running Market Analyst...")
-            try:
-                market_result = await self._run_agent(self.market_analyst, session_id, query)
-            except Exception as e:
-                logger.error(f"Market Analyst failed: {e}")
-                market_result = {}
-            
-            await asyncio.sleep(1)  # Rate limit buffer
+            # The three research agents are data-independent, so run them
+            # concurrently; GeminiEngine bounds the in-flight Gemini calls
+            # (GEMINI_MAX_CONCURRENCY) to stay within per-minute limits
+            research_agents = [
+                ("Patent Scout", self.patent_scout),
+                ("Market Analyst", self.market_analyst),
+                ("Tech Trend", self.tech_trend),
+            ]
+            results = await asyncio.gather(
+                *(self._run_agent(agent, session_id, query) for _, agent in research_agents),
+                return_exceptions=True,
+            )
             
-            logger.info("Running Tech Trend...")
-            try:
-                tech_result = await self._run_agent(self.tech_trend, session_id, query)
-            except Exception as e:
-                logger.error(f"Tech Trend failed: {e}")
-                tech_result = {}
+            for (name, _), result in zip(research_agents, results):
+                if isinstance(result, Exception):
+                    logger.error(f"{name} failed: {result}")
+            patent_result, market_result, tech_result = (
+                {} if isinstance(result, Exception) else result for result in results
+            )
             
             # Phase 2: Verification
             await self.state_manager.update_phase(session_id, ResearchPhase.VERIFICATION)
@@ -133,14 +128,18 @@ class Orchestrator:
                 session_id, query, combined_results
             )
             
-            # Complete session
-            await self.state_manager.update_phase(session_id, ResearchPhase.COMPLETED)
-            
             # Add metadata
             processing_time = (datetime.now() - start_time).total_seconds()
             final_report["session_id"] = session_id
             final_report["processing_time_seconds"] = processing_time
             
+            # Store the report before the phase flips, so a status poll that
+            # sees "completed" can always fetch it
+            await get_report_store().save_report(session_id, final_report)
+            
+            # Complete session
+            await self.state_manager.update_phase(session_id, ResearchPhase.COMPLETED)
+            
             logger.info(f"Research completed in {processing_time:.1f}s")
             
             # Mark session complete
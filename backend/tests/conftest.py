@@ -0,0 +1,42 @@
+"""
+NEXUS-R&D Test Configuration
+Shared fixtures for the backend test suite
+"""
+
+import os
+import sys
+
+# Modules import each other relative to backend/, as main.py does
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Settings require a Gemini key; tests never call the API
+os.environ.setdefault("GEMINI_API_KEY", "test-key")
+os.environ["ENABLE_REDIS"] = "false"
+
+import pytest
+
+from core.models import ResearchQuery
+from core.report_store import get_report_store
+from core.state_manager import get_state_manager
+
+
+@pytest.fixture
+def state_manager():
+    """Fresh StateManager singleton for each test"""
+    get_state_manager.cache_clear()
+    yield get_state_manager()
+    get_state_manager.cache_clear()
+
+
+@pytest.fixture
+def report_store():
+    """Fresh in-process ReportStore singleton for each test"""
+    get_report_store.cache_clear()
+    yield get_report_store()
+    get_report_store.cache_clear()
+
+
+@pytest.fixture
+def query():
+    """A minimal research query"""
+    return ResearchQuery(query="solid-state batteries")
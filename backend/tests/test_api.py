@@ -0,0 +1,95 @@
+"""
+Tests for the status and report endpoints' revalidation paths
+"""
+
+import httpx
+import orjson
+import pytest
+import pytest_asyncio
+
+from core.models import ResearchPhase
+from main import app
+
+
+@pytest_asyncio.fixture
+async def client(state_manager, report_store):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_status_returns_304_until_version_changes(client, state_manager, query):
+    sid = (await state_manager.create_session(query)).session_id
+    
+    response = await client.get(f"/research/{sid}/status")
+    assert response.status_code == 200
+    version = response.json()["version"]
+    
+    unchanged = await client.get(f"/research/{sid}/status", params={"since": version})
+    assert unchanged.status_code == 304
+    assert unchanged.content == b""
+    
+    await state_manager.update_phase(sid, ResearchPhase.PATENT_SEARCH)
+    changed = await client.get(f"/research/{sid}/status", params={"since": version})
+    assert changed.status_code == 200
+    assert changed.json()["version"] == version + 1
+    assert changed.json()["phase"] == "patent_search"
+
+
+@pytest.mark.asyncio
+async def test_status_unknown_session_is_404(client):
+    response = await client.get("/research/missing/status")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_report_in_progress_is_202(client, state_manager, query):
+    sid = (await state_manager.create_session(query)).session_id
+    
+    response = await client.get(f"/research/{sid}/report")
+    
+    assert response.status_code == 202
+    assert response.json()["status"] == "in_progress"
+    assert "etag" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_report_etag_revalidation_and_head(client, report_store):
+    report = {"report_id": "IOR-test", "findings": ["a", "b"]}
+    await report_store.save_report("sid-1", report)
+    
+    response = await client.get("/research/sid-1/report")
+    assert response.status_code == 200
+    assert orjson.loads(response.content) == report
+    etag = response.headers["etag"]
+    assert etag.startswith('"') and etag.endswith('"')
+    
+    revalidated = await client.get("/research/sid-1/report", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == etag
+    assert revalidated.content == b""
+    
+    listed = await client.get("/research/sid-1/report", headers={"If-None-Match": f'"other", {etag}'})
+    assert listed.status_code == 304
+    
+    stale = await client.get("/research/sid-1/report", headers={"If-None-Match": '"other"'})
+    assert stale.status_code == 200
+    
+    head = await client.head("/research/sid-1/report")
+    assert head.status_code == 200
+    assert head.headers["etag"] == etag
+    assert int(head.headers["content-length"]) == len(response.content)
+    assert head.content == b""
+
+
+@pytest.mark.asyncio
+async def test_report_etag_changes_with_content(report_store):
+    await report_store.save_report("sid-1", {"v": 1})
+    first, _ = await report_store.get_report_meta("sid-1")
+    await report_store.save_report("sid-1", {"v": 2})
+    
+    etag, length = await report_store.get_report_meta("sid-1")
+    assert etag != first
+    assert length == len(await report_store.get_report_json("sid-1"))
+    assert await report_store.get_report("sid-1") == {"v": 2}
@@ -0,0 +1,94 @@
+"""
+Tests for the streaming JSON scanner used by GeminiEngine
+"""
+
+import orjson
+
+from core.gemini_engine import _JsonObjectScanner
+
+
+def _feed_in_chunks(text: str, size: int):
+    """Feed text as a growing buffer, returning the scanner and the length at completion"""
+    scanner = _JsonObjectScanner()
+    for end in range(size, len(text) + size, size):
+        buffer = text[:end]
+        if scanner.feed(buffer):
+            return scanner, len(buffer)
+    return scanner, None
+
+
+def test_finds_complete_object():
+    text = '{"a": 1}'
+    scanner = _JsonObjectScanner()
+    assert scanner.feed(text)
+    assert (scanner.start, scanner.end) == (0, len(text))
+
+
+def test_skips_prose_and_code_fence():
+    text = 'Here is the report:\n```json\n{"a": {"b": [1, 2]}}\n```\nDone.'
+    scanner = _JsonObjectScanner()
+    assert scanner.feed(text)
+    assert orjson.loads(text[scanner.start:scanner.end]) == {"a": {"b": [1, 2]}}
+
+
+def test_ignores_braces_and_escaped_quotes_in_strings():
+    obj = {"s": 'a } b { c \\" d', "t": ["}", "{"]}
+    text = orjson.dumps(obj).decode()
+    scanner = _JsonObjectScanner()
+    assert scanner.feed(text)
+    assert orjson.loads(text[scanner.start:scanner.end]) == obj
+
+
+def test_incomplete_object_keeps_scanning():
+    scanner = _JsonObjectScanner()
+    assert not scanner.feed('{"a": {"b": 1}')
+    assert scanner.end == -1
+    assert scanner.feed('{"a": {"b": 1}}')
+    assert scanner.end == len('{"a": {"b": 1}}')
+
+
+def test_stops_at_first_object_when_streamed():
+    text = 'prefix {"x": "}", "y": {"z": [1, {"w": 2}]}} trailing {"other": 1}'
+    first_end = text.index(" trailing")
+    for size in (1, 3, 7, len(text)):
+        scanner, completed_at = _feed_in_chunks(text, size)
+        assert completed_at is not None
+        assert completed_at >= first_end
+        assert scanner.end == first_end
+        assert orjson.loads(text[scanner.start:scanner.end])["y"] == {"z": [1, {"w": 2}]}
+
+
+def test_escape_split_across_chunks():
+    text = '{"s": "quote \\" brace }"}'
+    split = text.index("\\") + 1
+    scanner = _JsonObjectScanner()
+    assert not scanner.feed(text[:split])
+    assert scanner.feed(text)
+    assert scanner.end == len(text)
+
+
+def test_skips_braces_in_prose():
+    text = 'Here is {the} result: {"a": 1}'
+    scanner = _JsonObjectScanner()
+    assert scanner.feed(text)
+    assert orjson.loads(text[scanner.start:scanner.end]) == {"a": 1}
+
+
+def test_top_level_array_is_kept_whole():
+    text = '[{"a":1},{"b":2}]'
+    scanner = _JsonObjectScanner()
+    assert scanner.feed(text)
+    assert (scanner.start, scanner.end) == (0, len(text))
+
+
+def test_skips_bracketed_citations():
+    text = 'As shown in [1] and [see above]: {"a": [1, 2]}'
+    scanner = _JsonObjectScanner()
+    assert scanner.feed(text)
+    assert orjson.loads(text[scanner.start:scanner.end]) == {"a": [1, 2]}
+
+
+def test_no_parseable_value_keeps_scanning():
+    scanner = _JsonObjectScanner()
+    assert not scanner.feed("Sorry, {no JSON} here")
+    assert scanner.end == -1
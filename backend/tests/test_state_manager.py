@@ -0,0 +1,88 @@
+"""
+Tests for StateManager session versioning and summary caching
+"""
+
+import pytest
+
+from core.models import AgentStatus, ResearchPhase
+
+
+@pytest.mark.asyncio
+async def test_mutations_bump_version(state_manager, query):
+    session = await state_manager.create_session(query)
+    sid = session.session_id
+    start = session.version
+    
+    await state_manager.update_phase(sid, ResearchPhase.PATENT_SEARCH)
+    await state_manager.update_agent_status(sid, "patent_scout", AgentStatus.RUNNING, progress=10.0)
+    await state_manager.increment_sources(sid, 3)
+    await state_manager.increment_recursion_depth(sid)
+    
+    assert session.version == start + 4
+
+
+@pytest.mark.asyncio
+async def test_summary_unchanged_since_version_is_none(state_manager, query):
+    sid = (await state_manager.create_session(query)).session_id
+    summary = await state_manager.get_session_summary(sid)
+    
+    assert await state_manager.get_session_summary(sid, since=summary["version"]) is None
+    
+    await state_manager.update_phase(sid, ResearchPhase.MARKET_ANALYSIS)
+    updated = await state_manager.get_session_summary(sid, since=summary["version"])
+    assert updated["version"] == summary["version"] + 1
+    assert updated["phase"] == ResearchPhase.MARKET_ANALYSIS
+
+
+@pytest.mark.asyncio
+async def test_unknown_session_summary_is_empty(state_manager):
+    assert await state_manager.get_session_summary("missing") == {}
+
+
+@pytest.mark.asyncio
+async def test_idle_agents_do_not_share_state(state_manager, query):
+    sid = (await state_manager.create_session(query)).session_id
+    summary = await state_manager.get_session_summary(sid)
+    
+    summary["agents"]["patent_scout"]["status"] = "tampered"
+    assert summary["agents"]["verifier"]["status"] == AgentStatus.IDLE
+
+
+@pytest.mark.asyncio
+async def test_cached_summary_is_returned_as_a_copy(state_manager, query):
+    sid = (await state_manager.create_session(query)).session_id
+    first = await state_manager.get_session_summary(sid)
+    first["phase"] = "tampered"
+    first["agents"]["patent_scout"]["status"] = "tampered"
+    
+    second = await state_manager.get_session_summary(sid)
+    assert second is not first
+    assert second["phase"] == ResearchPhase.INITIALIZING
+    assert second["agents"]["patent_scout"]["status"] == AgentStatus.IDLE
+
+
+@pytest.mark.asyncio
+async def test_status_update_invalidates_cached_summary(state_manager, query):
+    sid = (await state_manager.create_session(query)).session_id
+    await state_manager.get_session_summary(sid)
+    
+    await state_manager.update_agent_status(
+        sid, "verifier", AgentStatus.RUNNING, current_task="Checking", progress=40.0, results_count=2
+    )
+    agent = (await state_manager.get_session_summary(sid))["agents"]["verifier"]
+    
+    assert agent == {"status": AgentStatus.RUNNING, "task": "Checking", "progress": 40.0, "results": 2}
+
+
+@pytest.mark.asyncio
+async def test_completed_session_summary_is_not_cached(state_manager, query):
+    sid = (await state_manager.create_session(query)).session_id
+    await state_manager.get_session_summary(sid)
+    assert sid in state_manager._summaries
+    
+    await state_manager.complete_session(sid)
+    summary = await state_manager.get_session_summary(sid)
+    
+    assert summary["phase"] == ResearchPhase.COMPLETED
+    assert summary["completed_at"] is not None
+    assert sid not in state_manager._summaries
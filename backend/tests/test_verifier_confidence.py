@@ -0,0 +1,100 @@
+"""
+Tests for the Verifier's vectorized Bayesian confidence scoring
+"""
+
+import numpy as np
+import pytest
+
+from agents.verifier import VerifierAgent
+from core.models import VerificationSource
+
+
+def _reference_confidence(min_sources, evidence, contradictions, ai_result):
+    """The original per-claim formula the bulk calculation replaced"""
+    prior = 0.5
+    
+    evidence_boost = min(sum(s.authority_score * 0.1 for s in evidence), 0.35)
+    contradiction_penalty = min(len(contradictions) * 0.08, 0.25)
+    
+    source_count = len(evidence)
+    if source_count >= min_sources:
+        source_factor = 0.1
+    elif source_count >= 3:
+        source_factor = 0.05
+    else:
+        source_factor = -0.1
+    
+    ai_factor = 0
+    if ai_result:
+        ai_confidence = ai_result.get("confidence_score", 0.5)
+        if isinstance(ai_confidence, (int, float)):
+            ai_factor = (ai_confidence - 0.5) * 0.2
+    
+    confidence = prior + evidence_boost - contradiction_penalty + source_factor + ai_factor
+    return max(0.0, min(1.0, confidence))
+
+
+def _source(authority: float) -> VerificationSource:
+    return VerificationSource(source_type="news", source_name="test", authority_score=authority)
+
+
+@pytest.fixture(scope="module")
+def verifier():
+    return VerifierAgent()
+
+
+def test_bulk_matches_per_claim_formula(verifier):
+    rng = np.random.default_rng(7)
+    ai_choices = [
+        None,
+        {},
+        {"confidence_score": "high"},
+        {"notes": "no score"},
+        {"confidence_score": 0.0},
+        {"confidence_score": 0.93},
+        {"confidence_score": 1},
+    ]
+    
+    claims = [f"claim {i}" for i in range(200)]
+    evidence = {
+        claim: [_source(float(a)) for a in rng.uniform(0, 1, size=rng.integers(0, 9))]
+        for claim in claims
+    }
+    contradictions = {
+        claim: [_source(0.5)] * int(rng.integers(0, 6))
+        for claim in claims
+    }
+    ai_results = [ai_choices[int(rng.integers(0, len(ai_choices)))] for _ in claims]
+    
+    bulk = verifier._calculate_confidence_bulk(claims, evidence, contradictions, ai_results)
+    expected = [
+        _reference_confidence(verifier.min_sources, evidence[c], contradictions[c], r)
+        for c, r in zip(claims, ai_results)
+    ]
+    
+    assert bulk.tolist() == pytest.approx(expected, abs=1e-12)
+
+
+def test_bulk_handles_missing_and_empty_claims(verifier):
+    claims = ["no evidence", "absent"]
+    evidence = {"no evidence": []}
+    
+    bulk = verifier._calculate_confidence_bulk(claims, evidence, {}, [None, None])
+    
+    assert bulk.tolist() == pytest.approx([0.4, 0.4])
+    assert verifier._calculate_confidence_bulk([], {}, {}, []).size == 0
+
+
+def test_scores_are_clamped(verifier):
+    strong = [_source(1.0)] * 10
+    weak_contradicted = {"weak": [_source(0.0)] * 6}
+    
+    high = verifier._calculate_confidence_bulk(
+        ["strong"], {"strong": strong}, {}, [{"confidence_score": 100}]
+    )
+    low = verifier._calculate_confidence_bulk(
+        ["weak"], {}, weak_contradicted, [{"confidence_score": -100}]
+    )
+    
+    assert high.tolist() == [1.0]
+    assert low.tolist() == [0.0]
@@ -45,6 +45,7 @@ interface AgentStatus {
 
 interface SessionStatus {
   session_id: string;
+  version: number;
   phase: string;
   started_at: string;
   agents: Record<string, AgentStatus>;
@@ -204,6 +205,7 @@ export default function ResearchDashboard({
   useEffect(() => {
     let statusInterval: NodeJS.Timeout;
     let ws: WebSocket | null = null;
+    let lastVersion = -1;
 
     const connectWebSocket = () => {
       try {
@@ -245,12 +247,16 @@ export default function ResearchDashboard({
         console.log(`[DEBUG] Polling status for session: ${sessionId}`);
         console.log(`[DEBUG] Fetching: ${API_BASE}/research/${sessionId}/status`);
         
-        const response = await fetch(`${API_BASE}/research/${sessionId}/status`);
+        const response = await fetch(`${API_BASE}/research/${sessionId}/status?since=${lastVersion}`);
         console.log(`[DEBUG] Response status: ${response.status}`);
         
+        // Session unchanged since the last poll
+        if (response.status === 304) return;
+        
         if (response.ok) {
           const data = await response.json();
           console.log('[DEBUG] Status data received:', data);
+          lastVersion = data.version;
           setStatus(data);
 
           // Check if research is complete